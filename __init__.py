@@ -65,6 +65,9 @@ sollumz_debug.init_debug()  # first in case we need to debug initialization code
 
 
 def register():
+    import time
+    start_time = time.perf_counter()
+
     check_blender_version()
     check_single_sollumz_instance()
 
@@ -93,6 +96,8 @@ def register():
         from . import sollumz_tool
         sollumz_tool.register_tools()
 
+    sollumz_debug.report_startup_time(time.perf_counter() - start_time, auto_load.register_stats)
+
 
 def unregister():
     if dependencies.has_required_dependencies():
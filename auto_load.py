@@ -1,5 +1,9 @@
 import bpy
+import os
+import json
+import time
 import typing
+import hashlib
 import inspect
 import pkgutil
 import importlib
@@ -10,15 +14,28 @@ __all__ = (
     "unregister",
 )
 
+MANIFEST_FILE_NAME = "auto_load_manifest.json"
+MANIFEST_FORMAT_VERSION = 1
+
 modules = None
 ordered_classes = None
+# Timings of the last `register` call, in seconds, and whether the registration manifest was used
+register_stats = {}
 
 
 def register():
     global modules, ordered_classes
-    modules = get_all_submodules(Path(__file__).parent, __package__)
-    ordered_classes = get_ordered_classes_to_register(modules)
-
+    start_time = time.perf_counter()
+    root_path = Path(__file__).parent
+    manifest_key = get_manifest_key(root_path)
+    manifest = load_manifest(manifest_key)
+    used_manifest = manifest is not None and load_from_manifest(manifest)
+    if not used_manifest:
+        modules = get_all_submodules(root_path, __package__)
+        ordered_classes = get_ordered_classes_to_register(modules)
+        save_manifest(manifest_key, modules, ordered_classes)
+
+    load_time = time.perf_counter()
     for cls in ordered_classes:
         bpy.utils.register_class(cls)
 
@@ -28,6 +45,15 @@ def register():
         if hasattr(module, "register"):
             module.register()
 
+    end_time = time.perf_counter()
+    register_stats.update(
+        used_manifest=used_manifest,
+        load_time=load_time - start_time,
+        register_time=end_time - load_time,
+        num_modules=len(modules),
+        num_classes=len(ordered_classes),
+    )
+
 
 def unregister():
     called = set()
@@ -72,6 +98,101 @@ def iter_submodule_names(path, root=""):
             yield from iter_submodule_names(sub_path, sub_root)
 
 
+# Registration manifest
+#################################################
+# Caches the modules and classes to register, in order, so the next startups only need to import the modules that have
+# something to register and can skip finding the classes and sorting them. Import/export modules without classes are
+# not imported until first used. The manifest is invalidated when the add-on version, the Blender version, the dev mode
+# (which defines additional classes) or any source file changes.
+
+def get_manifest_path():
+    from .known_paths import config_directory_path
+    return Path(config_directory_path()) / MANIFEST_FILE_NAME
+
+
+def get_manifest_key(root_path):
+    from .meta import sollumz_manifest_version, DEV_MODE
+
+    sources_hash = hashlib.sha1()
+    for dir_path, dir_names, file_names in os.walk(root_path):
+        dir_names[:] = sorted(d for d in dir_names if d not in {"tests", "__pycache__", ".git"})
+        for file_name in sorted(file_names):
+            if file_name.endswith(".py"):
+                file_path = os.path.join(dir_path, file_name)
+                rel_path = os.path.relpath(file_path, root_path)
+                stat = os.stat(file_path)
+                sources_hash.update(f"{rel_path}:{stat.st_mtime_ns}:{stat.st_size};".encode())
+
+    return {
+        "format": MANIFEST_FORMAT_VERSION,
+        "package": __package__,
+        "addon_version": sollumz_manifest_version(),
+        "blender_version": list(bpy.app.version),
+        "dev_mode": DEV_MODE,
+        "sources": sources_hash.hexdigest(),
+    }
+
+
+def load_manifest(key):
+    try:
+        with open(get_manifest_path(), "r") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(manifest, dict) or manifest.get("key", None) != key:
+        return None
+
+    return manifest
+
+
+def save_manifest(key, modules, ordered_classes):
+    register_module_names = {cls.__module__ for cls in ordered_classes}
+    register_module_names.update(
+        module.__name__ for module in modules
+        if hasattr(module, "register") or hasattr(module, "unregister")
+    )
+    manifest = {
+        "key": key,
+        "modules": [module.__name__ for module in modules if module.__name__ in register_module_names],
+        "classes": [f"{cls.__module__}:{cls.__qualname__}" for cls in ordered_classes],
+    }
+    try:
+        manifest_path = get_manifest_path()
+        tmp_manifest_path = manifest_path.with_name(manifest_path.name + ".tmp")
+        with open(tmp_manifest_path, "w") as f:
+            json.dump(manifest, f, indent=1)
+        os.replace(tmp_manifest_path, manifest_path)
+    except OSError as e:
+        print(f"Failed to save registration manifest: {e}")
+
+
+def load_from_manifest(manifest):
+    """Imports the modules and gets the classes listed in the manifest. Returns ``False`` if the manifest doesn't match
+    the loaded code, including when the listed modules define classes to register missing from the manifest, in which
+    case the caller should fall back to finding the classes.
+    """
+    global modules, ordered_classes
+    try:
+        manifest_modules = [importlib.import_module(name) for name in manifest["modules"]]
+        manifest_classes = []
+        for class_path in manifest["classes"]:
+            module_name, qualname = class_path.split(":")
+            cls = importlib.import_module(module_name)
+            for name in qualname.split("."):
+                cls = getattr(cls, name)
+            manifest_classes.append(cls)
+    except (ImportError, AttributeError, KeyError, ValueError):
+        return False
+
+    if not set(iter_my_classes(manifest_modules)).issubset(manifest_classes):
+        return False
+
+    modules = manifest_modules
+    ordered_classes = manifest_classes
+    return True
+
+
 # Find classes to register
 #################################################
 
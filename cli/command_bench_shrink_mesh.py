@@ -0,0 +1,99 @@
+CMD_ID = "sz_bench_shrink_mesh"
+
+DEFAULT_FACE_COUNTS = [100, 500, 1000, 2500, 5000, 10000, 20000]
+
+
+def _create_hull(num_faces: int, seed: int):
+    """Create a convex hull with approximately ``num_faces`` triangles from random points on a sphere. Returns the
+    vertices and faces arrays."""
+    import bmesh
+    import numpy as np
+
+    # A convex hull of N points on a sphere has 2N - 4 triangles
+    num_points = max(4, (num_faces + 4) // 2)
+    rng = np.random.default_rng(seed)
+    points = rng.normal(size=(num_points, 3))
+    points /= np.linalg.norm(points, axis=1, keepdims=True)
+    points *= rng.uniform(0.5, 5.0, size=3)  # squash into an ellipsoid so the hull is not too regular
+
+    bm = bmesh.new()
+    for p in points:
+        bm.verts.new(p)
+    bmesh.ops.convex_hull(bm, input=bm.verts, use_existing_faces=False)
+    bmesh.ops.delete(bm, geom=[v for v in bm.verts if not v.link_faces], context="VERTS")
+    bmesh.ops.triangulate(bm, faces=bm.faces)
+    bm.verts.index_update()
+
+    vertices = np.array([v.co for v in bm.verts], dtype=np.float64)
+    faces = np.array([[v.index for v in f.verts] for f in bm.faces], dtype=np.int64)
+    bm.free()
+    return vertices, faces
+
+
+def main(argv: list[str]) -> int:
+    import sys
+    import os
+    import time
+    from argparse import ArgumentParser
+    from ..shared.geometry import shrink_mesh
+
+    parser = ArgumentParser(
+        prog=os.path.basename(sys.argv[0]) + " --command " + CMD_ID,
+        description="Measure collision shrunk mesh and margin calculation performance on convex hulls.",
+    )
+    parser.add_argument(
+        "-f",
+        "--faces",
+        type=int,
+        nargs="+",
+        default=DEFAULT_FACE_COUNTS,
+        help="Approximate number of faces of each convex hull.",
+        required=False,
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=3,
+        help="Number of iterations per convex hull.",
+        required=False,
+    )
+    parser.add_argument(
+        "-s",
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed used to generate the convex hulls.",
+        required=False,
+    )
+    args = parser.parse_args(argv)
+
+    col = 12
+    header = f"{'Faces':>{col}} {'Verts':>{col}} {'Margin':>{col}} {'Avg':>{col}} {'Min':>{col}} {'Max':>{col}}"
+    print(header)
+    print("-" * len(header))
+
+    for num_faces in args.faces:
+        vertices, faces = _create_hull(num_faces, args.seed)
+
+        times = []
+        margin = 0.0
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            _, margin = shrink_mesh(vertices, faces)
+            t1 = time.perf_counter()
+            times.append(t1 - t0)
+
+        print(
+            f"{len(faces):>{col}} "
+            f"{len(vertices):>{col}} "
+            f"{margin:>{col}.6f} "
+            f"{sum(times) / len(times):>{col}.6f} "
+            f"{min(times):>{col}.6f} "
+            f"{max(times):>{col}.6f}"
+        )
+
+    return 0
+
+
+CMD = (CMD_ID, main)
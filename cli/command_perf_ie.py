@@ -75,14 +75,16 @@ def _do_import_export(file: Path) -> tuple[float, float]:
     import bpy
     import time
     import tempfile
+    from .. import profiling
 
     bpy.ops.wm.read_homefile()
 
     t0 = time.perf_counter()
-    bpy.ops.sollumz.import_assets(
-        directory=str(file.parent.absolute()),
-        files=[{"name": file.name}],
-    )
+    with profiling.span("import"):
+        bpy.ops.sollumz.import_assets(
+            directory=str(file.parent.absolute()),
+            files=[{"name": file.name}],
+        )
     t1 = time.perf_counter()
     time_import = t1 - t0
 
@@ -102,9 +104,10 @@ def _do_import_export(file: Path) -> tuple[float, float]:
 
     with tempfile.TemporaryDirectory() as tmpdir:
         t0 = time.perf_counter()
-        export_op(
-            directory=str(tmpdir),
-        )
+        with profiling.span("export"):
+            export_op(
+                directory=str(tmpdir),
+            )
         t1 = time.perf_counter()
 
     time_export = t1 - t0
@@ -117,6 +120,8 @@ def main(argv: list[str]) -> int:
     import os
     import statistics
     from argparse import ArgumentParser
+    from contextlib import nullcontext
+    from .. import profiling
 
     parser = ArgumentParser(
         prog=os.path.basename(sys.argv[0]) + " --command " + CMD_ID,
@@ -151,6 +156,16 @@ def main(argv: list[str]) -> int:
         help="Number of warm-up iterations per file (not included in stats).",
         required=False,
     )
+    parser.add_argument(
+        "-t",
+        "--trace",
+        type=Path,
+        help=(
+            "Profile the import/export stages of the measured iterations. Prints a report per file and saves a Chrome "
+            "trace-event file per file to this directory."
+        ),
+        required=False,
+    )
     args = parser.parse_args(argv)
 
     stats = {}
@@ -161,10 +176,16 @@ def main(argv: list[str]) -> int:
         for _ in range(args.warmup):
             _do_import_export(file)
 
-        for _ in range(args.repeat):
-            timport, texport = _do_import_export(file)
-            import_times.append(timport)
-            export_times.append(texport)
+        if args.trace:
+            profile = profiling.profiling_session(file.name, args.trace / f"{file.name}.trace.json")
+        else:
+            profile = nullcontext()
+
+        with profile:
+            for _ in range(args.repeat):
+                timport, texport = _do_import_export(file)
+                import_times.append(timport)
+                export_times.append(texport)
 
         stats[file] = {
             "import_avg": sum(import_times) / len(import_times),
@@ -1,7 +1,8 @@
 """Operators to isolate specific color channels of a color attribute."""
 
 import re
-from typing import NamedTuple
+from collections.abc import Callable, Iterable
+from typing import NamedTuple, Optional
 
 import numpy as np
 from bpy.props import (
@@ -10,13 +11,15 @@ from bpy.props import (
 )
 from bpy.types import (
     Context,
+    Mesh,
     Operator,
 )
 
-from .utils import Channel, attr_domain_size
+from .utils import Channel, attr_domain_size, selected_meshes
 
 ISOLATED_ATTR_FORMAT = ".isolated_{}{}{}{}.{}"
 ISOLATED_ATTR_REGEX = re.compile(r"\.isolated_(?P<R>R?)(?P<G>G?)(?P<B>B?)(?P<A>A?)\.(?P<attr>.*)")
+SELECTED_OBJECTS_HINT = ".\nShift+click to isolate it on all selected objects"
 
 
 class IsolateState(NamedTuple):
@@ -28,8 +31,7 @@ class IsolateState(NamedTuple):
     """Currently isolated channels from `base_attr_name`, stored in `active_attr_name`."""
 
 
-def isolate_get_state(context: Context) -> IsolateState:
-    mesh = context.active_object.data
+def isolate_get_mesh_state(mesh: Mesh) -> IsolateState:
     active_attr_name = mesh.attributes.active_color_name
     if m := ISOLATED_ATTR_REGEX.match(active_attr_name):
         base_attr_name = m.group("attr")
@@ -49,34 +51,49 @@ def isolate_get_state(context: Context) -> IsolateState:
     return IsolateState(active_attr_name, base_attr_name, channels)
 
 
-def isolate_toggle_channel(context: Context, ch: Channel, extend: bool):
-    mesh = context.active_object.data
-
-    active_attr_name, base_attr_name, old_isolated_channels = isolate_get_state(context)
-    if extend and (ch != Channel.ALPHA and Channel.ALPHA not in old_isolated_channels):
-        # Select multiple channels (Ctrl+click)
-        new_isolated_channels = {ch} | old_isolated_channels
-    else:
-        # Select single channel
-        new_isolated_channels = {ch}
-
-    if ch in old_isolated_channels:
-        # Deselect channel
-        new_isolated_channels.remove(ch)
-
-    base_attr = mesh.attributes[base_attr_name]
-    base_attr_data = None
-
-    domain_size = attr_domain_size(mesh, base_attr)
-
-    if active_attr_name != base_attr_name and old_isolated_channels:
-        # Update base attribute with the values in the isolated attribute
-        old_isolated_attr = mesh.attributes[active_attr_name]
-        old_isolated_attr_data = np.empty((domain_size, 4), dtype=np.float32)
-        old_isolated_attr.data.foreach_get("color_srgb", old_isolated_attr_data.ravel())
-
-        base_attr_data = np.empty((domain_size, 4), dtype=np.float32)
-        base_attr.data.foreach_get("color_srgb", base_attr_data.ravel())
+def isolate_get_state(context: Context) -> IsolateState:
+    return isolate_get_mesh_state(context.active_object.data)
+
+
+def _get_attrs_data(meshes: list[Mesh], attr_names: list[str]) -> tuple[np.ndarray, list[int]]:
+    """Gets the colors of an attribute of each mesh concatenated, and where the colors of each mesh start."""
+    starts = [0]
+    for mesh, attr_name in zip(meshes, attr_names):
+        starts.append(starts[-1] + attr_domain_size(mesh, mesh.attributes[attr_name]))
+
+    data = np.empty((starts[-1], 4), dtype=np.float32)
+    for mesh, attr_name, start, end in zip(meshes, attr_names, starts, starts[1:]):
+        mesh.attributes[attr_name].data.foreach_get("color_srgb", data[start:end].ravel())
+    return data, starts
+
+
+def isolate_set_channels(
+    meshes: Iterable[Mesh],
+    new_isolated_channels: set[Channel],
+    progress: Optional[Callable[[int], None]] = None,
+) -> int:
+    """Isolates ``new_isolated_channels`` of the active color attribute of each mesh. Channels previously isolated are
+    first written back to their base attribute. Meshes are grouped by their previously isolated channels and each
+    group is processed in a single pass over the concatenated attribute data.
+
+    ``progress`` is called with the number of meshes processed so far. Returns the number of meshes modified.
+    """
+    states = [
+        (mesh, state)
+        for mesh in meshes
+        if (state := isolate_get_mesh_state(mesh)).base_attr_name in mesh.attributes
+    ]
+
+    # Update base attributes with the values in the isolated attributes
+    restore_groups: dict[frozenset[Channel], list[tuple[Mesh, IsolateState]]] = {}
+    for mesh, state in states:
+        if state.active_attr_name != state.base_attr_name and state.channels:
+            restore_groups.setdefault(frozenset(state.channels), []).append((mesh, state))
+
+    for old_isolated_channels, group in restore_groups.items():
+        group_meshes = [mesh for mesh, _ in group]
+        old_isolated_attr_data, starts = _get_attrs_data(group_meshes, [state.active_attr_name for _, state in group])
+        base_attr_data, _ = _get_attrs_data(group_meshes, [state.base_attr_name for _, state in group])
 
         if Channel.RED in old_isolated_channels:
             base_attr_data[:, 0] = old_isolated_attr_data[:, 0]
@@ -89,43 +106,41 @@ def isolate_toggle_channel(context: Context, ch: Channel, extend: bool):
             # Alpha channel should be in grayscale so RGB channels should have the same values, so just consider R
             base_attr_data[:, 3] = old_isolated_attr_data[:, 0]
 
-        base_attr.data.foreach_set("color_srgb", base_attr_data.ravel())
-
-        mesh.attributes.remove(old_isolated_attr)
-
-        # Lookup again to avoid dangling reference after removing the other attribute
-        base_attr = mesh.attributes[base_attr_name]
+        for (mesh, state), start, end in zip(group, starts, starts[1:]):
+            mesh.attributes[state.base_attr_name].data.foreach_set("color_srgb", base_attr_data[start:end].ravel())
+            mesh.attributes.remove(mesh.attributes[state.active_attr_name])
 
     if not new_isolated_channels:
-        # Nothing selected, go back to the base attribute
-        mesh.attributes.active_color_name = base_attr_name
-        return
-
-    # Create a new isolated attribute and fill it with the values of the base attribute
-    isolated_attr_name = ISOLATED_ATTR_FORMAT.format(
-        "R" if Channel.RED in new_isolated_channels else "",
-        "G" if Channel.GREEN in new_isolated_channels else "",
-        "B" if Channel.BLUE in new_isolated_channels else "",
-        "A" if Channel.ALPHA in new_isolated_channels else "",
-        base_attr_name,
-    )
-
-    if existing_attr := mesh.attributes.get(isolated_attr_name, None):
-        # Remove any leftover attribute (e.g. user manually changed the active attribute)
-        mesh.attributes.remove(existing_attr)
+        # Nothing selected, go back to the base attributes
+        for num_processed, (mesh, state) in enumerate(states, start=1):
+            mesh.attributes.active_color_name = state.base_attr_name
+            if progress is not None:
+                progress(num_processed)
+        return len(states)
+
+    # Create new isolated attributes and fill them with the values of the base attributes
+    isolated_attr_names = []
+    for mesh, state in states:
+        isolated_attr_name = ISOLATED_ATTR_FORMAT.format(
+            "R" if Channel.RED in new_isolated_channels else "",
+            "G" if Channel.GREEN in new_isolated_channels else "",
+            "B" if Channel.BLUE in new_isolated_channels else "",
+            "A" if Channel.ALPHA in new_isolated_channels else "",
+            state.base_attr_name,
+        )
+        isolated_attr_names.append(isolated_attr_name)
+
+        if existing_attr := mesh.attributes.get(isolated_attr_name, None):
+            # Remove any leftover attribute (e.g. user manually changed the active attribute)
+            mesh.attributes.remove(existing_attr)
 
         # Lookup again to avoid dangling reference after removing the other attribute
-        base_attr = mesh.attributes[base_attr_name]
-
-    isolated_attr = mesh.attributes.new(isolated_attr_name, base_attr.data_type, base_attr.domain)
-    isolated_attr_data = np.zeros((domain_size, 4), dtype=np.float32)
+        base_attr = mesh.attributes[state.base_attr_name]
+        mesh.attributes.new(isolated_attr_name, base_attr.data_type, base_attr.domain)
 
-    if base_attr_data is None:
-        # Lookup again to avoid dangling reference after adding the new attribute
-        base_attr = mesh.attributes[base_attr_name]
-
-        base_attr_data = np.empty((domain_size, 4), dtype=np.float32)
-        base_attr.data.foreach_get("color_srgb", base_attr_data.ravel())
+    state_meshes = [mesh for mesh, _ in states]
+    base_attr_data, starts = _get_attrs_data(state_meshes, [state.base_attr_name for _, state in states])
+    isolated_attr_data = np.zeros_like(base_attr_data)
 
     if Channel.RED in new_isolated_channels:
         isolated_attr_data[:, 0] = base_attr_data[:, 0]
@@ -138,9 +153,43 @@ def isolate_toggle_channel(context: Context, ch: Channel, extend: bool):
         # Fill RGB channels with alpha values to visualize it as grayscale
         isolated_attr_data[:, :3] = base_attr_data[:, 3:4]
 
-    isolated_attr.data.foreach_set("color_srgb", isolated_attr_data.ravel())
+    for num_processed, (mesh, isolated_attr_name, start, end) in enumerate(
+        zip(state_meshes, isolated_attr_names, starts, starts[1:]), start=1
+    ):
+        isolated_attr = mesh.attributes[isolated_attr_name]
+        isolated_attr.data.foreach_set("color_srgb", isolated_attr_data[start:end].ravel())
+        mesh.attributes.active_color = isolated_attr
+        if progress is not None:
+            progress(num_processed)
+
+    return len(states)
+
+
+def isolate_toggle_channel(
+    context: Context,
+    ch: Channel,
+    extend: bool,
+    selected_objects: bool = False,
+    progress: Optional[Callable[[int], None]] = None,
+) -> int:
+    """Toggles the isolation of a channel on the active mesh. With ``selected_objects``, the isolated channels of the
+    active mesh are also applied to all other selected meshes.
+    """
+    old_isolated_channels = isolate_get_state(context).channels
+    if extend and (ch != Channel.ALPHA and Channel.ALPHA not in old_isolated_channels):
+        # Select multiple channels (Ctrl+click)
+        new_isolated_channels = {ch} | old_isolated_channels
+    else:
+        # Select single channel
+        new_isolated_channels = {ch}
+
+    if ch in old_isolated_channels:
+        # Deselect channel
+        new_isolated_channels.remove(ch)
 
-    mesh.attributes.active_color = isolated_attr
+    meshes = selected_meshes(context) if selected_objects else [context.active_object.data]
+    meshes = [mesh for mesh in meshes if mesh.attributes.active_color]
+    return isolate_set_channels(meshes, new_isolated_channels, progress)
 
 
 class SOLLUMZ_OT_vertex_paint_isolate_toggle_channel(Operator):
@@ -151,18 +200,23 @@ class SOLLUMZ_OT_vertex_paint_isolate_toggle_channel(Operator):
 
     channel: IntProperty(name="Channel", min=0, max=3, default=0)
     extend: BoolProperty(name="Extend", default=False)
+    selected_objects: BoolProperty(
+        name="All Selected Objects",
+        description="Isolate the same channels on all selected meshes, not only the active one",
+        default=False,
+    )
 
     @classmethod
     def description(cls, context, properties) -> str:
         match Channel(properties.channel):
             case Channel.RED:
-                return "Isolate the red channel of the active color attribute"
+                return f"Isolate the red channel of the active color attribute{SELECTED_OBJECTS_HINT}"
             case Channel.GREEN:
-                return "Isolate the green channel of the active color attribute"
+                return f"Isolate the green channel of the active color attribute{SELECTED_OBJECTS_HINT}"
             case Channel.BLUE:
-                return "Isolate the blue channel of the active color attribute"
+                return f"Isolate the blue channel of the active color attribute{SELECTED_OBJECTS_HINT}"
             case Channel.ALPHA:
-                return "Isolate the alpha channel of the active color attribute"
+                return f"Isolate the alpha channel of the active color attribute{SELECTED_OBJECTS_HINT}"
 
         return cls.bl_description
 
@@ -172,9 +226,17 @@ class SOLLUMZ_OT_vertex_paint_isolate_toggle_channel(Operator):
         return aobj and aobj.mode == "VERTEX_PAINT" and aobj.type == "MESH" and aobj.data.attributes.active_color
 
     def execute(self, context):
-        isolate_toggle_channel(context, Channel(self.channel), self.extend)
+        wm = context.window_manager
+        wm.progress_begin(0, len(context.selected_objects) + 1 if self.selected_objects else 1)
+        try:
+            isolate_toggle_channel(
+                context, Channel(self.channel), self.extend, self.selected_objects, progress=wm.progress_update
+            )
+        finally:
+            wm.progress_end()
         return {"FINISHED"}
 
     def invoke(self, context, event):
         self.extend = event.ctrl
+        self.selected_objects = event.shift
         return self.execute(context)
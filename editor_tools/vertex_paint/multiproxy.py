@@ -7,14 +7,108 @@ import numpy as np
 from bpy.props import (
     CollectionProperty,
     EnumProperty,
+    IntProperty,
     PointerProperty,
 )
 from bpy.types import (
+    Mesh,
     Object,
     Operator,
     PropertyGroup,
 )
 
+from ...tools.meshhelper import create_mesh_from_arrays
+
+
+def build_multiproxy_mesh(
+    objs: list[Object],
+    attr_data_types: dict[str, set[str]],
+    attr_domains: dict[str, set[str]],
+) -> tuple[Mesh, list[tuple[int, int, int, int]]]:
+    """Builds a single mesh with the geometry, in world space, and the color attributes and UV maps of all the objects,
+    without copying and joining the objects. Color attributes with different data types on different objects are stored
+    as ``FLOAT_COLOR``. UV maps are matched by name, objects without a UV map get zeros in it.
+
+    Returns the mesh and, for each object, the ``(vertex_start, vertex_count, loop_start, loop_count)`` range of its
+    data in the mesh.
+    """
+    meshes = [obj.data for obj in objs]
+    num_vertices = np.array([len(m.vertices) for m in meshes], dtype=np.int64)
+    num_loops = np.array([len(m.loops) for m in meshes], dtype=np.int64)
+    num_faces = np.array([len(m.polygons) for m in meshes], dtype=np.int64)
+    vertex_starts = np.concatenate(([0], np.cumsum(num_vertices)[:-1]))
+    loop_starts = np.concatenate(([0], np.cumsum(num_loops)[:-1]))
+    face_starts = np.concatenate(([0], np.cumsum(num_faces)[:-1]))
+
+    vertices = np.empty((num_vertices.sum(), 3), dtype=np.float32)
+    loop_vertex_indices = np.empty(num_loops.sum(), dtype=np.int32)
+    face_loop_starts = np.empty(num_faces.sum(), dtype=np.int32)
+    face_material_indices = np.empty(num_faces.sum(), dtype=np.int32)
+    materials = {}
+    for obj, mesh, vertex_start, loop_start, face_start in zip(objs, meshes, vertex_starts, loop_starts, face_starts):
+        obj_vertices = vertices[vertex_start:vertex_start + len(mesh.vertices)]
+        obj_loop_vertex_indices = loop_vertex_indices[loop_start:loop_start + len(mesh.loops)]
+        obj_face_loop_starts = face_loop_starts[face_start:face_start + len(mesh.polygons)]
+        obj_face_material_indices = face_material_indices[face_start:face_start + len(mesh.polygons)]
+
+        mesh.vertices.foreach_get("co", obj_vertices.ravel())
+        mesh.loops.foreach_get("vertex_index", obj_loop_vertex_indices)
+        mesh.polygons.foreach_get("loop_start", obj_face_loop_starts)
+        mesh.polygons.foreach_get("material_index", obj_face_material_indices)
+
+        matrix = np.array(obj.matrix_world, dtype=np.float32)
+        obj_vertices[:] = obj_vertices @ matrix[:3, :3].T + matrix[:3, 3]
+        obj_loop_vertex_indices += vertex_start
+        obj_face_loop_starts += loop_start
+
+        # Remap material indices to the material slots of the proxy mesh, which are shared by all objects
+        obj_materials = [slot.material for slot in obj.material_slots] or [None]
+        material_remap = np.array([materials.setdefault(m, len(materials)) for m in obj_materials], dtype=np.int32)
+        obj_face_material_indices[:] = material_remap[np.clip(obj_face_material_indices, 0, len(material_remap) - 1)]
+
+    proxy_mesh = bpy.data.meshes.new(".multiproxy")
+    create_mesh_from_arrays(proxy_mesh, vertices, loop_vertex_indices, face_loop_starts, face_material_indices)
+    for material in materials.keys():
+        proxy_mesh.materials.append(material)
+
+    for attr_name, domains in attr_domains.items():
+        domain = next(iter(domains))
+        data_types = attr_data_types[attr_name]
+        data_type = next(iter(data_types)) if len(data_types) == 1 else "FLOAT_COLOR"
+        if domain == "POINT":
+            starts, counts = vertex_starts, num_vertices
+        else:
+            starts, counts = loop_starts, num_loops
+
+        proxy_color_data = np.zeros((counts.sum(), 4), dtype=np.float32)
+        for mesh, start, count in zip(meshes, starts, counts):
+            attr = mesh.color_attributes.get(attr_name, None)
+            if attr is not None:
+                attr.data.foreach_get("color_srgb", proxy_color_data[start:start + count].ravel())
+
+        proxy_color_attr = proxy_mesh.color_attributes.new(attr_name, data_type, domain)
+        proxy_color_attr.data.foreach_set("color_srgb", proxy_color_data.ravel())
+
+    # UV maps are only needed for textured viewport shading while painting, they are not transferred back on exit
+    uv_map_names = dict.fromkeys(uv_map.name for mesh in meshes for uv_map in mesh.uv_layers)
+    for uv_map_name in uv_map_names:
+        proxy_uv_data = np.zeros((num_loops.sum(), 2), dtype=np.float32)
+        for mesh, start, count in zip(meshes, loop_starts, num_loops):
+            uv_map = mesh.uv_layers.get(uv_map_name, None)
+            if uv_map is not None:
+                uv_map.uv.foreach_get("vector", proxy_uv_data[start:start + count].ravel())
+
+        proxy_uv_map = proxy_mesh.uv_layers.new(name=uv_map_name, do_init=False)
+        proxy_uv_map.uv.foreach_set("vector", proxy_uv_data.ravel())
+
+    proxy_ranges = [
+        (int(vertex_start), int(vertex_count), int(loop_start), int(loop_count))
+        for vertex_start, vertex_count, loop_start, loop_count in zip(
+            vertex_starts, num_vertices, loop_starts, num_loops
+        )
+    ]
+    return proxy_mesh, proxy_ranges
+
 
 class SOLLUMZ_OT_vertex_paint_multiproxy(Operator):
     bl_idname = "sollumz.vertex_paint_multiproxy"
@@ -55,57 +149,23 @@ class SOLLUMZ_OT_vertex_paint_multiproxy(Operator):
             )
             return {"CANCELLED"}
 
-        attr_need_to_convert_data_type = {name: len(data_types) > 1 for name, data_types in attr_data_types.items()}
-        any_attr_need_to_convert_data_type = any(attr_need_to_convert_data_type.values())
-
         bpy.ops.object.mode_set(mode="OBJECT")
         bpy.ops.object.select_all(action="DESELECT")
 
-        objs_copy = [obj.copy() for obj in objs]
-        for i, obj_copy in enumerate(objs_copy):
-            obj_copy.data = obj_copy.data.copy()
-
-            if any_attr_need_to_convert_data_type:
-                # We have some attribute with the same name using both BYTE_COLOR and FLOAT_COLOR on different objects.
-                # Need to convert BYTE_COLOR attributes to FLOAT_COLOR, so they all have the same data type and
-                # bpy.ops.object.join won't split them in multiple attributes
-                for attr_name in list(a.name for a in obj_copy.data.color_attributes):
-                    if not attr_need_to_convert_data_type[attr_name]:
-                        continue
-
-                    attr_copy = obj_copy.data.color_attributes[attr_name]
-                    if attr_copy.data_type == "FLOAT_COLOR":
-                        continue
-
-                    attr_copy_data = np.empty((len(attr_copy.data), 4), dtype=np.float32)
-                    attr_copy.data.foreach_get("color_srgb", attr_copy_data.ravel())
-
-                    attr_copy_domain = attr_copy.domain
-                    obj_copy.data.color_attributes.remove(attr_copy)
-                    attr_copy = obj_copy.data.color_attributes.new(attr_name, "FLOAT_COLOR", attr_copy_domain)
-                    attr_copy.data.foreach_set("color_srgb", attr_copy_data.ravel())
-
-            # This attribute indicates to which object each vertex belongs to
-            ref_attr = obj_copy.data.attributes.new(".multiproxy.object_ref", "INT", "POINT")
-            ref_attr_init_data = np.full(len(ref_attr.data), i)
-            ref_attr.data.foreach_set("value", ref_attr_init_data)
-
-            context.collection.objects.link(obj_copy)
-            obj_copy.select_set(True)
-
-        context.view_layer.objects.active = objs_copy[0]
-
-        bpy.ops.object.join()
-        merged_obj = context.active_object
-        merged_obj.name = ".multiproxy"
-        merged_obj.data.name = ".multiproxy"
+        proxy_mesh, proxy_ranges = build_multiproxy_mesh(objs, attr_data_types, attr_domains)
+        merged_obj = bpy.data.objects.new(".multiproxy", proxy_mesh)
+        context.collection.objects.link(merged_obj)
         merged_obj.data.attributes.active_color_name = aobj.data.attributes.active_color_name
+        if (active_uv_map := aobj.data.uv_layers.active) is not None:
+            merged_obj.data.uv_layers.active = merged_obj.data.uv_layers[active_uv_map.name]
         proxy_state = merged_obj.sz_multiproxy_state
         proxy_state.objects.clear()
 
-        for obj in objs:
+        for obj, proxy_range in zip(objs, proxy_ranges):
             obj.hide_set(True)
-            proxy_state.objects.add().ref = obj
+            obj_ref = proxy_state.objects.add()
+            obj_ref.ref = obj
+            obj_ref.vertex_start, obj_ref.vertex_count, obj_ref.loop_start, obj_ref.loop_count = proxy_range
 
         context.view_layer.objects.active = merged_obj
         merged_obj.select_set(True)
@@ -160,14 +220,6 @@ class SOLLUMZ_OT_vertex_paint_multiproxy_exit(Operator):
             bpy.ops.object.mode_set(mode="OBJECT")
             bpy.ops.object.select_all(action="DESELECT")
 
-        vertex_to_object_index_map = np.empty(len(proxy_mesh.vertices), dtype=np.int32)
-        vertex_to_object_index_attr = proxy_mesh.attributes[".multiproxy.object_ref"]
-        vertex_to_object_index_attr.data.foreach_get("value", vertex_to_object_index_map)
-
-        loop_vertex_index = np.empty(len(proxy_mesh.loops), dtype=np.int32)
-        proxy_mesh.loops.foreach_get("vertex_index", loop_vertex_index)
-        loop_to_object_index_map = vertex_to_object_index_map[loop_vertex_index]
-
         proxy_color_data_per_attr = {}
         for proxy_color_attr in proxy_mesh.color_attributes:
             proxy_color_data = np.empty((len(proxy_color_attr.data), 4), dtype=np.float32)
@@ -175,14 +227,14 @@ class SOLLUMZ_OT_vertex_paint_multiproxy_exit(Operator):
             proxy_color_data_per_attr[proxy_color_attr.name] = proxy_color_data
 
         objs_orig = [
-            (i, o.ref)
-            for i, o in enumerate(proxy_state.objects)
+            (o, o.ref)
+            for o in proxy_state.objects
             if o.ref is not None  # Skip if original object got deleted
         ]
 
         # Transfer color data from proxy to original objects
         for color_attr_name, proxy_color_data in proxy_color_data_per_attr.items():
-            for obj_idx, obj_orig in objs_orig:
+            for obj_ref, obj_orig in objs_orig:
                 mesh_orig = obj_orig.data
                 color_attr = mesh_orig.color_attributes.get(color_attr_name, None)
                 if color_attr is None:
@@ -203,11 +255,10 @@ class SOLLUMZ_OT_vertex_paint_multiproxy_exit(Operator):
                 if not dry_run:
                     match color_attr.domain:
                         case "CORNER":
-                            loops_belonging_to_this_object_mask = loop_to_object_index_map == obj_idx
-                            color_data_for_this_object = proxy_color_data[loops_belonging_to_this_object_mask]
+                            start, count = obj_ref.loop_start, obj_ref.loop_count
                         case "POINT":
-                            vertices_belonging_to_this_object_mask = vertex_to_object_index_map == obj_idx
-                            color_data_for_this_object = proxy_color_data[vertices_belonging_to_this_object_mask]
+                            start, count = obj_ref.vertex_start, obj_ref.vertex_count
+                    color_data_for_this_object = proxy_color_data[start:start + count]
 
                     assert len(color_data_for_this_object) == len(color_attr.data)
                     color_attr.data.foreach_set("color_srgb", color_data_for_this_object.ravel())
@@ -218,6 +269,8 @@ class SOLLUMZ_OT_vertex_paint_multiproxy_exit(Operator):
                 obj_orig.hide_set(False)
 
             bpy.data.objects.remove(proxy_obj)
+            if proxy_mesh.users == 0:
+                bpy.data.meshes.remove(proxy_mesh)
 
             if objs_orig:
                 # TODO: make the active object the same as what was originally active
@@ -238,6 +291,11 @@ class SOLLUMZ_OT_vertex_paint_multiproxy_exit(Operator):
 
 class MultiproxyObjectRef(PropertyGroup):
     ref: PointerProperty(type=Object)
+    # Range of the object data in the proxy mesh
+    vertex_start: IntProperty()
+    vertex_count: IntProperty()
+    loop_start: IntProperty()
+    loop_count: IntProperty()
 
 
 class MultiproxyState(PropertyGroup):
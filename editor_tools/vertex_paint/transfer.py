@@ -1,15 +1,112 @@
 """Operators to transfer color channels between color attributes."""
 
+from collections.abc import Callable, Iterable
+from typing import Optional
+
 import numpy as np
 from bpy.props import (
+    BoolProperty,
     EnumProperty,
     StringProperty,
 )
 from bpy.types import (
+    Mesh,
     Operator,
 )
 
-from .utils import Channel, ChannelWithNoneEnumItems, attr_domain_size
+from .utils import Channel, ChannelWithNoneEnumItems, attr_domain_size, selected_meshes
+
+
+def _loop_vertex_indices(meshes: list[Mesh]) -> np.ndarray:
+    """Gets the vertex index of each loop of all meshes concatenated, offset to index the concatenated vertices."""
+    loop_vertex_index = np.empty(sum(len(mesh.loops) for mesh in meshes), dtype=np.int32)
+    loop_start = 0
+    vertex_start = 0
+    for mesh in meshes:
+        num_loops = len(mesh.loops)
+        mesh_loop_vertex_index = loop_vertex_index[loop_start:loop_start + num_loops]
+        mesh.loops.foreach_get("vertex_index", mesh_loop_vertex_index)
+        mesh_loop_vertex_index += vertex_start
+        loop_start += num_loops
+        vertex_start += len(mesh.vertices)
+    return loop_vertex_index
+
+
+def _get_attrs_data(meshes: list[Mesh], attr_name: str) -> tuple[np.ndarray, list[int]]:
+    """Gets the colors of the attribute of all meshes concatenated, and where the colors of each mesh start."""
+    sizes = [attr_domain_size(mesh, mesh.color_attributes[attr_name]) for mesh in meshes]
+    starts = [0, *np.cumsum(sizes).tolist()]
+    data = np.empty((starts[-1], 4), dtype=np.float32)
+    for mesh, start, end in zip(meshes, starts, starts[1:]):
+        mesh.color_attributes[attr_name].data.foreach_get("color_srgb", data[start:end].ravel())
+    return data, starts
+
+
+def transfer_channels(
+    meshes: Iterable[Mesh],
+    src_attr_name: str,
+    dst_attr_name: str,
+    channels: list[tuple[Channel, Channel]],
+    progress: Optional[Callable[[int], None]] = None,
+) -> int:
+    """Transfer channels from ``src_attr_name`` to ``dst_attr_name`` on all meshes that have both attributes.
+    ``channels`` are (destination, source) channel pairs. Meshes are grouped by the domains of their attributes and
+    each group is processed in a single pass over the concatenated attribute data.
+
+    ``progress`` is called with the number of meshes processed so far. Returns the number of meshes modified.
+    """
+    groups: dict[tuple[str, str], list[Mesh]] = {}
+    for mesh in meshes:
+        src_attr = mesh.color_attributes.get(src_attr_name, None)
+        dst_attr = mesh.color_attributes.get(dst_attr_name, None)
+        if src_attr is None or dst_attr is None:
+            continue
+
+        groups.setdefault((src_attr.domain, dst_attr.domain), []).append(mesh)
+
+    num_processed = 0
+    for (src_domain, dst_domain), group_meshes in groups.items():
+        src_data, _ = _get_attrs_data(group_meshes, src_attr_name)
+        dst_data, dst_starts = _get_attrs_data(group_meshes, dst_attr_name)
+
+        if src_domain == "POINT" and dst_domain == "CORNER":
+            # Vertex to face corner
+            loop_vertex_index = _loop_vertex_indices(group_meshes)
+
+            # Convert vertex domain to face corner domain
+            src_data = src_data[loop_vertex_index]
+
+        elif src_domain == "CORNER" and dst_domain == "POINT":
+            # Face corner to vertex
+            loop_vertex_index = _loop_vertex_indices(group_meshes)
+
+            # Calculate average of all face corners for each vertex
+            src_avg_data = np.zeros_like(dst_data)
+            np.add.at(src_avg_data, loop_vertex_index, src_data)
+
+            count_vertex_index = np.bincount(loop_vertex_index, minlength=len(dst_data))
+            has_loops = count_vertex_index > 0
+            src_avg_data[has_loops] /= count_vertex_index[has_loops, np.newaxis]
+
+            src_data = src_avg_data
+
+        else:
+            # Same domain (vertex to vertex or face corner to face corner)
+            assert len(src_data) == len(dst_data)
+
+        # Copy channel data
+        for dst_ch, src_ch in channels:
+            dst_data[:, dst_ch.value] = src_data[:, src_ch.value]
+
+        for mesh, start, end in zip(group_meshes, dst_starts, dst_starts[1:]):
+            mesh.color_attributes[dst_attr_name].data.foreach_set("color_srgb", dst_data[start:end].ravel())
+            mesh.update_tag()
+
+            num_processed += 1
+            if progress is not None:
+                progress(num_processed)
+
+    return num_processed
 
 
 class SOLLUMZ_OT_vertex_paint_transfer_channels(Operator):
@@ -32,6 +129,11 @@ class SOLLUMZ_OT_vertex_paint_transfer_channels(Operator):
     src_for_dst_a: EnumProperty(
         items=ChannelWithNoneEnumItems, name="Source Channel for Destination Alpha Channel", default=-1
     )
+    selected_objects: BoolProperty(
+        name="All Selected Objects",
+        description="Transfer the channels on all selected meshes that have both attributes",
+        default=False,
+    )
 
     @classmethod
     def poll(cls, context) -> bool:
@@ -39,47 +141,7 @@ class SOLLUMZ_OT_vertex_paint_transfer_channels(Operator):
         return aobj and aobj.mode == "VERTEX_PAINT" and aobj.type == "MESH"
 
     def execute(self, context):
-        obj = context.active_object
-        mesh = obj.data
-        src_attr = mesh.color_attributes.get(self.src_attribute, None)
-        dst_attr = mesh.color_attributes.get(self.dst_attribute, None)
-
-        if src_attr is None or dst_attr is None:
-            self.report({"INFO"}, "Source and/or destination attributes do not exist.")
-            return {"CANCELLED"}
-
-        src_domain_size = attr_domain_size(mesh, src_attr)
-        dst_domain_size = attr_domain_size(mesh, dst_attr)
-        src_data = np.empty((src_domain_size, 4), dtype=np.float32)
-        dst_data = np.empty((dst_domain_size, 4), dtype=np.float32)
-        src_attr.data.foreach_get("color_srgb", src_data.ravel())
-        dst_attr.data.foreach_get("color_srgb", dst_data.ravel())
-
-        if src_attr.domain == "POINT" and dst_attr.domain == "CORNER":
-            # Vertex to face corner
-            loop_vertex_index = np.empty(len(mesh.loops), dtype=np.int32)
-            mesh.loops.foreach_get("vertex_index", loop_vertex_index)
-
-            # Convert vertex domain to face corner domain
-            src_data = src_data[loop_vertex_index]
-
-        elif src_attr.domain == "CORNER" and dst_attr.domain == "POINT":
-            # Face corner to vertex
-            loop_vertex_index = np.empty(len(mesh.loops), dtype=np.int32)
-            mesh.loops.foreach_get("vertex_index", loop_vertex_index)
-
-            # Calculate average of all face corners for each vertex
-            src_avg_data = np.zeros_like(dst_data)
-            np.add.at(src_avg_data, loop_vertex_index, src_data)
-
-            unique_vertex_index, count_vertex_index = np.unique(loop_vertex_index, return_counts=True)
-            src_avg_data[unique_vertex_index] /= count_vertex_index[:, np.newaxis]
-
-            src_data = src_avg_data
-
-        else:
-            # Same domain (vertex to vertex or face corner to face corner)
-            assert src_domain_size == dst_domain_size
+        meshes = selected_meshes(context) if self.selected_objects else [context.active_object.data]
 
         # Get channels that need to be transferred
         channels = [
@@ -90,11 +152,19 @@ class SOLLUMZ_OT_vertex_paint_transfer_channels(Operator):
             if src_ch != "NONE"
         ]
 
-        # Copy channel data
-        for dst_ch, src_ch in channels:
-            dst_data[:, dst_ch.value] = src_data[:, src_ch.value]
+        wm = context.window_manager
+        wm.progress_begin(0, len(meshes))
+        try:
+            num_processed = transfer_channels(
+                meshes, self.src_attribute, self.dst_attribute, channels, progress=wm.progress_update
+            )
+        finally:
+            wm.progress_end()
 
-        dst_attr.data.foreach_set("color_srgb", dst_data.ravel())
+        if num_processed == 0:
+            self.report({"INFO"}, "Source and/or destination attributes do not exist.")
+            return {"CANCELLED"}
 
-        mesh.update_tag()
+        if self.selected_objects:
+            self.report({"INFO"}, f"Transferred channels on {num_processed} mesh(es).")
         return {"FINISHED"}
@@ -3,6 +3,7 @@
 import bpy
 from bl_ui.space_view3d import VIEW3D_MT_paint_vertex
 from bpy.props import (
+    BoolProperty,
     EnumProperty,
     FloatProperty,
 )
@@ -133,6 +134,7 @@ class SOLLUMZ_PT_vertex_paint_transfer_channels(Panel):
             subrow.label(text="", icon_value=dst_ch.icon)
             subrow.label(text="")
 
+        layout.prop(wm, "sz_ui_vertex_paint_transfer_selected_objects")
         op = layout.operator(SOLLUMZ_OT_vertex_paint_transfer_channels.bl_idname, text="Transfer")
         op.src_attribute = wm.sz_ui_vertex_paint_transfer_src_attr
         op.dst_attribute = wm.sz_ui_vertex_paint_transfer_dst_attr
@@ -140,6 +142,7 @@ class SOLLUMZ_PT_vertex_paint_transfer_channels(Panel):
         op.src_for_dst_g = wm.sz_ui_vertex_paint_transfer_src_for_dst_g
         op.src_for_dst_b = wm.sz_ui_vertex_paint_transfer_src_for_dst_b
         op.src_for_dst_a = wm.sz_ui_vertex_paint_transfer_src_for_dst_a
+        op.selected_objects = wm.sz_ui_vertex_paint_transfer_selected_objects
 
     @classmethod
     def register(cls):
@@ -173,6 +176,11 @@ class SOLLUMZ_PT_vertex_paint_transfer_channels(Panel):
         WindowManager.sz_ui_vertex_paint_transfer_src_for_dst_a = EnumProperty(
             items=ChannelWithNoneEnumItems, name="Source Channel for Destination Alpha Channel", default=3
         )
+        WindowManager.sz_ui_vertex_paint_transfer_selected_objects = BoolProperty(
+            name="All Selected Objects",
+            description="Transfer the channels on all selected meshes that have both attributes",
+            default=False,
+        )
 
     @classmethod
     def unregister(cls):
@@ -182,6 +190,7 @@ class SOLLUMZ_PT_vertex_paint_transfer_channels(Panel):
         del WindowManager.sz_ui_vertex_paint_transfer_src_for_dst_g
         del WindowManager.sz_ui_vertex_paint_transfer_src_for_dst_b
         del WindowManager.sz_ui_vertex_paint_transfer_src_for_dst_a
+        del WindowManager.sz_ui_vertex_paint_transfer_selected_objects
 
 
 class SOLLUMZ_PT_vertex_paint_terrain(Panel):
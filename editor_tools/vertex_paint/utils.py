@@ -3,6 +3,7 @@ from enum import Enum
 import bpy
 from bpy.types import (
     Brush,
+    Mesh,
     UnifiedPaintSettings,
 )
 
@@ -55,6 +56,14 @@ def attr_domain_size(mesh, attr) -> int:
         case _:
             raise AssertionError(f"Unsupported domain '{attr.domain}'")
 
+
+def selected_meshes(context) -> list[Mesh]:
+    """Gets the meshes of the active and selected mesh objects, without duplicates. The active mesh is first."""
+    objs = [context.active_object, *context.selected_objects]
+    meshes = {obj.data.session_uid: obj.data for obj in objs if obj is not None and obj.type == "MESH"}
+    return list(meshes.values())
+
+
 def vertex_paint_unified_settings(context) -> UnifiedPaintSettings:
     ts = context.tool_settings
     if bpy.app.version >= (5, 0, 0):
@@ -8,6 +8,7 @@ from enum import Enum, auto
 from szio.gta5 import Asset, AssetFormat, AssetTarget, save_asset
 from szio.types import DataSource
 
+from . import profiling
 from .ydr.vertex_buffer_builder_domain import VBBuilderDomain
 
 
@@ -77,6 +78,7 @@ class ExportBundle:
     extra_files: tuple[DataSource, ...]
     """Additional files to write to a folder with same name as the asset, generally embedded textures."""
 
+    @profiling.traced("save bundle")
     def save(self, directory: Path):
         """Writes the whole bundle to disk at the specified directory."""
 
@@ -87,9 +89,11 @@ class ExportBundle:
         gen8_directory = directory / "gen8"
         gen9_directory = directory / "gen9"
         main_asset = self.main_asset
-        save_asset(main_asset, directory, self.asset_name, tool_metadata, gen8_directory, gen9_directory)
+        with profiling.span("save_asset"):
+            save_asset(main_asset, directory, self.asset_name, tool_metadata, gen8_directory, gen9_directory)
         for suffix, asset in self.secondary_assets:
-            save_asset(asset, directory, self.asset_name + suffix, tool_metadata, gen8_directory, gen9_directory)
+            with profiling.span("save_asset"):
+                save_asset(asset, directory, self.asset_name + suffix, tool_metadata, gen8_directory, gen9_directory)
 
         do_write_extra_files = self.extra_files and (
             # We only use extra_files for embedded textures, which are only really needed for CWXML. Initially, these
@@ -121,7 +125,7 @@ class ExportBundle:
                         # If src_data is a file and paths are the same, no need to copy (and would break otherwise)
                         continue
 
-                    with src_data.open() as src, dst_file.open("wb") as dst:
+                    with profiling.span("write extra file"), src_data.open() as src, dst_file.open("wb") as dst:
                         shutil.copyfileobj(src, dst)
 
     def is_valid(self) -> bool:
@@ -193,7 +197,8 @@ def import_context_scope(ctx: ImportContext):
         raise RuntimeError("Already in import context!")
     g_import_context = ctx
     try:
-        yield
+        with profiling.span(f"import {ctx.asset_name}"):
+            yield
     finally:
         g_import_context = None
 
@@ -215,6 +220,7 @@ def export_context_scope(ctx: ExportContext):
         raise RuntimeError("Already in export context!")
     g_export_context = ctx
     try:
-        yield
+        with profiling.span(f"export {ctx.asset_name}"):
+            yield
     finally:
         g_export_context = None
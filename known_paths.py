@@ -3,6 +3,7 @@ import os
 
 CONFIG_DIR_NAME = "sollumz"
 PREFS_FILE_NAME = "sollumz_prefs.ini"
+LOG_FILE_NAME = "sollumz_last_operation.log"
 
 
 def prefs_file_path() -> str:
@@ -13,6 +14,10 @@ def config_directory_path() -> str:
     return bpy.utils.user_resource(resource_type="CONFIG", path=CONFIG_DIR_NAME, create=True)
 
 
+def log_file_path() -> str:
+    return os.path.join(config_directory_path(), LOG_FILE_NAME)
+
+
 def data_directory_path() -> str:
     import addon_utils
 
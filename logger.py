@@ -4,10 +4,20 @@ Logging module to easily log messages from operators that are extended into many
 
 from bpy.types import Operator
 from abc import ABC, abstractmethod
-from typing import Sequence, Iterator
+from typing import Sequence, Iterator, Optional
 from collections import defaultdict
-from contextlib import contextmanager, AbstractContextManager
+from contextlib import contextmanager
 import logging
+import os
+import queue
+import threading
+
+# Max. number of distinct info and warning messages reported by an operator, the rest are only counted in the summary
+MAX_OPERATOR_REPORTS = 200
+# Max. number of repeated messages listed with their counts in the summary
+MAX_SUMMARY_REPEATED = 10
+
+_LEVELS_ORDER = ("INFO", "WARNING", "ERROR")
 
 
 class LoggerBase(ABC):
@@ -39,6 +49,115 @@ class OperatorLogger(LoggerBase):
         self._num_logs.clear()
 
 
+class LogFileWriter(LoggerBase):
+    """Writes messages to a file from a background thread, so file I/O does not slow down the logging code."""
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self._queue: queue.SimpleQueue[Optional[str]] = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="SollumzLogFileWriter", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        try:
+            os.makedirs(os.path.dirname(self.filepath), exist_ok=True)
+            with open(self.filepath, "w", encoding="utf-8") as f:
+                while (line := self._queue.get()) is not None:
+                    f.write(line)
+        except OSError as e:
+            print(f"ERROR: Failed to write log file '{self.filepath}': {e}")
+            # Drain the queue so close() does not wait forever
+            while self._queue.get() is not None:
+                pass
+
+    def do_log(self, msg: str, level: str):
+        self._queue.put(f"{level}: {msg}\n")
+
+    def close(self):
+        """Writes the pending messages and closes the file."""
+        self._queue.put(None)
+        self._thread.join()
+
+
+class AggregatingLogger(LoggerBase):
+    """Forwards messages to ``target``, deduplicating identical messages and limiting the number of messages
+    forwarded. Call ``flush`` to forward a summary of the repeated and suppressed messages. Optionally, all messages
+    are also written to ``log_file``.
+    """
+
+    def __init__(
+        self,
+        target: LoggerBase,
+        max_reports: int = MAX_OPERATOR_REPORTS,
+        log_file: Optional[LogFileWriter] = None
+    ):
+        self._target = target
+        self._max_reports = max_reports
+        self._log_file = log_file
+        # (level, msg) -> number of times logged
+        self._counts: dict[tuple[str, str], int] = {}
+        self._num_logs: dict[str, int] = defaultdict(int)
+        self._num_reported = 0
+        self._num_suppressed: dict[str, int] = defaultdict(int)
+
+    def do_log(self, msg: str, level: str):
+        self._num_logs[level] += 1
+        if self._log_file is not None:
+            self._log_file.do_log(msg, level)
+
+        key = (level, msg)
+        count = self._counts.get(key, 0)
+        self._counts[key] = count + 1
+        if count > 0:
+            return
+
+        if self._num_reported >= self._max_reports and level != "ERROR":
+            # Errors are always reported, they are rare and the user needs to see them
+            self._num_suppressed[level] += 1
+            return
+
+        self._num_reported += 1
+        self._target.do_log(msg, level)
+
+    @property
+    def has_warnings_or_errors(self) -> bool:
+        return self._num_logs["WARNING"] > 0 or self._num_logs["ERROR"] > 0
+
+    def clear_log_counts(self):
+        self._num_logs.clear()
+
+    def flush(self):
+        """Forwards the summary of repeated and suppressed messages, and resets the counts."""
+        repeated = sorted(
+            ((key, count) for key, count in self._counts.items() if count > 1),
+            key=lambda item: item[1],
+            reverse=True
+        )
+        for (level, msg), count in repeated[:MAX_SUMMARY_REPEATED]:
+            self._target.do_log(f"{msg} (repeated {count} times)", level)
+
+        num_suppressed = sum(self._num_suppressed.values())
+        num_repeated = len(repeated) - MAX_SUMMARY_REPEATED
+        if num_suppressed > 0 or num_repeated > 0:
+            level = max(
+                (level for level, n in self._num_suppressed.items() if n > 0),
+                key=_LEVELS_ORDER.index,
+                default="INFO"
+            )
+            summary = []
+            if num_suppressed > 0:
+                summary.append(f"{num_suppressed} more message(s) not shown")
+            if num_repeated > 0:
+                summary.append(f"{num_repeated} more repeated message(s) not listed")
+            if self._log_file is not None:
+                summary.append(f"see '{self._log_file.filepath}' for the full log")
+            self._target.do_log(", ".join(summary) + ".", level)
+
+        self._counts.clear()
+        self._num_reported = 0
+        self._num_suppressed.clear()
+
+
 class MultiLogger(LoggerBase):
     def __init__(self, loggers: Sequence[LoggerBase]):
         self._loggers: list[LoggerBase] = list(loggers)
@@ -54,7 +173,8 @@ class MultiLogger(LoggerBase):
         self._loggers.remove(logger)
 
 
-_root_logger: MultiLogger = MultiLogger([ConsoleLogger()])
+_console_logger = ConsoleLogger()
+_root_logger: MultiLogger = MultiLogger([_console_logger])
 
 
 def _log(msg: str, level: str):
@@ -70,8 +190,31 @@ def use_logger(logger: LoggerBase) -> Iterator[LoggerBase]:
         _root_logger.remove_logger(logger)
 
 
-def use_operator_logger(operator: Operator) -> AbstractContextManager[OperatorLogger]:
-    return use_logger(OperatorLogger(operator))
+@contextmanager
+def use_operator_logger(operator: Operator, log_filepath: Optional[str] = None) -> Iterator[AggregatingLogger]:
+    """Reports the messages logged inside this context to ``operator``. Identical messages are only reported once and
+    the number of messages reported is limited, a summary is reported when exiting the context. Messages printed to the
+    console are aggregated the same way. If ``log_filepath`` is set, all messages are also written to that file.
+    """
+    log_file = LogFileWriter(log_filepath) if log_filepath else None
+    targets = [OperatorLogger(operator)]
+    # Aggregate console output too, unless an outer operator logger already took over the console logger
+    owns_console = _console_logger in _root_logger._loggers
+    if owns_console:
+        _root_logger.remove_logger(_console_logger)
+        targets.append(_console_logger)
+
+    op_logger = AggregatingLogger(MultiLogger(targets), log_file=log_file)
+    _root_logger.add_logger(op_logger)
+    try:
+        yield op_logger
+    finally:
+        _root_logger.remove_logger(op_logger)
+        op_logger.flush()
+        if owns_console:
+            _root_logger.add_logger(_console_logger)
+        if log_file is not None:
+            log_file.close()
 
 
 def info(msg: str):
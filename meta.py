@@ -3,17 +3,23 @@
 import os
 
 
+def sollumz_manifest_version() -> str:
+    """Gets the version as written in the add-on manifest, without resolving the commit of development builds."""
+    import re
+    from pathlib import Path
+    manifest_path = Path(__file__).parent.absolute() / "blender_manifest.toml"
+    # tomllib is not included in Blender 4.0, so use some regex to get the version
+    manifest = manifest_path.read_text()
+    version_match = re.search(r'^version\s*=\s*\"([^\"]+)\"', manifest, re.MULTILINE)
+    return version_match.group(1) if version_match else "unknown version"
+
+
 def sollumz_version() -> str:
     CACHE_KEY = "_cached_version"
     if not (version := getattr(sollumz_version, CACHE_KEY, None)):
-        import re
         from pathlib import Path
         addon_dir = Path(__file__).parent.absolute()
-        manifest_path = addon_dir / "blender_manifest.toml"
-        # tomllib is not included in Blender 4.0, so use some regex to get the version
-        manifest = manifest_path.read_text()
-        version_match = re.search(r'^version\s*=\s*\"([^\"]+)\"', manifest, re.MULTILINE)
-        version = version_match.group(1) if version_match else "unknown version"
+        version = sollumz_manifest_version()
         if "$Format:%h$" in version:
             # When installed for development from a repo the manifest won't have the exact commit
             commit = "dirty"
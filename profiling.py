@@ -0,0 +1,245 @@
+"""
+Lightweight tracing with nested named spans and counters, to find out where time is spent in the import and export
+pipelines.
+
+Tracing is disabled unless a profiling session is active. When disabled, spans and counters only check a global.
+Sessions are started with ``profiling_session``. Import/export operators start one if the ``SOLLUMZ_PROFILE``
+environment variable is ``true``, and the ``sz_perf_ie`` command starts one with the ``--trace`` option. When a session
+ends, a hierarchical timing report is printed to the console. Optionally, a Chrome trace-event JSON file is written,
+which can be opened in https://ui.perfetto.dev or chrome://tracing.
+
+Environment Variables:
+- `SOLLUMZ_PROFILE`: if `true`, profile import/export operators.
+- `SOLLUMZ_PROFILE_TRACE_DIR`: directory where to write the trace files of the profiled operators. If not set, only the
+  report is printed.
+"""
+
+import json
+import os
+import re
+import time
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class SpanStats:
+    """Accumulated timings of all the calls to a span with the same name and parent span."""
+
+    __slots__ = ("name", "num_calls", "total_time", "counters", "children")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.num_calls = 0
+        self.total_time = 0.0
+        self.counters: dict[str, int] = {}
+        self.children: dict[str, "SpanStats"] = {}
+
+    @property
+    def self_time(self) -> float:
+        return self.total_time - sum(c.total_time for c in self.children.values())
+
+    def get_child(self, name: str) -> "SpanStats":
+        child = self.children.get(name, None)
+        if child is None:
+            child = self.children[name] = SpanStats(name)
+        return child
+
+
+class ProfilingSession:
+    def __init__(self, name: str):
+        self.name = name
+        self.root = SpanStats(name)
+        self.trace_events: list[dict] = []
+        self._stats_stack: list[SpanStats] = [self.root]
+        self._start_times: list[float] = []
+        self._counters_stack: list[dict[str, int]] = [self.root.counters]
+        self._start_time = time.perf_counter()
+        self._pid = os.getpid()
+
+    def begin_span(self, name: str):
+        self._stats_stack.append(self._stats_stack[-1].get_child(name))
+        self._counters_stack.append({})
+        self._start_times.append(time.perf_counter())
+
+    def end_span(self):
+        end_time = time.perf_counter()
+        start_time = self._start_times.pop()
+        counters = self._counters_stack.pop()
+        stats = self._stats_stack.pop()
+        stats.num_calls += 1
+        stats.total_time += end_time - start_time
+        for name, value in counters.items():
+            stats.counters[name] = stats.counters.get(name, 0) + value
+
+        event = {
+            "name": stats.name,
+            "ph": "X",
+            "ts": (start_time - self._start_time) * 1_000_000,
+            "dur": (end_time - start_time) * 1_000_000,
+            "pid": self._pid,
+            "tid": 0,
+        }
+        if counters:
+            event["args"] = counters
+        self.trace_events.append(event)
+
+    def count(self, name: str, value: int):
+        counters = self._counters_stack[-1]
+        counters[name] = counters.get(name, 0) + value
+
+    def finish(self):
+        while len(self._stats_stack) > 1:
+            # Spans left open by an exception that skipped their end
+            self.end_span()
+
+        self.root.num_calls = 1
+        self.root.total_time = time.perf_counter() - self._start_time
+
+    def format_report(self) -> list[str]:
+        """Formats the timings as a text table, one row per span, indented by nesting level."""
+        rows = []
+
+        def _add_rows(stats: SpanStats, depth: int):
+            counters = ", ".join(f"{name}={value}" for name, value in stats.counters.items())
+            percent = stats.total_time / self.root.total_time * 100 if self.root.total_time > 0 else 0.0
+            rows.append((
+                "  " * depth + stats.name,
+                str(stats.num_calls),
+                f"{stats.total_time * 1000:.2f}",
+                f"{stats.self_time * 1000:.2f}",
+                f"{percent:.1f}",
+                counters,
+            ))
+            for child in sorted(stats.children.values(), key=lambda c: c.total_time, reverse=True):
+                _add_rows(child, depth + 1)
+
+        _add_rows(self.root, 0)
+
+        headers = ("Span", "Calls", "Total ms", "Self ms", "%", "Counters")
+        widths = [max(len(row[col]) for row in (headers, *rows)) for col in range(len(headers))]
+        lines = []
+        for row in (headers, *rows):
+            name, *values, counters = row
+            line = name.ljust(widths[0])
+            line += "".join(f"  {value:>{width}}" for value, width in zip(values, widths[1:-1]))
+            line += f"  {counters}"
+            lines.append(line.rstrip())
+        lines.insert(1, "-" * len(lines[0]))
+        return lines
+
+    def write_chrome_trace(self, filepath: str | Path):
+        filepath = Path(filepath)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        with filepath.open("w") as f:
+            json.dump({"traceEvents": self.trace_events, "displayTimeUnit": "ms"}, f)
+
+
+_session: Optional[ProfilingSession] = None
+
+
+def is_profiling() -> bool:
+    return _session is not None
+
+
+class _Span:
+    __slots__ = ("_session", "_name")
+
+    def __init__(self, session: ProfilingSession, name: str):
+        self._session = session
+        self._name = name
+
+    def __enter__(self):
+        self._session.begin_span(self._name)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._session.end_span()
+
+
+_NULL_SPAN = nullcontext()
+
+
+def span(name: str):
+    """Times the code inside this context as a span named ``name``, nested in the current span. Does nothing if there
+    is no profiling session.
+    """
+    session = _session
+    if session is None:
+        return _NULL_SPAN
+    return _Span(session, name)
+
+
+def count(name: str, value: int = 1):
+    """Adds ``value`` to the counter ``name`` of the current span. Does nothing if there is no profiling session."""
+    session = _session
+    if session is not None:
+        session.count(name, value)
+
+
+def traced(name: Optional[str] = None) -> Callable[[F], F]:
+    """Decorator to time each call to the function as a span. The span name defaults to the function name."""
+    def _decorator(fn: F) -> F:
+        span_name = name or fn.__name__
+
+        @wraps(fn)
+        def _wrapper(*args, **kwargs):
+            session = _session
+            if session is None:
+                return fn(*args, **kwargs)
+
+            session.begin_span(span_name)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                session.end_span()
+
+        return _wrapper
+
+    return _decorator
+
+
+@contextmanager
+def profiling_session(
+    name: str,
+    trace_filepath: Optional[str | Path] = None,
+    print_report: bool = True
+) -> Iterator[ProfilingSession]:
+    """Enables tracing inside this context. On exit, prints the timing report and, if ``trace_filepath`` is set,
+    writes the Chrome trace-event file. If there is already a session active, this is a span in that session instead.
+    """
+    global _session
+    if _session is not None:
+        with span(name):
+            yield _session
+        return
+
+    session = ProfilingSession(name)
+    _session = session
+    try:
+        yield session
+    finally:
+        _session = None
+        session.finish()
+        if print_report:
+            print("\n".join(session.format_report()))
+        if trace_filepath is not None:
+            session.write_chrome_trace(trace_filepath)
+            print(f"Saved trace to '{trace_filepath}'")
+
+
+def profiling_session_from_env(name: str):
+    """Starts a profiling session if requested through environment variables, see module documentation."""
+    if os.environ.get("SOLLUMZ_PROFILE", "false") != "true":
+        return nullcontext()
+
+    trace_filepath = None
+    trace_dir = os.environ.get("SOLLUMZ_PROFILE_TRACE_DIR", None)
+    if trace_dir:
+        file_name = re.sub(r"[^\w.-]+", "_", name)
+        trace_filepath = Path(trace_dir) / f"{file_name}_{time.strftime('%Y%m%d_%H%M%S')}.trace.json"
+
+    return profiling_session(name, trace_filepath)
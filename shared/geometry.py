@@ -326,46 +326,117 @@ def shrink_mesh(mesh_vertices, mesh_faces):
 def _try_shrink_mesh(mesh_vertices, mesh_faces, neighbors, margin: float):
     shrunk_vertices = _shrink_polys(mesh_vertices, mesh_faces, neighbors, margin)
 
-    num_polys = len(mesh_faces)
-    num_verts = len(mesh_vertices)
-
     # Make sure that no polygons collide with each other
-    for vert_idx in range(num_verts):
-        vertex = mesh_vertices[vert_idx]
-        shrunk_vertex = shrunk_vertices[vert_idx]
-
-        segment_pos = Vector(shrunk_vertex)
-        segment_dir = Vector(vertex - shrunk_vertex)
-        segment_length = segment_dir.length
-        segment_dir /= segment_length
-
-        max_distance = segment_length
-
-        def _intersect_test(v1, v2, v3):
-            from mathutils import geometry
-            intersect_pos = geometry.intersect_ray_tri(v1, v2, v3, segment_dir, segment_pos)
-            if intersect_pos is None:
-                return False
-
-            distance = (intersect_pos - segment_pos).length
-            return distance <= max_distance
-
-        for poly_idx in range(num_polys):
-            poly_verts = mesh_faces[poly_idx]
+    if _any_shrunk_vertex_collision(mesh_vertices, shrunk_vertices, mesh_faces):
+        return None
 
-            # Intersection test is done against other polygons, so we must exclude polygons that share current vertex
-            if (poly_verts == vert_idx).any():
-                continue
+    return shrunk_vertices
 
-            v1, v2, v3 = [Vector(mesh_vertices[vi]) for vi in poly_verts]
-            if _intersect_test(v1, v2, v3):
-                return None
 
-            vs1, vs2, vs3 = [Vector(shrunk_vertices[vi]) for vi in poly_verts]
-            if _intersect_test(vs1, vs2, vs3):
-                return None
+def _any_shrunk_vertex_collision(mesh_vertices, shrunk_vertices, mesh_faces, chunk_size: int = 256) -> bool:
+    """Check if the segment between any vertex and its shrunk vertex intersects a polygon of the original or the
+    shrunk mesh. Polygons that share the vertex are excluded. As with ``intersect_ray_tri``, hits behind the shrunk
+    vertex count too, up to one segment length away.
 
-    return shrunk_vertices
+    All segments are tested in bulk against both meshes. Candidate segment-triangle pairs are found by sweeping the
+    segments and triangles sorted along the X axis and testing their bounding boxes, and then the candidates are
+    tested with a batched ray-triangle intersection.
+    """
+    mesh_faces = np.asarray(mesh_faces, dtype=np.int64)
+    vertices = np.asarray(mesh_vertices, dtype=np.float64)
+    shrunk = np.asarray(shrunk_vertices, dtype=np.float64)
+    num_verts = len(vertices)
+    num_polys = len(mesh_faces)
+    if num_verts == 0 or num_polys == 0:
+        return False
+
+    # Segments go from the shrunk vertex towards the original vertex
+    seg_origins = shrunk
+    seg_vecs = vertices - shrunk
+    seg_lengths = np.linalg.norm(seg_vecs, axis=1)
+    seg_dirs = np.divide(seg_vecs, seg_lengths[:, np.newaxis], out=np.zeros_like(seg_vecs),
+                         where=seg_lengths[:, np.newaxis] != 0.0)
+    # Hits are checked by absolute distance, so the boxes span from one segment behind the shrunk vertex up to the
+    # original vertex
+    seg_back = shrunk - seg_vecs
+    seg_min = np.minimum(vertices, seg_back)
+    seg_max = np.maximum(vertices, seg_back)
+
+    # Test against the polygons of both the original and shrunk meshes
+    tris = np.concatenate((vertices[mesh_faces], shrunk[mesh_faces]))
+    tris_poly = np.concatenate((np.arange(num_polys), np.arange(num_polys)))
+    tris_min = tris.min(axis=1)
+    tris_max = tris.max(axis=1)
+
+    # Pad the bounding boxes so precision errors don't discard intersections right at the end of the segments
+    eps = 1e-6 * max(1.0, float(np.abs(vertices).max()))
+    seg_min -= eps
+    seg_max += eps
+
+    tris_order = np.argsort(tris_min[:, 0], kind="stable")
+    tris_sorted_min_x = tris_min[tris_order, 0]
+    segs_order = np.argsort(seg_min[:, 0], kind="stable")
+    for chunk_start in range(0, num_verts, chunk_size):
+        chunk_segs = segs_order[chunk_start:chunk_start + chunk_size]
+        chunk_min = seg_min[chunk_segs]
+        chunk_max = seg_max[chunk_segs]
+
+        # Broad-phase, triangles that start before the end of this chunk along X and end after its start
+        num_candidates = np.searchsorted(tris_sorted_min_x, chunk_max[:, 0].max(), side="right")
+        chunk_tris = tris_order[:num_candidates]
+        chunk_tris = chunk_tris[tris_max[chunk_tris, 0] >= chunk_min[:, 0].min()]
+        if len(chunk_tris) == 0:
+            continue
+
+        overlap = np.all(
+            (chunk_min[:, np.newaxis, :] <= tris_max[np.newaxis, chunk_tris, :]) &
+            (chunk_max[:, np.newaxis, :] >= tris_min[np.newaxis, chunk_tris, :]),
+            axis=2
+        )
+        pair_segs, pair_tris = np.nonzero(overlap)
+        if len(pair_segs) == 0:
+            continue
+
+        pair_segs = chunk_segs[pair_segs]
+        pair_tris = chunk_tris[pair_tris]
+
+        # Intersection test is done against other polygons, so we must exclude polygons that share current vertex
+        shares_vertex = np.any(mesh_faces[tris_poly[pair_tris]] == pair_segs[:, np.newaxis], axis=1)
+        pair_segs = pair_segs[~shares_vertex]
+        pair_tris = pair_tris[~shares_vertex]
+        if len(pair_segs) == 0:
+            continue
+
+        hit_distances = _intersect_rays_tris(seg_origins[pair_segs], seg_dirs[pair_segs], tris[pair_tris])
+        if np.any((np.abs(hit_distances) <= seg_lengths[pair_segs]) & (seg_lengths[pair_segs] != 0.0)):
+            return True
+
+    return False
+
+
+def _intersect_rays_tris(ray_origins: NDArray, ray_dirs: NDArray, tris_array: NDArray) -> NDArray:
+    """Intersect each ray with its corresponding triangle, both faces of the triangle are considered. Returns the
+    signed distance along the ray to the intersection point, or infinity if the ray does not intersect the triangle.
+    Same algorithm (Möller-Trumbore) and tolerances as ``mathutils.geometry.intersect_ray_tri``, which also returns
+    intersections behind the ray origin.
+    """
+    v1, v2, v3 = tris_array[:, 0], tris_array[:, 1], tris_array[:, 2]
+    e1 = v2 - v1
+    e2 = v3 - v1
+
+    pvec = np.cross(ray_dirs, e2)
+    det = np.einsum("ij,ij->i", e1, pvec)
+    valid = np.abs(det) >= 0.000001
+    inv_det = np.divide(1.0, det, out=np.zeros_like(det), where=valid)
+
+    tvec = ray_origins - v1
+    u = np.einsum("ij,ij->i", tvec, pvec) * inv_det
+    qvec = np.cross(tvec, e1)
+    v = np.einsum("ij,ij->i", ray_dirs, qvec) * inv_det
+    t = np.einsum("ij,ij->i", e2, qvec) * inv_det
+
+    valid &= (u >= 0.0) & (u <= 1.0) & (v >= 0.0) & (u + v <= 1.0)
+    return np.where(valid, t, np.inf)
 
 
 def _shrink_polys(mesh_vertices, mesh_faces, neighbors, margin):
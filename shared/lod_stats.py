@@ -0,0 +1,106 @@
+"""
+Cached statistics of LOD meshes and drawables displayed in the UI panels, so they are not recomputed on every redraw.
+"""
+from typing import NamedTuple, Optional
+
+import bpy
+import numpy as np
+from bpy.types import (
+    Mesh,
+    Object,
+)
+
+from ..sollumz_helper import find_sollumz_parent
+from ..sollumz_properties import SollumType
+from .mesh_updates import mesh_update_counter, objects_update_counter
+
+
+class MeshStats(NamedTuple):
+    tri_count: int
+    vert_count: int
+    material_count: int
+
+
+def mesh_triangle_count(mesh: Mesh) -> int:
+    """Counts the triangles of the mesh once triangulated, n-gons count as ``n - 2`` triangles."""
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    return int(np.maximum(loop_totals - 2, 1).sum())
+
+
+# mesh pointer -> ((update counter, num vertices, num polygons, num materials), stats)
+_mesh_stats_cache: dict[int, tuple[tuple[int, int, int, int], MeshStats]] = {}
+
+# drawable pointer -> (objects update counter, name of the first drawable model child)
+_drawable_model_cache: dict[int, tuple[int, Optional[str]]] = {}
+
+
+def get_mesh_stats(mesh: Mesh) -> MeshStats:
+    """Gets the triangle, vertex and material counts of the mesh. Cached until the mesh data is updated."""
+    num_verts = len(mesh.vertices)
+    num_materials = len(mesh.materials)
+    key = (mesh_update_counter(mesh), num_verts, len(mesh.polygons), num_materials)
+    ptr = mesh.original.as_pointer()
+    cached = _mesh_stats_cache.get(ptr, None)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    stats = MeshStats(mesh_triangle_count(mesh), num_verts, num_materials)
+    _mesh_stats_cache[ptr] = (key, stats)
+    return stats
+
+
+def _find_first_drawable_model(parent_obj: Object) -> Optional[Object]:
+    key = objects_update_counter()
+    ptr = parent_obj.as_pointer()
+    cached = _drawable_model_cache.get(ptr, None)
+    if cached is not None and cached[0] == key:
+        return bpy.data.objects.get(cached[1], None) if cached[1] is not None else None
+
+    model_obj = next(
+        (
+            child for child in parent_obj.children_recursive
+            if child.type == "MESH" and child.sollum_type == SollumType.DRAWABLE_MODEL
+        ),
+        None
+    )
+    _drawable_model_cache[ptr] = (key, model_obj.name if model_obj is not None else None)
+    return model_obj
+
+
+def get_object_active_lod_level(obj: Optional[Object]) -> Optional[str]:
+    """Gets the active LOD level of the Sollumz object hierarchy that ``obj`` belongs to, ``"hidden"`` if the hierarchy
+    is hidden, or ``None`` if it does not have drawable models.
+    """
+    if obj is None:
+        return None
+
+    parent_obj = find_sollumz_parent(obj)
+    if parent_obj is None:
+        return None
+
+    if parent_obj.hide_get():
+        return "hidden"
+
+    # Simply use the LOD level of the first model we find. Might not be accurate if the user manually changes LODs of
+    # the models separately instead of using the buttons in the tools panel, but in general this should be enough.
+    model_obj = _find_first_drawable_model(parent_obj)
+    return model_obj.sz_lods.active_lod_level if model_obj is not None else None
+
+
+def clear_lod_stats_cache():
+    _mesh_stats_cache.clear()
+    _drawable_model_cache.clear()
+
+
+@bpy.app.handlers.persistent
+def load_post_handler(*args):
+    clear_lod_stats_cache()
+
+
+def register():
+    bpy.app.handlers.load_post.append(load_post_handler)
+
+
+def unregister():
+    bpy.app.handlers.load_post.remove(load_post_handler)
@@ -0,0 +1,168 @@
+"""
+Reverse index from materials to the meshes using them, and from meshes to the objects using them.
+
+Built once with ``bpy.data.user_map`` and then refreshed incrementally: only meshes whose data changed since the last
+refresh are re-indexed, and the mesh to objects map is rebuilt only when objects changed.
+
+The index only stores session UIDs, Python references to datablocks are not valid after undo/redo. UIDs are resolved
+to the datablocks of the current data on each refresh.
+"""
+from typing import Optional
+
+import bpy
+from bpy.types import (
+    Context,
+    Material,
+    Mesh,
+    Object,
+)
+
+from .mesh_updates import mesh_update_counter, objects_update_counter
+
+
+class MaterialUsersIndex:
+    def __init__(self):
+        # All keyed by session UID
+        self._material_meshes: dict[int, set[int]] = {}
+        self._mesh_materials: dict[int, set[int]] = {}
+        self._mesh_objects: dict[int, list[int]] = {}
+        # mesh -> (update counter, number of material slots) when it was indexed
+        self._mesh_keys: dict[int, tuple[int, int]] = {}
+        self._objects_counter: Optional[int] = None
+        self._num_materials = 0
+        # Lookups from session UID to the datablocks, only valid until the data changes, rebuilt on each refresh
+        self._meshes_by_uid: dict[int, Mesh] = {}
+        self._objects_by_uid: dict[int, Object] = {}
+
+    def rebuild(self):
+        """Rebuilds the whole index."""
+        material_meshes = bpy.data.user_map(subset=bpy.data.materials, value_types={"MESH"})
+        self._material_meshes = {
+            mat.session_uid: {mesh.session_uid for mesh in meshes}
+            for mat, meshes in material_meshes.items() if meshes
+        }
+        self._mesh_materials = {}
+        for mat_uid, mesh_uids in self._material_meshes.items():
+            for mesh_uid in mesh_uids:
+                self._mesh_materials.setdefault(mesh_uid, set()).add(mat_uid)
+
+        self._mesh_keys = {
+            mesh.session_uid: (mesh_update_counter(mesh), len(mesh.materials)) for mesh in bpy.data.meshes
+        }
+        self._num_materials = len(bpy.data.materials)
+        self._rebuild_mesh_objects()
+
+    def _rebuild_mesh_objects(self):
+        mesh_objects = bpy.data.user_map(subset=bpy.data.meshes, value_types={"OBJECT"})
+        self._mesh_objects = {
+            mesh.session_uid: [obj.session_uid for obj in objs]
+            for mesh, objs in mesh_objects.items() if objs
+        }
+        self._objects_counter = objects_update_counter()
+
+    def _reindex_mesh(self, mesh: Mesh):
+        mesh_uid = mesh.session_uid
+        for mat_uid in self._mesh_materials.pop(mesh_uid, ()):
+            mesh_uids = self._material_meshes.get(mat_uid, None)
+            if mesh_uids is not None:
+                mesh_uids.discard(mesh_uid)
+
+        mat_uids = {mat.session_uid for mat in mesh.materials if mat is not None}
+        if mat_uids:
+            self._mesh_materials[mesh_uid] = mat_uids
+            for mat_uid in mat_uids:
+                self._material_meshes.setdefault(mat_uid, set()).add(mesh_uid)
+
+    def refresh(self):
+        """Updates the index with the changes since the last refresh."""
+        meshes = bpy.data.meshes
+        self._meshes_by_uid = {mesh.session_uid: mesh for mesh in meshes}
+        self._objects_by_uid = {obj.session_uid: obj for obj in bpy.data.objects}
+        if (
+            self._objects_counter is None or
+            len(meshes) != len(self._mesh_keys) or
+            len(bpy.data.materials) != self._num_materials
+        ):
+            # Data-blocks added or removed
+            self.rebuild()
+            return
+
+        for mesh_uid, mesh in self._meshes_by_uid.items():
+            key = (mesh_update_counter(mesh), len(mesh.materials))
+            old_key = self._mesh_keys.get(mesh_uid, None)
+            if old_key is None:
+                self.rebuild()
+                return
+
+            if old_key != key:
+                self._reindex_mesh(mesh)
+                self._mesh_keys[mesh_uid] = key
+
+        if self._objects_counter != objects_update_counter():
+            self._rebuild_mesh_objects()
+
+    def clear(self):
+        self._material_meshes.clear()
+        self._mesh_materials.clear()
+        self._mesh_objects.clear()
+        self._mesh_keys.clear()
+        self._meshes_by_uid.clear()
+        self._objects_by_uid.clear()
+        self._objects_counter = None
+
+    def get_meshes(self, material: Material) -> list[Mesh]:
+        """Gets the meshes that use the material, sorted by name."""
+        meshes = [
+            mesh
+            for mesh_uid in self._material_meshes.get(material.session_uid, ())
+            if (mesh := self._meshes_by_uid.get(mesh_uid, None)) is not None
+        ]
+        return sorted(meshes, key=lambda m: m.name)
+
+    def get_mesh_objects(self, mesh: Mesh) -> list[Object]:
+        """Gets the objects that use the mesh, sorted by name."""
+        objs = [
+            obj
+            for obj_uid in self._mesh_objects.get(mesh.session_uid, ())
+            if (obj := self._objects_by_uid.get(obj_uid, None)) is not None and
+            obj.data == mesh  # in case the object changed mesh since the index was refreshed
+        ]
+        return sorted(objs, key=lambda o: o.name)
+
+    def get_objects(self, material: Material) -> list[Object]:
+        """Gets the objects with a mesh that uses the material."""
+        return [obj for mesh in self.get_meshes(material) for obj in self.get_mesh_objects(mesh)]
+
+
+g_material_users_index = MaterialUsersIndex()
+
+
+def get_material_users_index(context: Context) -> MaterialUsersIndex:
+    """Gets the material users index, refreshed with the current data. The depsgraph is evaluated first so changes
+    made in the same operator or script are tracked.
+    """
+    context.view_layer.update()
+    g_material_users_index.refresh()
+    return g_material_users_index
+
+
+@bpy.app.handlers.persistent
+def load_post_handler(*args):
+    g_material_users_index.clear()
+
+
+@bpy.app.handlers.persistent
+def undo_redo_post_handler(*args):
+    g_material_users_index.clear()
+
+
+def register():
+    bpy.app.handlers.load_post.append(load_post_handler)
+    bpy.app.handlers.undo_post.append(undo_redo_post_handler)
+    bpy.app.handlers.redo_post.append(undo_redo_post_handler)
+
+
+def unregister():
+    bpy.app.handlers.load_post.remove(load_post_handler)
+    bpy.app.handlers.undo_post.remove(undo_redo_post_handler)
+    bpy.app.handlers.redo_post.remove(undo_redo_post_handler)
@@ -0,0 +1,82 @@
+"""
+Tracking of mesh data and object changes, for caches of data derived from meshes and objects.
+"""
+import bpy
+from bpy.types import (
+    Collection,
+    Depsgraph,
+    Mesh,
+    Object,
+    Scene,
+)
+
+_mesh_update_counters: dict[int, int] = {}
+_global_update_counter = 0
+_untracked_mesh_counter = 0
+_objects_update_counter = 0
+
+
+def mesh_update_counter(mesh: Mesh) -> int:
+    """Gets a counter that changes every time the mesh data is updated. Caches of data derived from the mesh can store
+    this counter to know when they need to be recomputed.
+    """
+    return _mesh_update_counters.get(mesh.original.as_pointer(), _untracked_mesh_counter)
+
+
+def objects_update_counter() -> int:
+    """Gets a counter that changes every time any object is updated, added or removed. Caches of data derived from the
+    object hierarchy (e.g. parents and children) can store this counter to know when they need to be recomputed.
+    """
+    return _objects_update_counter
+
+
+def _bump_mesh_update_counter(mesh: Mesh):
+    global _global_update_counter
+    # Use a global counter so a mesh that is freed and another one allocated at the same address don't end up with the
+    # same counter value
+    _global_update_counter += 1
+    _mesh_update_counters[mesh.original.as_pointer()] = _global_update_counter
+
+
+def mark_mesh_updated(mesh: Mesh):
+    """Changes the update counter of the mesh. Code writing mesh data directly (e.g. ``foreach_set``) must call this,
+    the depsgraph only reports the update once it is evaluated and caches could return stale data until then.
+    """
+    _bump_mesh_update_counter(mesh)
+
+
+@bpy.app.handlers.persistent
+def depsgraph_update_post_handler(scene: Scene, depsgraph: Depsgraph):
+    global _objects_update_counter
+    for update in depsgraph.updates:
+        id = update.id
+        if isinstance(id, Mesh):
+            _bump_mesh_update_counter(id)
+        elif isinstance(id, Object):
+            _objects_update_counter += 1
+            if update.is_updated_geometry and isinstance(id.data, Mesh):
+                _bump_mesh_update_counter(id.data)
+        elif isinstance(id, (Scene, Collection)):
+            # Objects linked or unlinked
+            _objects_update_counter += 1
+
+
+@bpy.app.handlers.persistent
+def load_post_handler(*args):
+    # Pointers from the previous file are no longer valid. Meshes of the new file get a counter value that was never
+    # used before, so caches don't confuse them with meshes of the previous file
+    global _global_update_counter, _untracked_mesh_counter, _objects_update_counter
+    _mesh_update_counters.clear()
+    _global_update_counter += 1
+    _untracked_mesh_counter = _global_update_counter
+    _objects_update_counter += 1
+
+
+def register():
+    bpy.app.handlers.depsgraph_update_post.append(depsgraph_update_post_handler)
+    bpy.app.handlers.load_post.append(load_post_handler)
+
+
+def unregister():
+    bpy.app.handlers.depsgraph_update_post.remove(depsgraph_update_post_handler)
+    bpy.app.handlers.load_post.remove(load_post_handler)
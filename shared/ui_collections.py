@@ -0,0 +1,66 @@
+"""
+Helpers for the window manager collections that only exist to display lists in the UI (shaders, collision materials,
+presets...).
+
+These collections are refreshed after loading a .blend file from a timer, so the work is only done once the UI is
+running and batch scripts loading many files don't pay for it. Preset files are parsed once and reused until they
+change on disk, and collections that already contain the expected entries are not repopulated.
+"""
+import os
+from typing import Any, Callable, TypeVar
+
+import bpy
+from bpy.types import bpy_prop_collection
+
+T = TypeVar("T")
+
+# path -> ((mtime, size), file type, parsed file)
+_parsed_files: dict[str, tuple[tuple[int, int], type, Any]] = {}
+
+
+def load_xml_file_cached(path: str, file_type: type[T]) -> T:
+    """Parses the XML file at ``path`` with ``file_type.from_xml_file``. The parsed file is cached and reused until
+    the file is modified. The returned object is shared, callers must not modify it.
+    """
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _parsed_files.get(path, None)
+    if cached is not None and cached[0] == key and cached[1] is file_type:
+        return cached[2]
+
+    file = file_type.from_xml_file(path)
+    _parsed_files[path] = (key, file_type, file)
+    return file
+
+
+def sync_ui_collection(
+    collection: bpy_prop_collection,
+    names: list[str],
+    init_item: Callable[[Any, int], None]
+) -> bool:
+    """Fills ``collection`` with an item per name, initialized with ``init_item(item, index)``. Does nothing if the
+    collection already has items with these names. Returns whether the collection was repopulated.
+    """
+    if len(collection) == len(names) and all(item.name == name for item, name in zip(collection, names)):
+        return False
+
+    collection.clear()
+    for index, name in enumerate(names):
+        item = collection.add()
+        item.name = name
+        init_item(item, index)
+
+    return True
+
+
+def refresh_ui_collections_deferred(refresh_fn: Callable[[], None]):
+    """Calls ``refresh_fn`` from a timer, once the UI is running. Timers don't run while a script is running (e.g. batch
+    scripts in background mode), code that needs the collections there has to refresh them explicitly.
+    """
+    if not bpy.app.timers.is_registered(refresh_fn):
+        bpy.app.timers.register(refresh_fn, first_interval=0.0)
+
+
+def cancel_deferred_refresh(refresh_fn: Callable[[], None]):
+    if bpy.app.timers.is_registered(refresh_fn):
+        bpy.app.timers.unregister(refresh_fn)
@@ -24,3 +24,26 @@ def init_debug():
     debugpy.listen((host, port))
     if wait:
         debugpy.wait_for_client()
+
+
+def report_startup_time(elapsed_time: float, stats: dict):
+    """Prints how long it took to enable the add-on, if requested by the user through environment variables or if
+    Blender was started with `--debug-python`.
+
+    Environment Variables:
+    - `SOLLUMZ_STARTUP_TIMING`: if `true`, print the startup time.
+    """
+    import bpy
+
+    enable = os.environ.get("SOLLUMZ_STARTUP_TIMING", "false") == "true" or bpy.app.debug_python
+    if not enable:
+        return
+
+    details = ""
+    if stats:
+        details = (
+            f" (modules: {stats['num_modules']} loaded in {stats['load_time'] * 1000:.0f} ms"
+            f"{' from registration manifest' if stats['used_manifest'] else ''}, "
+            f"classes: {stats['num_classes']} registered in {stats['register_time'] * 1000:.0f} ms)"
+        )
+    print(f"Sollumz enabled in {elapsed_time * 1000:.0f} ms{details}")
@@ -13,6 +13,7 @@ from bpy.props import (
 )
 import time
 import re
+from typing import Optional
 from mathutils import Quaternion
 from .sollumz_helper import SOLLUMZ_OT_base, find_sollumz_parent
 from .sollumz_properties import SollumType, SOLLUMZ_UI_NAMES, TimeFlagsMixin
@@ -27,25 +28,18 @@ from szio.gta5.cwxml import (
     YTYP,
     YMAP,
 )
-from .ydr.ydrimport import import_ydr
-from .ydr.ydrexport import export_ydr
-from .ydd.yddimport import import_ydd
-from .ydd.yddexport import export_ydd
-from .yft.yftimport import import_yft
-from .yft.yftexport import export_yft
-from .ybn.ybnimport import import_ybn
-from .ybn.ybnexport import export_ybn
-from .ynv.ynvimport import import_ynv
-from .ycd.ycdimport import import_ycd
-from .ycd.ycdexport import export_ycd
-from .ymap.ymapimport import import_ymap
-from .ymap.ymapexport import export_ymap
-from .ytyp.ytypimport import import_ytyp
 from .tools.blenderhelper import remove_number_suffix
 from .meta import DEV_MODE
 from .dependencies import IS_SZIO_NATIVE_AVAILABLE, PYMATERIA_REQUIRED_MSG
 
 from . import logger
+from .profiling import profiling_session_from_env
+from .known_paths import log_file_path
+
+
+def _get_log_filepath() -> Optional[str]:
+    """Gets the path of the log file to write import/export messages to, if enabled in the preferences."""
+    return log_file_path() if get_addon_preferences().write_log_file else None
 
 
 class TimedOperator:
@@ -60,7 +54,8 @@ class TimedOperator:
 
     def execute(self, context: Context):
         self._start = time.time()
-        return self.execute_timed(context)
+        with profiling_session_from_env(self.bl_idname):
+            return self.execute_timed(context)
 
     def execute_timed(self, context: Context):
         ...
@@ -89,7 +84,7 @@ class SOLLUMZ_OT_import_assets_legacy(TimedOperator, Operator):
         pass
 
     def execute_timed(self, context):
-        with logger.use_operator_logger(self):
+        with logger.use_operator_logger(self, _get_log_filepath()):
             if not self.directory or len(self.files) == 0 or self.files[0].name == "":
                 logger.info("No file selected for import!")
                 return {"CANCELLED"}
@@ -100,6 +95,16 @@ class SOLLUMZ_OT_import_assets_legacy(TimedOperator, Operator):
             filenames, ytyp_filenames = self._separate_ytyp_filenames(filenames)
             filenames = self._dedupe_hi_yft_filenames(filenames)
 
+            # Import/export modules are loaded on first use to keep add-on startup fast
+            from .ydr.ydrimport import import_ydr
+            from .ydd.yddimport import import_ydd
+            from .yft.yftimport import import_yft
+            from .ybn.ybnimport import import_ybn
+            from .ynv.ynvimport import import_ynv
+            from .ycd.ycdimport import import_ycd
+            from .ymap.ymapimport import import_ymap
+            from .ytyp.ytypimport import import_ytyp
+
             for filename in filenames:
                 filepath = os.path.join(self.directory, filename)
 
@@ -196,7 +201,7 @@ class ImportAssetsOperatorImpl(ImportSettingsBase, TimedOperator):
         pass
 
     def execute_timed(self, context):
-        with logger.use_operator_logger(self):
+        with logger.use_operator_logger(self, _get_log_filepath()):
             if not self.directory or len(self.files) == 0 or self.files[0].name == "":
                 logger.info("No file selected for import!")
                 return {"CANCELLED"}
@@ -214,6 +219,9 @@ class ImportAssetsOperatorImpl(ImportSettingsBase, TimedOperator):
             from .ydd.yddimport_io import import_ydd as import_ydd_asset, find_ydd_external_dependencies
             from .yft.yftimport_io import import_yft as import_yft_asset, find_yft_external_dependencies
             from .ytyp.ytypimport_io import import_ytyp as import_ytyp_asset
+            from .ynv.ynvimport import import_ynv
+            from .ycd.ycdimport import import_ycd
+            from .ymap.ymapimport import import_ymap
             from .iecontext import import_context_scope, ImportContext
 
             prefs_import_settings = self if self.use_custom_settings else get_import_settings()
@@ -436,7 +444,15 @@ class SOLLUMZ_OT_export_assets_legacy(TimedOperator, Operator):
             return {"RUNNING_MODAL"}
 
     def execute_timed(self, context: Context):
-        with logger.use_operator_logger(self) as op_log:
+        # Import/export modules are loaded on first use to keep add-on startup fast
+        from .ydr.ydrexport import export_ydr
+        from .ydd.yddexport import export_ydd
+        from .yft.yftexport import export_yft
+        from .ybn.ybnexport import export_ybn
+        from .ycd.ycdexport import export_ycd, clip_dictionary_export_scope
+        from .ymap.ymapexport import export_ymap
+
+        with logger.use_operator_logger(self, _get_log_filepath()) as op_log, clip_dictionary_export_scope():
             logger.info("Starting export...")
             export_settings = get_export_settings()
             objs = _collect_objects_for_export(context, export_settings.limit_to_selected)
@@ -556,7 +572,10 @@ class SOLLUMZ_OT_export_assets(ExportSettingsBase, TimedOperator, Operator):
             return {"RUNNING_MODAL"}
 
     def execute_timed(self, context: Context):
-        with logger.use_operator_logger(self) as op_log:
+        from .ycd.ycdexport import export_ycd, clip_dictionary_export_scope
+        from .ymap.ymapexport import export_ymap
+
+        with logger.use_operator_logger(self, _get_log_filepath()) as op_log, clip_dictionary_export_scope():
             logger.info("Starting export...")
             prefs_export_settings = self if self.use_custom_settings else get_export_settings()
             objs = _collect_objects_for_export(context, prefs_export_settings.limit_to_selected)
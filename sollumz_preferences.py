@@ -22,7 +22,10 @@ from bpy.props import (
 from bpy_extras.io_utils import ImportHelper
 import rna_keymap_ui
 import os
+import io
 import ast
+import time
+import atexit
 import textwrap
 from typing import Optional, Any, TYPE_CHECKING
 from configparser import ConfigParser
@@ -126,6 +129,27 @@ class ExportSettingsBase:
         update=_on_update_thunk,
     )
 
+    ycd_keyframe_reduction: BoolProperty(
+        name="Keyframe Reduction",
+        description=(
+            "Reduce the sampled animation frames to constant and linear spans within the tolerance before encoding "
+            "them, and pick the smallest channel type for each track. Produces smaller clip dictionaries at the cost "
+            "of some precision"
+        ),
+        default=False,
+        update=_on_update_thunk,
+    )
+
+    ycd_keyframe_reduction_tolerance: FloatProperty(
+        name="Tolerance",
+        description="Maximum difference allowed between the exported values and the original animation values",
+        default=0.0005,
+        min=0.0,
+        soft_max=0.01,
+        precision=5,
+        update=_on_update_thunk,
+    )
+
     apply_transforms: BoolProperty(
         name="Apply Parent Transforms",
         description="Apply Drawable/Fragment scale and rotation",
@@ -249,6 +273,17 @@ class ImportSettingsBase:
         update=_on_update_thunk,
     )
 
+    ynv_bulk_import: BoolProperty(
+        name="Bulk Import",
+        description=(
+            "If enabled, all points and all portals of each navmesh are imported as a single mesh object each, with "
+            "their properties stored as attributes, instead of creating an object per point and portal. Recommended "
+            "when importing many navmeshes"
+        ),
+        default=False,
+        update=_on_update_thunk,
+    )
+
     ytyp_mlo_instance_entities: BoolProperty(
         name="Instance MLO Entities",
         description=(
@@ -734,6 +769,16 @@ class SollumzAddonPreferences(AddonPreferences):
         update=_save_preferences_on_update
     )
 
+    write_log_file: BoolProperty(
+        name="Write Import/Export Log File",
+        description=(
+            "Write all messages logged during import and export to a log file in the Sollumz config directory. The "
+            "Info Log only shows a limited number of messages, with repeated messages shown once"
+        ),
+        default=False,
+        update=_save_preferences_on_update
+    )
+
     popup_shown_install_dependencies: BoolProperty(
         default=False,
         update=_save_preferences_on_update
@@ -1001,8 +1046,15 @@ class SollumzAddonPreferences(AddonPreferences):
         box.prop(settings, "ymap_model_occluders")
         box.prop(settings, "ymap_car_generators")
 
+        _section_header(box, "YCD")
+        box.prop(settings, "ycd_keyframe_reduction")
+        row = box.row()
+        row.enabled = settings.ycd_keyframe_reduction
+        row.prop(settings, "ycd_keyframe_reduction_tolerance")
+
         _line_separator(layout, factor=3.0)
         layout.prop(self, "legacy_import_export")
+        layout.prop(self, "write_log_file")
 
     def draw_keymap(self, context, layout: UILayout):
         wm = bpy.context.window_manager
@@ -1184,10 +1236,64 @@ def get_theme_settings(context: Optional[bpy.types.Context] = None) -> SollumzTh
     return get_addon_preferences(context).theme
 
 
+# Seconds without preference changes to wait before writing the preferences file
+PREFS_SAVE_DELAY = 0.5
+
+_prefs_dirty = False
+_prefs_last_change_time = 0.0
+# Contents of the preferences file the last time it was read or written
+_prefs_saved_content: Optional[str] = None
+
+
 def _save_preferences():
-    addon_prefs = get_addon_preferences(bpy.context)
+    """Marks the preferences as changed. The file is written once no more changes happen for ``PREFS_SAVE_DELAY``
+    seconds, so continuous changes (e.g. dragging a color slider) don't write it every time.
+    """
+    global _prefs_dirty, _prefs_last_change_time
+    _prefs_dirty = True
+    _prefs_last_change_time = time.monotonic()
+    if not bpy.app.timers.is_registered(_save_preferences_timer):
+        bpy.app.timers.register(_save_preferences_timer, first_interval=PREFS_SAVE_DELAY, persistent=True)
+
+
+def _save_preferences_timer() -> Optional[float]:
+    remaining_time = _prefs_last_change_time + PREFS_SAVE_DELAY - time.monotonic()
+    if remaining_time > 0.0:
+        return remaining_time
+
+    _flush_preferences()
+    return None
+
+
+def _flush_preferences():
+    """Writes the preferences file now if there are pending changes."""
+    global _prefs_dirty, _prefs_saved_content
+    if not _prefs_dirty:
+        return
+
+    _prefs_dirty = False
+    content = _serialize_preferences(get_addon_preferences(bpy.context))
+    if content == _prefs_saved_content:
+        return
+
+    # Write to a temporary file first so the preferences file is never left partially written
     prefs_path = get_prefs_path()
+    tmp_prefs_path = f"{prefs_path}.tmp"
+    with open(tmp_prefs_path, "w") as f:
+        f.write(content)
+    os.replace(tmp_prefs_path, prefs_path)
+    _prefs_saved_content = content
 
+
+def _flush_preferences_at_exit():
+    try:
+        _flush_preferences()
+    except Exception:
+        # The add-on preferences may no longer be accessible this late
+        pass
+
+
+def _serialize_preferences(addon_prefs: "SollumzAddonPreferences") -> str:
     config = ConfigParser()
     prefs_dict = _get_bpy_struct_as_dict(addon_prefs)
     main_prefs: dict[str, Any] = {}
@@ -1201,8 +1307,9 @@ def _save_preferences():
 
     config["main"] = main_prefs
 
-    with open(prefs_path, "w") as f:
-        config.write(f)
+    content = io.StringIO()
+    config.write(content)
+    return content.getvalue()
 
 
 def _load_preferences():
@@ -1215,8 +1322,12 @@ def _load_preferences():
     if not os.path.isfile(prefs_path):
         return
 
+    global _prefs_saved_content
+    with open(prefs_path, "r") as f:
+        _prefs_saved_content = f.read()
+
     config = ConfigParser()
-    config.read(prefs_path)
+    config.read_string(_prefs_saved_content)
     config_dict = {}
     for section in config.keys():
         if section == "DEFAULT":
@@ -1318,7 +1429,12 @@ def get_config_directory_path() -> str:
 def register():
     bpy.utils.register_class(SollumzAddonPreferences)
     _update_name_tables()
+    atexit.register(_flush_preferences_at_exit)
 
 
 def unregister():
+    atexit.unregister(_flush_preferences_at_exit)
+    if bpy.app.timers.is_registered(_save_preferences_timer):
+        bpy.app.timers.unregister(_save_preferences_timer)
+    _flush_preferences()
     bpy.utils.unregister_class(SollumzAddonPreferences)
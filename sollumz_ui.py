@@ -1,6 +1,5 @@
 import bpy
 from bl_ui.space_statusbar import STATUSBAR_HT_header
-from typing import Optional
 
 from .ydr.operators.materials import SOLLUMZ_OT_convert_active_material_to_selected, SOLLUMZ_OT_auto_convert_current_material
 from .sollumz_preferences import get_addon_preferences, get_export_settings, get_import_settings, SollumzImportSettings, SollumzExportSettings
@@ -10,7 +9,7 @@ from .sollumz_properties import (
     MaterialType,
     SOLLUMZ_UI_NAMES,
 )
-from .sollumz_helper import find_sollumz_parent
+from .shared.lod_stats import get_object_active_lod_level
 from .lods import (
     LODLevel,
     SOLLUMZ_OT_set_lod_level,
@@ -224,6 +223,14 @@ class SOLLUMZ_PT_import_ymap(bpy.types.Panel, SollumzImportSettingsPanel):
         layout.prop(settings, "ymap_car_generators")
 
 
+class SOLLUMZ_PT_import_ynv(bpy.types.Panel, SollumzImportSettingsPanel):
+    bl_label = "Navmesh"
+    bl_order = 5
+
+    def draw_settings(self, layout: bpy.types.UILayout, settings: SollumzImportSettings):
+        layout.prop(settings, "ynv_bulk_import")
+
+
 class SOLLUMZ_PT_export_include(bpy.types.Panel, SollumzExportSettingsPanel):
     bl_label = "Include"
     bl_order = 0
@@ -279,6 +286,17 @@ class SOLLUMZ_PT_export_ymap(bpy.types.Panel, SollumzExportSettingsPanel):
         layout.prop(settings, "ymap_car_generators")
 
 
+class SOLLUMZ_PT_export_ycd(bpy.types.Panel, SollumzExportSettingsPanel):
+    bl_label = "Clip Dictionary"
+    bl_order = 6
+
+    def draw_settings(self, layout: bpy.types.UILayout, settings: SollumzExportSettings):
+        layout.prop(settings, "ycd_keyframe_reduction")
+        row = layout.row()
+        row.enabled = settings.ycd_keyframe_reduction
+        row.prop(settings, "ycd_keyframe_reduction_tolerance")
+
+
 class SOLLUMZ_PT_TOOL_PANEL(bpy.types.Panel):
     bl_label = "General"
     bl_idname = "SOLLUMZ_PT_TOOL_PANEL"
@@ -348,7 +366,7 @@ class SOLLUMZ_PT_VIEW_PANEL(GeneralToolChildPanel, bpy.types.Panel):
         layout.label(text="Level of Detail")
 
         active_obj = context.view_layer.objects.active
-        active_lod_level = self._get_object_active_lod_level(active_obj)
+        active_lod_level = get_object_active_lod_level(active_obj)
 
         grid = layout.grid_flow(align=True, row_major=True)
         grid.enabled = active_obj is not None and context.view_layer.objects.active.mode == "OBJECT"
@@ -361,28 +379,6 @@ class SOLLUMZ_PT_VIEW_PANEL(GeneralToolChildPanel, bpy.types.Panel):
             ).lod_level = lod_level
         grid.operator(SOLLUMZ_OT_hide_object.bl_idname, depress=active_lod_level == "hidden")
 
-    def _get_object_active_lod_level(self, obj: Optional[bpy.types.Object]) -> Optional[str]:
-        if obj is None:
-            return None
-
-        parent_obj = find_sollumz_parent(obj)
-        if parent_obj is None:
-            return None
-
-        active_lod_level = None
-        if parent_obj.hide_get():
-            active_lod_level = "hidden"
-        else:
-            for child in parent_obj.children_recursive:
-                if child.type == "MESH" and child.sollum_type == SollumType.DRAWABLE_MODEL:
-                    # Simply use the LOD level of the first model we find. Might not be accurate if the user
-                    # manually changes LODs of the models separately instead of using the buttons in the tools
-                    # panel, but in general this should be enough.
-                    active_lod_level = child.sz_lods.active_lod_level
-                    break
-
-        return active_lod_level
-
 
 class SOLLUMZ_PT_OBJ_YMAP_LOCATION(GeneralToolChildPanel, bpy.types.Panel):
     bl_label = "Object Location & Rotation Tools"
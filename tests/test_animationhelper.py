@@ -0,0 +1,29 @@
+import numpy as np
+from numpy.testing import assert_allclose
+from mathutils import Quaternion
+from ..tools.animationhelper import quaternions_multiply, quaternions_make_compatible
+
+
+def test_quaternions_make_compatible():
+    quats = np.random.default_rng(0).normal(size=(100, 4))
+
+    expected_quats = []
+    prev_quat = None
+    for quat in quats:
+        quat = Quaternion(quat)
+        if prev_quat is not None and prev_quat.dot(quat) < 0:
+            quat *= -1
+        expected_quats.append(quat)
+        prev_quat = quat
+
+    assert_allclose(quaternions_make_compatible(quats), expected_quats)
+
+
+def test_quaternions_multiply():
+    rng = np.random.default_rng(0)
+    quats_a = rng.normal(size=(100, 4))
+    quats_b = rng.normal(size=(100, 4))
+
+    expected_quats = [Quaternion(a) @ Quaternion(b) for a, b in zip(quats_a, quats_b)]
+
+    assert_allclose(quaternions_multiply(quats_a, quats_b), expected_quats, rtol=1e-6, atol=1e-6)
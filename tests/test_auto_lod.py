@@ -0,0 +1,62 @@
+import math
+import bpy
+from ..ydr.auto_lod import (
+    LodMeshStats,
+    ModelLodSummary,
+    format_lod_summary_table,
+    get_lods_below,
+    mesh_bounding_radius,
+    mesh_triangle_count,
+)
+from ..sollumz_properties import LODLevel, SollumType
+
+
+def test_mesh_triangle_count(cube_object):
+    assert mesh_triangle_count(cube_object.data) == 12
+
+
+def test_mesh_bounding_radius(cube_object):
+    assert math.isclose(mesh_bounding_radius(cube_object.data), math.sqrt(3.0), rel_tol=1e-6)
+
+
+def test_format_lod_summary_table():
+    lods = (LODLevel.HIGH, LODLevel.MEDIUM)
+    summaries = [
+        ModelLodSummary("model_a", "model_a.high", [LodMeshStats(LODLevel.HIGH, 120, 80)], 1.0, []),
+        ModelLodSummary(
+            "b", "b.high", [LodMeshStats(LODLevel.HIGH, 12, 8), LodMeshStats(LODLevel.MEDIUM, 6, 5)], 1.0, []
+        ),
+    ]
+
+    table = format_lod_summary_table(summaries, lods)
+
+    assert len(table) == 3
+    assert len({len(row) for row in table}) == 1
+    assert table[1].startswith("model_a | 120 tris / 80 verts")
+    assert table[1].rstrip().endswith("-")
+    assert table[2].rstrip().endswith("6 tris / 5 verts")
+
+
+def test_get_lods_below():
+    lods = (LODLevel.HIGH, LODLevel.MEDIUM, LODLevel.LOW)
+
+    assert get_lods_below(lods, LODLevel.HIGH) == (LODLevel.MEDIUM, LODLevel.LOW)
+    assert get_lods_below(lods, LODLevel.LOW) == ()
+    assert get_lods_below(lods, None) == lods
+
+
+def test_auto_lod_batch_keeps_reference_mesh(context, cube_object):
+    cube_object.sollum_type = SollumType.DRAWABLE_MODEL
+    high_mesh = cube_object.data
+    high_mesh_name = high_mesh.name
+    cube_object.sz_lods.get_lod(LODLevel.HIGH).mesh = high_mesh
+
+    assert LODLevel.HIGH in context.scene.sollumz_auto_lod_settings.levels
+
+    result = bpy.ops.sollumz.auto_lod_batch()
+
+    assert result == {"FINISHED"}
+    lods = cube_object.sz_lods
+    assert lods.get_lod(LODLevel.HIGH).mesh == bpy.data.meshes[high_mesh_name]
+    assert len(lods.get_lod(LODLevel.HIGH).mesh.polygons) == 6
+    assert lods.get_lod(LODLevel.MEDIUM).mesh is not None
@@ -28,3 +28,13 @@ def test_cli_perf_ie(tmp_path: Path):
     assert rows[0][0] == "file"
     assert rows[1][0] == "sollumz_cube.ydr.xml"
     assert rows[2][0] == "sollumz_cube.yft.xml"
+
+
+def test_cli_bench_shrink_mesh(capsys):
+    from ..cli.command_bench_shrink_mesh import main
+
+    ret = main(["-f", "100", "500", "-r", "1"])
+
+    assert ret == 0
+    output_lines = capsys.readouterr().out.strip().splitlines()
+    assert len(output_lines) == 4, "Output should have 4 lines (header + separator + 2 hulls)"
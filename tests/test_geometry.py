@@ -41,3 +41,74 @@ def test_geometry_shrink_mesh(test_data_file_name):
                   f"   diff={output_vertex - expected_vertex}\n")
 
     assert n == 0, f"{n} / {len(output_vertices)}{s}"
+
+
+def test_geometry_shrunk_vertex_collision():
+    from ..shared.geometry import _any_shrunk_vertex_collision
+
+    # Two parallel triangles, and one vertex of the lower triangle shrunk through the upper one
+    vertices = np.array([
+        [0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0],
+        [-1.0, -1.0, 0.5], [2.0, -1.0, 0.5], [-1.0, 2.0, 0.5],
+    ])
+    faces = np.array([[0, 1, 2], [3, 4, 5]])
+
+    shrunk_vertices = vertices.copy()
+    shrunk_vertices[0] = [0.25, 0.25, 0.25]
+    assert not _any_shrunk_vertex_collision(vertices, shrunk_vertices, faces)
+
+    shrunk_vertices[0] = [0.25, 0.25, 1.0]
+    assert _any_shrunk_vertex_collision(vertices, shrunk_vertices, faces)
+
+
+def _any_shrunk_vertex_collision_reference(mesh_vertices, shrunk_vertices, mesh_faces) -> bool:
+    """Original per-vertex implementation with ``intersect_ray_tri``."""
+    from mathutils import Vector, geometry
+
+    for vert_idx in range(len(mesh_vertices)):
+        segment_pos = Vector(shrunk_vertices[vert_idx])
+        segment_dir = Vector(mesh_vertices[vert_idx] - shrunk_vertices[vert_idx])
+        segment_length = segment_dir.length
+        if segment_length == 0.0:
+            continue
+        segment_dir /= segment_length
+
+        for poly_verts in mesh_faces:
+            if (poly_verts == vert_idx).any():
+                continue
+
+            for verts in (mesh_vertices, shrunk_vertices):
+                v1, v2, v3 = [Vector(verts[vi]) for vi in poly_verts]
+                intersect_pos = geometry.intersect_ray_tri(v1, v2, v3, segment_dir, segment_pos)
+                if intersect_pos is not None and (intersect_pos - segment_pos).length <= segment_length:
+                    return True
+
+    return False
+
+
+@pytest.mark.parametrize("seed", (0, 1, 2, 3))
+def test_geometry_shrunk_vertex_collision_matches_reference(seed):
+    import bmesh
+    from ..shared.geometry import _any_shrunk_vertex_collision, _compute_neighbors, _shrink_polys
+
+    rng = np.random.default_rng(seed)
+    points = rng.normal(size=(40, 3))
+    points /= np.linalg.norm(points, axis=1, keepdims=True)
+    points *= rng.uniform(0.1, 2.0, size=3)
+
+    bm = bmesh.new()
+    for p in points:
+        bm.verts.new(p)
+    bmesh.ops.convex_hull(bm, input=bm.verts, use_existing_faces=False)
+    bmesh.ops.delete(bm, geom=[v for v in bm.verts if not v.link_faces], context="VERTS")
+    bmesh.ops.triangulate(bm, faces=bm.faces)
+    bm.verts.index_update()
+    vertices = np.array([v.co for v in bm.verts], dtype=np.float64)
+    faces = np.array([[v.index for v in f.verts] for f in bm.faces], dtype=np.int64)
+    bm.free()
+
+    neighbors = _compute_neighbors(vertices, faces)
+    for margin in (0.01, 0.04, 0.1, 0.3, 0.6):
+        shrunk_vertices = _shrink_polys(vertices, faces, neighbors, margin)
+        expected = _any_shrunk_vertex_collision_reference(vertices, shrunk_vertices, faces)
+        assert _any_shrunk_vertex_collision(vertices, shrunk_vertices, faces) == expected, f"margin={margin}"
@@ -233,6 +233,8 @@ DEFAULT_EXPORT_SETTINGS = {
     "ymap_box_occluders": False,
     "ymap_model_occluders": False,
     "ymap_car_generators": False,
+    "ycd_keyframe_reduction": False,
+    "ycd_keyframe_reduction_tolerance": 0.0005,
     "apply_transforms": False,
     "mesh_domain": "FACE_CORNER"
 }
@@ -250,6 +252,7 @@ DEFAULT_IMPORT_SETTINGS = {
     "ymap_car_generators": False,
     "ymap_instance_entities": False,
     "ytyp_mlo_instance_entities": True,
+    "ynv_bulk_import": False,
     "textures_mode": "PACK",
     "textures_extract_custom_directory": "",
 }
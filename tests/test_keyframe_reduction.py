@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+from ..ycd.keyframe_reduction import reduce_component_values, find_linear_span_keys
+
+
+@pytest.mark.parametrize("tolerance", (0.0005, 0.01))
+def test_reduce_component_values_within_tolerance(tolerance):
+    rng = np.random.default_rng(0)
+    values = np.concatenate((
+        np.full(100, 0.3),
+        np.linspace(0.3, 2.0, 100),
+        np.sin(np.linspace(0.0, 10.0, 100)),
+    )) + rng.normal(0.0, tolerance * 0.01, 300)
+
+    reduced_values = reduce_component_values(values, tolerance)
+
+    assert reduced_values.shape == values.shape
+    assert np.abs(reduced_values - values).max() <= tolerance + 1e-9
+    assert len(np.unique(reduced_values)) < len(np.unique(values))
+
+
+def test_reduce_component_values_constant():
+    values = 1.0 + np.random.default_rng(0).uniform(-0.0001, 0.0001, 50)
+
+    reduced_values = reduce_component_values(values, 0.0005)
+
+    assert len(np.unique(reduced_values)) == 1
+
+
+def test_find_linear_span_keys():
+    values = np.concatenate((np.linspace(0.0, 1.0, 11), np.linspace(1.0, 0.0, 11)[1:]))
+
+    keys = find_linear_span_keys(values, 1e-6)
+
+    assert list(keys) == [0, 10, 20]
@@ -0,0 +1,16 @@
+import bpy
+from ..shared.lod_stats import get_mesh_stats
+
+
+def test_get_mesh_stats(cube_object):
+    mesh = cube_object.data
+
+    assert get_mesh_stats(mesh) == (12, 8, 0)
+
+    mat = bpy.data.materials.new("lod_stats_test")
+    mesh.materials.append(mat)
+    bpy.context.view_layer.update()
+
+    assert get_mesh_stats(mesh) == (12, 8, 1)
+
+    bpy.data.materials.remove(mat)
@@ -0,0 +1,44 @@
+from ..logger import AggregatingLogger, LogFileWriter
+from .shared import TestLogger
+
+
+def test_aggregating_logger_dedupes_and_limits_messages():
+    target = TestLogger()
+    aggregating_logger = AggregatingLogger(target, max_reports=3)
+
+    for _ in range(1000):
+        aggregating_logger.do_log("Missing texture", "WARNING")
+    for i in range(10):
+        aggregating_logger.do_log(f"Message {i}", "INFO")
+    aggregating_logger.do_log("Failed", "ERROR")
+
+    assert target.warnings == ["Missing texture"]
+    assert target.errors == ["Failed"]
+    assert aggregating_logger.has_warnings_or_errors
+
+    aggregating_logger.flush()
+
+    assert target.warnings == [
+        "Missing texture",
+        "Missing texture (repeated 1000 times)",
+    ]
+    assert target._logs["INFO"] == [
+        "Message 0",
+        "Message 1",
+        "8 more message(s) not shown.",
+    ]
+
+
+def test_aggregating_logger_writes_all_messages_to_log_file(tmp_path):
+    log_filepath = tmp_path / "test.log"
+    log_file = LogFileWriter(str(log_filepath))
+    aggregating_logger = AggregatingLogger(TestLogger(), max_reports=1, log_file=log_file)
+
+    for i in range(100):
+        aggregating_logger.do_log("Missing texture", "WARNING")
+        aggregating_logger.do_log(f"Message {i}", "INFO")
+    log_file.close()
+
+    lines = log_filepath.read_text().splitlines()
+    assert len(lines) == 200
+    assert lines[:2] == ["WARNING: Missing texture", "INFO: Message 0"]
@@ -0,0 +1,68 @@
+import bpy
+import numpy as np
+import pytest
+from ..ydr.material_atlas import (
+    AtlasRegion,
+    AtlasSource,
+    fit_rects,
+    get_atlas_key,
+    get_sources_pixels,
+    get_uv_tiles,
+    remap_uvs_to_atlas,
+    resample_tiled,
+)
+
+
+@pytest.mark.parametrize("padding", (0, 4))
+def test_fit_rects_no_overlap(padding):
+    sizes = [(512, 512), (256, 1024), (300, 200), (1024, 1024), (64, 64)]
+
+    scaled_sizes, positions = fit_rects(sizes, 1024, padding)
+
+    rects = [(x - padding, y - padding, w + padding * 2, h + padding * 2)
+             for (w, h), (x, y) in zip(scaled_sizes, positions)]
+    for i, (ax, ay, aw, ah) in enumerate(rects):
+        assert ax >= 0 and ay >= 0 and ax + aw <= 1024 and ay + ah <= 1024
+        for bx, by, bw, bh in rects[i + 1:]:
+            assert ax + aw <= bx or bx + bw <= ax or ay + ah <= by or by + bh <= ay
+
+
+def test_fit_rects_keeps_size_if_fits():
+    sizes = [(256, 256), (256, 128)]
+
+    scaled_sizes, _ = fit_rects(sizes, 1024, 2)
+
+    assert scaled_sizes == sizes
+
+
+def test_remap_uvs_to_atlas_samples_same_texels():
+    atlas_size = 128
+    src = np.random.default_rng(0).random((16, 8, 4)).astype(np.float32)
+    uvs = np.random.default_rng(1).uniform(-0.5, 1.5, (200, 2)).astype(np.float32)
+    uv_origin, uv_tiles = get_uv_tiles(uvs)
+    region = AtlasRegion(uv_origin, uv_tiles, (10, 20), (uv_tiles[0] * 16, uv_tiles[1] * 32))
+
+    atlas = np.zeros((atlas_size, atlas_size, 4), dtype=np.float32)
+    x, y = region.position
+    w, h = region.size
+    atlas[y:y + h, x:x + w] = resample_tiled(src, region.uv_tiles, region.size)
+    atlas_uvs = remap_uvs_to_atlas(uvs, region, atlas_size)
+
+    atlas_texels = atlas[(atlas_uvs[:, 1] * atlas_size).astype(int), (atlas_uvs[:, 0] * atlas_size).astype(int)]
+    src_texels = src[np.floor(uvs[:, 1] * 16).astype(int) % 16, np.floor(uvs[:, 0] * 8).astype(int) % 8]
+    np.testing.assert_allclose(atlas_texels, src_texels)
+
+
+def test_get_atlas_key_changes_with_source_pixels():
+    image = bpy.data.images.new("atlas_key_test_image", width=8, height=8)
+    sources = [AtlasSource(0, image, None)]
+    regions = [AtlasRegion((0, 0), (1, 1), (0, 0), (8, 8))]
+
+    key = get_atlas_key(sources, regions, 64, 0, get_sources_pixels(sources))
+    assert get_atlas_key(sources, regions, 64, 0, get_sources_pixels(sources)) == key
+
+    # Repainted with the same name and size
+    image.pixels.foreach_set(np.ones(8 * 8 * 4, dtype=np.float32))
+    assert get_atlas_key(sources, regions, 64, 0, get_sources_pixels(sources)) != key
+
+    bpy.data.images.remove(image)
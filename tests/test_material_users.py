@@ -0,0 +1,25 @@
+import bpy
+from ..shared.material_users import get_material_users_index
+
+
+def test_material_users_index(context, cube_object, plane_object):
+    mat = bpy.data.materials.new("material_users_test")
+    try:
+        cube_object.data.materials.append(mat)
+
+        index = get_material_users_index(context)
+        assert index.get_objects(mat) == [cube_object]
+
+        plane_object.data.materials.append(mat)
+
+        index = get_material_users_index(context)
+        assert set(index.get_objects(mat)) == {cube_object, plane_object}
+
+        cube_object.data.materials.clear()
+
+        index = get_material_users_index(context)
+        assert index.get_objects(mat) == [plane_object]
+        assert index.get_meshes(mat) == [plane_object.data]
+        assert index.get_mesh_objects(plane_object.data) == [plane_object]
+    finally:
+        bpy.data.materials.remove(mat)
@@ -0,0 +1,45 @@
+import numpy as np
+from numpy.testing import assert_array_equal
+from ..ydr.ydrexport_io import join_vert_arrs, join_ind_arrs, split_vert_buffers
+from szio.gta5 import STANDARD_VERTEX_ATTR_DTYPES
+
+
+def test_join_vert_arrs_different_layouts():
+    arr_a = np.zeros(2, dtype=[STANDARD_VERTEX_ATTR_DTYPES["Position"], STANDARD_VERTEX_ATTR_DTYPES["Normal"]])
+    arr_a["Position"] = [[1, 2, 3], [4, 5, 6]]
+    arr_a["Normal"] = [[0, 0, 1], [0, 1, 0]]
+    arr_b = np.zeros(1, dtype=[STANDARD_VERTEX_ATTR_DTYPES["Position"]])
+    arr_b["Position"] = [[7, 8, 9]]
+
+    joined_arr = join_vert_arrs([arr_a, arr_b])
+
+    assert joined_arr.dtype.names == ("Position", "Normal")
+    assert_array_equal(joined_arr["Position"], [[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+    assert_array_equal(joined_arr["Normal"], [[0, 0, 1], [0, 1, 0], [0, 0, 0]])
+
+
+def test_join_ind_arrs_offsets_by_vert_counts():
+    ind_arrs = [
+        np.array([0, 1, 2], dtype=np.uint32),
+        np.array([1, 0, 2, 2, 1, 3], dtype=np.uint32),
+        np.array([0, 0, 0], dtype=np.uint32),
+    ]
+
+    joined_ind_arr = join_ind_arrs(ind_arrs, [3, 4, 1])
+
+    assert joined_ind_arr.dtype == np.uint32
+    assert_array_equal(joined_ind_arr, [0, 1, 2, 4, 3, 5, 5, 4, 6, 7, 7, 7])
+
+
+def test_split_vert_buffers():
+    num_verts = 70000
+    vert_buffer = np.zeros(num_verts, dtype=[STANDARD_VERTEX_ATTR_DTYPES["Position"]])
+    vert_buffer["Position"][:, 0] = np.arange(num_verts)
+    ind_buffer = np.random.default_rng(0).integers(0, num_verts, num_verts * 3, dtype=np.uint32)
+
+    vert_buffers, ind_buffers = split_vert_buffers(vert_buffer, ind_buffer)
+
+    assert len(vert_buffers) == len(ind_buffers) == 4
+    assert all(len(b) <= 65535 for b in ind_buffers)
+    split_verts = np.concatenate([v[i] for v, i in zip(vert_buffers, ind_buffers)])
+    assert_array_equal(split_verts, vert_buffer[ind_buffer])
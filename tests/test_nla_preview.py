@@ -0,0 +1,64 @@
+import math
+import bpy
+from ..ycd.nla_preview import build_clip_dictionary_nla_preview, _preview_track_name
+from ..ycd.ycdimport import create_anim_obj, create_clip_dictionary_template
+from ..tools.animationhelper import get_scene_fps
+from ..sollumz_properties import SollumType
+
+
+def create_clip(clips_obj, animation_obj, name, start_frame, end_frame):
+    clip_obj = create_anim_obj(SollumType.CLIP)
+    clip_obj.name = name
+    clip_obj.parent = clips_obj
+    clip_obj.clip_properties.duration = (end_frame - start_frame) / get_scene_fps()
+    clip_animation = clip_obj.clip_properties.animations.add()
+    clip_animation.animation = animation_obj
+    clip_animation.start_frame = start_frame
+    clip_animation.end_frame = end_frame
+    return clip_obj
+
+
+def test_build_clip_dictionary_nla_preview_rebuild_changed_first_clip():
+    armature = bpy.data.armatures.new("nla_preview_armature")
+    armature_obj = bpy.data.objects.new("nla_preview_armature", armature)
+    bpy.context.collection.objects.link(armature_obj)
+
+    # Clips sharing a single long action with different ranges
+    action = bpy.data.actions.new("nla_preview_action")
+    fcurve = action.fcurves.new("location", index=0)
+    fcurve.keyframe_points.insert(0.0, 0.0)
+    fcurve.keyframe_points.insert(120.0, 1.0)
+
+    clip_dictionary_obj, clips_obj, animations_obj = create_clip_dictionary_template("nla_preview_dict")
+    animation_obj = create_anim_obj(SollumType.ANIMATION)
+    animation_obj.parent = animations_obj
+    animation_obj.animation_properties.target_id = armature
+    animation_obj.animation_properties.action = action
+
+    clip_a = create_clip(clips_obj, animation_obj, "clip_a", 0.0, 40.0)
+    create_clip(clips_obj, animation_obj, "clip_b", 40.0, 80.0)
+    create_clip(clips_obj, animation_obj, "clip_c", 80.0, 120.0)
+
+    layout = build_clip_dictionary_nla_preview(clip_dictionary_obj)
+    track = armature_obj.animation_data.nla_tracks[_preview_track_name(0)]
+    strip_b = track.strips["clip_b"]
+    strip_b_frame_range = (strip_b.frame_start, strip_b.frame_end)
+
+    # Change only the range of the first clip, its strip is created again at the same start frame
+    clip_a.clip_properties.animations[0].start_frame = 10.0
+    new_layout = build_clip_dictionary_nla_preview(clip_dictionary_obj)
+
+    assert new_layout["clip_b"].frame_start == layout["clip_b"].frame_start
+    assert new_layout["clip_c"].frame_start == layout["clip_c"].frame_start
+
+    strips = sorted(track.strips, key=lambda s: s.frame_start)
+    assert [s.name for s in strips] == ["clip_a", "clip_b", "clip_c"]
+
+    strip_a, strip_b, strip_c = strips
+    assert math.isclose(strip_a.action_frame_start, 10.0, abs_tol=1e-4)
+    assert math.isclose(strip_a.action_frame_end, 40.0, abs_tol=1e-4)
+    assert math.isclose(strip_a.frame_end, layout["clip_a"].frame_end, abs_tol=1e-4)
+    assert math.isclose(strip_b.frame_start, strip_b_frame_range[0], abs_tol=1e-4)
+    assert math.isclose(strip_b.frame_end, strip_b_frame_range[1], abs_tol=1e-4)
+    assert math.isclose(strip_b.action_frame_start, 40.0, abs_tol=1e-4)
+    assert math.isclose(strip_c.action_frame_start, 80.0, abs_tol=1e-4)
@@ -0,0 +1,93 @@
+import math
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+from mathutils import Euler, Matrix, Vector
+from ..tools.obb import box_coords, generate_vectors_structured, get_obb, get_obb_extents
+
+
+def get_obb_reference(verts: list[Vector], num_samples: int, angle_step: int) -> tuple[list[Vector], Matrix]:
+    """Original brute-force search, one ``Matrix.Rotation`` per axis and angle. Only the resulting box and matrix are
+    compared, so the convex hull is skipped (it does not change the bounding boxes)."""
+    def bbox_orient(verts, mx):
+        verts = [mx @ v for v in verts]
+        xs = [v[0] for v in verts]
+        ys = [v[1] for v in verts]
+        zs = [v[2] for v in verts]
+        return (min(xs), max(xs), min(ys), max(ys), min(zs), max(zs))
+
+    def bbox_vol(box):
+        return max(box[1] - box[0], 0.0001) * max(box[3] - box[2], 0.0001) * max(box[5] - box[4], 0.0001)
+
+    min_mx = Matrix.Identity(4)
+    min_box = bbox_orient(verts, min_mx)
+    min_V = bbox_vol(min_box)
+    for axis in generate_vectors_structured(num_samples):
+        for n in range(0, 720, angle_step):
+            rot_mx = Matrix.Rotation(math.pi * n / 360, 4, axis)
+            box = bbox_orient(verts, rot_mx)
+            test_V = bbox_vol(box)
+            if test_V < min_V:
+                min_V = test_V
+                min_box = box
+                min_mx = rot_mx
+
+    return box_coords(min_box), min_mx.inverted_safe()
+
+
+def obb_volume(obb: list[Vector]) -> float:
+    bbmin, bbmax = get_obb_extents(obb)
+    size = bbmax - bbmin
+    return size.x * size.y * size.z
+
+
+def assert_same_world_box(
+    obb: list[Vector], world_matrix: Matrix, expected_obb: list[Vector], expected_world_matrix: Matrix
+):
+    # Boxes that only differ by a symmetry of the box (e.g. a 90 degrees rotation) have the same corners, in any order
+    corners = np.array([world_matrix @ v for v in obb])
+    expected_corners = np.array([expected_world_matrix @ v for v in expected_obb])
+    distances = np.linalg.norm(corners[:, np.newaxis] - expected_corners[np.newaxis, :], axis=2)
+    assert_allclose(distances.min(axis=1), 0.0, atol=1e-4)
+    assert_allclose(distances.min(axis=0), 0.0, atol=1e-4)
+
+
+def box_verts(rotation: Euler) -> list[Vector]:
+    mx = rotation.to_matrix()
+    return [mx @ Vector((x, y, z)) for x in (0.0, 2.0) for y in (0.0, 1.0) for z in (0.0, 0.5)]
+
+
+def random_verts() -> list[Vector]:
+    points = np.random.default_rng(0).normal(size=(30, 3)) * (2.0, 1.0, 0.5)
+    return [Vector(p) for p in points]
+
+
+OBB_TEST_VERTS = {
+    "axis_aligned_box": box_verts(Euler((0.0, 0.0, 0.0))),
+    "rotated_box": box_verts(Euler((0.3, 0.5, 0.7))),
+    "random_points": random_verts(),
+}
+
+
+@pytest.mark.parametrize("verts_name", OBB_TEST_VERTS.keys())
+def test_get_obb_matches_reference(verts_name):
+    verts = OBB_TEST_VERTS[verts_name]
+
+    obb, world_matrix = get_obb(verts, 50, 10)
+    expected_obb, expected_world_matrix = get_obb_reference(verts, 50, 10)
+
+    assert math.isclose(obb_volume(obb), obb_volume(expected_obb), rel_tol=1e-4)
+    assert_same_world_box(obb, world_matrix, expected_obb, expected_world_matrix)
+    if verts_name == "random_points":
+        # No symmetries, so the same rotation must be found
+        assert_allclose(np.array(world_matrix), np.array(expected_world_matrix), atol=1e-4)
+
+
+@pytest.mark.parametrize("verts_name", OBB_TEST_VERTS.keys())
+def test_get_obb_refine_never_increases_volume(verts_name):
+    verts = OBB_TEST_VERTS[verts_name]
+
+    obb, _ = get_obb(verts, 50, 10)
+    refined_obb, _ = get_obb(verts, 50, 10, refine=True)
+
+    assert obb_volume(refined_obb) <= obb_volume(obb) * (1.0 + 1e-6)
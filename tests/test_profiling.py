@@ -0,0 +1,42 @@
+import json
+from .. import profiling
+
+
+@profiling.traced()
+def traced_fn(n: int):
+    profiling.count("items", n)
+
+
+def test_profiling_spans_are_nested_and_aggregated(tmp_path):
+    trace_path = tmp_path / "test.trace.json"
+    with profiling.profiling_session("test", trace_path, print_report=False) as session:
+        with profiling.span("outer"):
+            traced_fn(2)
+            traced_fn(3)
+        traced_fn(1)
+
+    assert not profiling.is_profiling()
+
+    outer = session.root.children["outer"]
+    assert outer.num_calls == 1
+    assert outer.children["traced_fn"].num_calls == 2
+    assert outer.children["traced_fn"].counters == {"items": 5}
+    assert session.root.children["traced_fn"].counters == {"items": 1}
+    assert outer.total_time >= outer.children["traced_fn"].total_time
+
+    report = session.format_report()
+    assert report[0].startswith("Span")
+    assert any(line.startswith("    traced_fn") for line in report)
+
+    trace = json.loads(trace_path.read_text())
+    events = trace["traceEvents"]
+    assert [e["name"] for e in events] == ["traced_fn", "traced_fn", "outer", "traced_fn"]
+    assert all(e["ph"] == "X" and e["dur"] >= 0 for e in events)
+    assert events[0]["args"] == {"items": 2}
+
+
+def test_profiling_disabled_is_noop():
+    assert not profiling.is_profiling()
+    with profiling.span("not recorded"):
+        traced_fn(1)
+    profiling.count("not recorded")
@@ -0,0 +1,35 @@
+import os
+from ..shared.ui_collections import load_xml_file_cached
+
+
+class FakeFile:
+    num_parsed = 0
+
+    def __init__(self, text: str):
+        self.text = text
+
+    @classmethod
+    def from_xml_file(cls, path):
+        cls.num_parsed += 1
+        with open(path) as f:
+            return cls(f.read())
+
+
+def test_load_xml_file_cached_reparses_only_when_modified(tmp_path):
+    path = tmp_path / "presets.xml"
+    path.write_text("<A/>")
+
+    file1 = load_xml_file_cached(str(path), FakeFile)
+    file2 = load_xml_file_cached(str(path), FakeFile)
+
+    assert file1 is file2
+    assert FakeFile.num_parsed == 1
+
+    path.write_text("<AB/>")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    file3 = load_xml_file_cached(str(path), FakeFile)
+
+    assert file3 is not file1
+    assert file3.text == "<AB/>"
+    assert FakeFile.num_parsed == 2
@@ -556,6 +556,116 @@ def test_ops_vertex_paint_transfer_channels_between_attributes_on_different_doma
     bpy.ops.object.mode_set(mode="OBJECT")
 
 
+@pytest.mark.parametrize("src_domain, dst_domain", (
+    ("CORNER", "CORNER"),
+    ("POINT", "CORNER"),
+    ("CORNER", "POINT"),
+))
+def test_ops_vertex_paint_transfer_channels_selected_objects(src_domain, dst_domain, context, four_plane_objects):
+    src_colors = (
+        (0.1, 0.2, 0.3, 0.4),
+        (0.5, 0.6, 0.7, 0.8),
+        (0.2, 0.4, 0.6, 0.8),
+        (0.3, 0.5, 0.7, 0.9),
+    )
+    placeholder = 0.9
+    obj0, obj1, obj2, obj3 = four_plane_objects
+
+    for obj_idx, obj in enumerate(four_plane_objects):
+        mesh = obj.data
+        src_attr = mesh.attributes.new("MySrc", "FLOAT_COLOR", src_domain)
+        dst_attr = mesh.attributes.new("MyDst", "FLOAT_COLOR", dst_domain)
+        for i in range(len(src_attr.data)):
+            src_attr.data[i].color_srgb = src_colors[obj_idx]
+        for i in range(len(dst_attr.data)):
+            dst_attr.data[i].color_srgb = placeholder, placeholder, placeholder, placeholder
+
+    context.view_layer.objects.active = obj0
+    bpy.ops.object.mode_set(mode="VERTEX_PAINT")
+
+    obj0.select_set(True)
+    obj1.select_set(False)
+    obj2.select_set(True)
+    obj3.select_set(True)
+
+    bpy.ops.sollumz.vertex_paint_transfer_channels(
+        src_attribute="MySrc",
+        dst_attribute="MyDst",
+        src_for_dst_r="ALPHA",
+        src_for_dst_g="NONE",
+        src_for_dst_b="RED",
+        src_for_dst_a="GREEN",
+        selected_objects=True,
+    )
+
+    for obj_idx, obj in enumerate(four_plane_objects):
+        r, g, b, a = src_colors[obj_idx]
+        expected_color = (
+            (placeholder, placeholder, placeholder, placeholder) if obj == obj1 else (a, placeholder, r, g)
+        )
+        dst_attr = obj.data.color_attributes["MyDst"]
+        for i in range(len(dst_attr.data)):
+            assert_allclose(dst_attr.data[i].color_srgb, expected_color, atol=COLOR_ATOL)
+
+    bpy.ops.object.mode_set(mode="OBJECT")
+
+
+@pytest.mark.parametrize("data_type", ("BYTE_COLOR", "FLOAT_COLOR"))
+@pytest.mark.parametrize("domain", ("CORNER", "POINT"))
+def test_ops_vertex_paint_isolate_channel_selected_objects(data_type, domain, context, four_plane_objects):
+    src_colors = (
+        (0.1, 0.2, 0.3, 0.4),
+        (0.5, 0.6, 0.7, 0.8),
+        (0.2, 0.4, 0.6, 0.8),
+        (0.3, 0.5, 0.7, 0.9),
+    )
+    obj0, obj1, obj2, obj3 = four_plane_objects
+
+    for obj_idx, obj in enumerate(four_plane_objects):
+        mesh = obj.data
+        attr = mesh.attributes.new("MyColor", data_type, domain)
+        mesh.attributes.active_color_name = "MyColor"
+        for i in range(len(attr.data)):
+            attr.data[i].color_srgb = src_colors[obj_idx]
+
+    context.view_layer.objects.active = obj0
+    bpy.ops.object.mode_set(mode="VERTEX_PAINT")
+
+    obj0.select_set(True)
+    obj1.select_set(True)
+    obj2.select_set(False)
+    obj3.select_set(True)
+
+    bpy.ops.sollumz.vertex_paint_isolate_toggle_channel(channel=1, selected_objects=True)
+    for obj_idx, obj in enumerate(four_plane_objects):
+        m = obj.data
+        if obj == obj2:
+            assert m.attributes.active_color_name == "MyColor"
+            assert len(m.color_attributes) == 1
+            continue
+
+        assert m.attributes.active_color_name != "MyColor"
+        assert len(m.color_attributes) == 2
+        for i in range(len(m.attributes.active_color.data)):
+            assert_allclose(
+                m.attributes.active_color.data[i].color_srgb, (0.0, src_colors[obj_idx][1], 0.0, 0.0), atol=COLOR_ATOL
+            )
+            m.attributes.active_color.data[i].color_srgb = 0.0, 0.25, 0.0, 0.0
+
+    bpy.ops.sollumz.vertex_paint_isolate_toggle_channel(channel=1, selected_objects=True)
+    for obj_idx, obj in enumerate(four_plane_objects):
+        m = obj.data
+        assert m.attributes.active_color_name == "MyColor"
+        assert len(m.color_attributes) == 1
+
+        r, g, b, a = src_colors[obj_idx]
+        expected_color = (r, g, b, a) if obj == obj2 else (r, 0.25, b, a)
+        for i in range(len(m.attributes.active_color.data)):
+            assert_allclose(m.attributes.active_color.data[i].color_srgb, expected_color, atol=COLOR_ATOL)
+
+    bpy.ops.object.mode_set(mode="OBJECT")
+
+
 @pytest.mark.parametrize("data_type", ("BYTE_COLOR", "FLOAT_COLOR"))
 @pytest.mark.parametrize("domain", ("CORNER", "POINT"))
 def test_ops_vertex_paint_multiproxy_enter_exit_without_modifications(data_type, domain, context, four_plane_objects):
@@ -1002,3 +1112,33 @@ def test_ops_vertex_paint_multiproxy_all_objects_deleted_before_exit(context, fo
     bpy.ops.sollumz.vertex_paint_multiproxy_exit()
 
     # bpy.ops.object.mode_set(mode="OBJECT") # no objects in the scene, can't change mode
+
+
+def test_ops_vertex_paint_multiproxy_keeps_uv_maps(context, four_plane_objects):
+    """The proxy has the UV maps of the objects, so textured viewport shading still works while painting."""
+    obj0, obj1, obj2, obj3 = four_plane_objects
+    for obj_idx, obj in enumerate(four_plane_objects):
+        obj.data.attributes.new("MyAttr", "FLOAT_COLOR", "CORNER")
+        uv_map = obj.data.uv_layers.active
+        for i in range(len(uv_map.uv)):
+            uv_map.uv[i].vector = (obj_idx * 0.1, i * 0.1)
+
+    context.view_layer.objects.active = obj0
+    bpy.ops.object.mode_set(mode="VERTEX_PAINT")
+
+    obj0.select_set(True)
+    obj1.select_set(True)
+    obj2.select_set(True)
+    obj3.select_set(True)
+
+    bpy.ops.sollumz.vertex_paint_multiproxy()
+    proxy_obj = context.active_object
+    proxy_uv_map = proxy_obj.data.uv_layers.active
+    assert proxy_uv_map is not None
+    assert proxy_uv_map.name == obj0.data.uv_layers.active.name
+    assert len(proxy_uv_map.uv) == (4 * 4)
+    for i in range(4 * 4):
+        assert_allclose(proxy_uv_map.uv[i].vector, ((i // 4) * 0.1, (i % 4) * 0.1), atol=1e-6)
+
+    bpy.ops.sollumz.vertex_paint_multiproxy_exit()
+    bpy.ops.object.mode_set(mode="OBJECT")
@@ -0,0 +1,69 @@
+import bpy
+import numpy as np
+from ..ynv.ynvimport import import_ynv
+from ..sollumz_preferences import get_import_settings
+from ..sollumz_properties import SollumType
+
+NAVMESH_WITH_PORTALS_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<NavMesh>
+ <ContentFlags>Polygons, Portals</ContentFlags>
+ <AreaID value="0" />
+ <Polygons>
+  <Item>
+   <Flags>0 0 0 0 0 0</Flags>
+   <Vertices>
+    0, 0, 0
+    1, 0, 0
+    1, 1, 0
+   </Vertices>
+   <Edges />
+  </Item>
+  <Item>
+   <Flags>0 0 0 0 0 0</Flags>
+   <Vertices>
+    0, 0, 0
+    1, 1, 0
+    0, 1, 0
+   </Vertices>
+   <Edges />
+  </Item>
+ </Polygons>
+ <Portals>
+  <Item>
+   <Value value="1" />
+   <Angle value="0.5" />
+   <PolyFrom value="0" />
+   <PolyTo value="1" />
+   <PositionFrom x="0" y="0" z="0" />
+   <PositionTo x="1" y="1" z="0" />
+  </Item>
+ </Portals>
+</NavMesh>
+"""
+
+
+def test_import_ynv_bulk_with_portals(tmp_path):
+    filepath = tmp_path / "test_navmesh.ynv.xml"
+    filepath.write_text(NAVMESH_WITH_PORTALS_XML)
+
+    import_settings = get_import_settings()
+    prev_bulk_import = import_settings.ynv_bulk_import
+    import_settings.ynv_bulk_import = True
+    try:
+        import_ynv(str(filepath))
+    finally:
+        import_settings.ynv_bulk_import = prev_bulk_import
+
+    navmesh_obj = bpy.data.objects["test_navmesh"]
+    portals_obj = next(c for c in navmesh_obj.children if c.sollum_type == SollumType.NAVMESH_PORTAL)
+    mesh = portals_obj.data
+
+    # A 'from' and a 'to' box per portal
+    assert len(mesh.polygons) == 12
+
+    polys = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.attributes["navmesh_poly"].data.foreach_get("value", polys)
+    portal_to = np.empty(len(mesh.polygons), dtype=bool)
+    mesh.attributes["navmesh_portal_to"].data.foreach_get("value", portal_to)
+    assert np.all(polys[~portal_to] == 0)
+    assert np.all(polys[portal_to] == 1)
@@ -0,0 +1,33 @@
+import bpy
+from ...versioning.engine import VersioningSteps
+
+
+def test_versioning_steps_run_in_order_per_datablock():
+    objs = [bpy.data.objects.new(f"versioning_test_obj_{i}", None) for i in range(3)]
+    calls = []
+
+    def step_a(obj):
+        calls.append(("a", obj.name))
+
+    def step_b(obj):
+        calls.append(("b", obj.name))
+
+    def step_once():
+        calls.append(("once",))
+
+    def step_old(obj):
+        calls.append(("old", obj.name))
+
+    steps = VersioningSteps()
+    steps.add(2, "objects", step_a)
+    steps.add(3, "objects", step_b)
+    steps.add(3, None, step_once)
+    steps.add(1, "objects", step_old)
+    steps.run(bpy.data, 1, lambda text: None)
+
+    obj_calls = [c for c in calls if c[0] != "once" and c[1].startswith("versioning_test_obj_")]
+    assert obj_calls == [(step, obj.name) for obj in objs for step in ("a", "b")]
+    assert calls.count(("once",)) == 1
+
+    for obj in objs:
+        bpy.data.objects.remove(obj)
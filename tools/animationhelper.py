@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import bpy
 import math
+import functools
+import numpy as np
+from numpy.typing import NDArray
 from sys import float_info
 from mathutils import Quaternion, Vector, Euler, Matrix
 from enum import IntFlag, IntEnum
@@ -9,11 +12,12 @@ from ..sollumz_properties import MaterialType, SollumType
 from ..tools import jenkhash
 from .blenderhelper import build_name_bone_map, build_bone_map, get_data_obj
 from .meshhelper import get_uv_map_name
-from typing import Tuple, Callable
+from typing import Tuple, Callable, Optional
 from collections.abc import Iterator
 from szio.gta5 import ShaderManager
 
 from .. import logger
+from ..shared.material_users import MaterialUsersIndex, get_material_users_index
 
 
 class AnimationFlag(IntFlag):
@@ -265,76 +269,100 @@ def calculate_bone_space_transform_matrix(old_pose_bone, new_pose_bone):
     return new_mat.inverted() @ old_mat
 
 
-def transform_bone_location_space(fcurves, old_pose_bone, new_pose_bone):
+def fcurves_get_keyframes(fcurves) -> tuple[NDArray[np.float32], NDArray[np.float32]]:
     """
-    Converts the vector3 F-curves from the old pose bone's space to the new pose bone's space.
-    Either bone can be None, meaning convert from/to the original local space (as stored in the animation channels).
+    Reads the keyframes of F-curves that are keyed in lockstep, such as the components of a vector property.
+    Returns the keyframe times, shape (N,), and the keyframe values of each F-curve, shape (N, len(fcurves)).
     """
-    x = fcurves[0]
-    y = fcurves[1]
-    z = fcurves[2]
+    num_keyframes = len(fcurves[0].keyframe_points)
+    assert all(len(fcurve.keyframe_points) == num_keyframes for fcurve in fcurves), "TODO: Handle different number of keyframes for each axis"
 
-    if x is None:
-        return
+    co = np.empty((len(fcurves), num_keyframes * 2), dtype=np.float32)
+    for i, fcurve in enumerate(fcurves):
+        fcurve.keyframe_points.foreach_get("co", co[i])
+    co = co.reshape((len(fcurves), num_keyframes, 2))
 
-    assert len(x.keyframe_points) == len(y.keyframe_points) and len(x.keyframe_points) == len(z.keyframe_points), "TODO: Handle different number of keyframes for each axis"
+    times = co[0, :, 0]
+    assert (co[:, :, 0] == times).all(), "TODO: Handle different keyframe times"
 
-    transform_mat = calculate_bone_space_transform_matrix(old_pose_bone, new_pose_bone)
+    return times, co[:, :, 1].T
 
-    for x_kfp, y_kfp, z_kfp in zip(x.keyframe_points, y.keyframe_points, z.keyframe_points):
-        x_co, y_co, z_co = x_kfp.co, y_kfp.co, z_kfp.co
-        assert x_co[0] == y_co[0] and x_co[0] == z_co[0], "TODO: Handle different keyframe times"
 
-        old_vec = Vector((x_co[1], y_co[1], z_co[1]))
-        new_vec = transform_mat @ old_vec
-        x_co[1], y_co[1], z_co[1] = new_vec[0], new_vec[1], new_vec[2]
+def fcurves_set_keyframes(fcurves, times: NDArray, values: NDArray):
+    """Writes the keyframes of F-curves read with ``fcurves_get_keyframes``."""
+    co = np.empty((len(times), 2), dtype=np.float32)
+    co[:, 0] = times
+    for i, fcurve in enumerate(fcurves):
+        co[:, 1] = values[:, i]
+        fcurve.keyframe_points.foreach_set("co", co.ravel())
+        fcurve.update()
 
-        x_kfp.co, y_kfp.co, z_kfp.co = x_co, y_co, z_co
 
-    x.update()
-    y.update()
-    z.update()
+def quaternions_multiply(a: NDArray, b: NDArray) -> NDArray:
+    """Hamilton product of arrays of quaternions in (w, x, y, z) order."""
+    aw, ax, ay, az = a[..., 0], a[..., 1], a[..., 2], a[..., 3]
+    bw, bx, by, bz = b[..., 0], b[..., 1], b[..., 2], b[..., 3]
+    return np.stack((
+        aw * bw - ax * bx - ay * by - az * bz,
+        aw * bx + ax * bw + ay * bz - az * by,
+        aw * by - ax * bz + ay * bw + az * bx,
+        aw * bz + ax * by - ay * bx + az * bw,
+    ), axis=-1)
 
 
-def transform_bone_rotation_quaternion_space(fcurves, old_pose_bone, new_pose_bone):
+def quaternions_make_compatible(quats: NDArray) -> NDArray:
     """
-    Converts the quaternion F-curves from the old pose bone's space to the new pose bone's space.
-    Either bone can be None, meaning convert from/to the original local space (as stored in the animation channels).
+    Flips the sign of quaternions so each one is in the same hemisphere as the previous one.
+    Blender interpolates quaternions linearly and component-wise which can cause flickering
+    when there is a sign change. See longer rant in ycdexport.py
     """
-    w = fcurves[0]
-    x = fcurves[1]
-    y = fcurves[2]
-    z = fcurves[3]
+    if len(quats) < 2:
+        return quats
 
-    if w is None:
-        return
+    dots = np.einsum("ij,ij->i", quats[1:], quats[:-1])
+    # A flip propagates to all the following quaternions, as they are compared against the already flipped one
+    signs = np.cumprod(np.where(dots < 0, -1.0, 1.0))
+    quats = quats.copy()
+    quats[1:] *= signs[:, np.newaxis]
+    return quats
 
-    assert len(x.keyframe_points) == len(y.keyframe_points) and len(x.keyframe_points) == len(z.keyframe_points) and len(x.keyframe_points) == len(w.keyframe_points), "TODO: Handle different number of keyframes for each axis"
 
-    transform_mat = calculate_bone_space_transform_matrix(old_pose_bone, new_pose_bone)
+def transform_bone_location_space(fcurves, old_pose_bone, new_pose_bone):
+    """
+    Converts the vector3 F-curves from the old pose bone's space to the new pose bone's space.
+    Either bone can be None, meaning convert from/to the original local space (as stored in the animation channels).
+    """
+    if fcurves[0] is None:
+        return
 
-    prev_quat = None
-    for w_kfp, x_kfp, y_kfp, z_kfp in zip(w.keyframe_points, x.keyframe_points, y.keyframe_points, z.keyframe_points):
-        w_co, x_co, y_co, z_co = w_kfp.co, x_kfp.co, y_kfp.co, z_kfp.co
-        assert x_co[0] == y_co[0] and x_co[0] == z_co[0] and x_co[0] == w_co[0], "TODO: Handle different keyframe times"
+    transform_mat = np.array(calculate_bone_space_transform_matrix(old_pose_bone, new_pose_bone), dtype=np.float64)
 
-        quat = Quaternion((w_co[1], x_co[1], y_co[1], z_co[1]))
-        quat.rotate(transform_mat)
-        if prev_quat is not None and prev_quat.dot(quat) < 0:
-            # Blender interpolates quaternions linearly and component-wise which can cause flickering
-            # when there is a sign change. See longer rant in ycdexport.py
-            quat *= -1
+    times, locations = fcurves_get_keyframes(fcurves)
+    locations = locations @ transform_mat[:3, :3].T + transform_mat[:3, 3]
+    fcurves_set_keyframes(fcurves, times, locations)
 
-        w_co[1], x_co[1], y_co[1], z_co[1] = quat[0], quat[1], quat[2], quat[3]
 
-        w_kfp.co, x_kfp.co, y_kfp.co, z_kfp.co = w_co, x_co, y_co, z_co
+def transform_bone_rotation_quaternion_space(fcurves, old_pose_bone, new_pose_bone):
+    """
+    Converts the quaternion F-curves from the old pose bone's space to the new pose bone's space.
+    Either bone can be None, meaning convert from/to the original local space (as stored in the animation channels).
+    """
+    if fcurves[0] is None:
+        return
 
-        prev_quat = quat
+    transform_mat = calculate_bone_space_transform_matrix(old_pose_bone, new_pose_bone)
+    transform_quat = np.array(transform_mat.to_3x3().normalized().to_quaternion(), dtype=np.float64)
 
-    w.update()
-    x.update()
-    y.update()
-    z.update()
+    times, quats = fcurves_get_keyframes(fcurves)
+    quats = quats.astype(np.float64)
+    # Same as Quaternion.rotate(transform_mat): rotate the normalized quaternion, return the canonical form (positive W)
+    # and restore the original length
+    lengths = np.linalg.norm(quats, axis=1, keepdims=True)
+    quats = quaternions_multiply(transform_quat, np.divide(quats, lengths, out=np.zeros_like(quats), where=lengths != 0))
+    quats[quats[:, 0] < 0] *= -1
+    quats *= lengths
+    quats = quaternions_make_compatible(quats)
+    fcurves_set_keyframes(fcurves, times, quats)
 
 
 def transform_camera_rotation_quaternion(fcurves, old_camera, new_camera):
@@ -657,6 +685,20 @@ def get_id_and_track_from_track_data_path(
     return id, track
 
 
+@functools.cache
+def _split_canonical_data_path(canon_data_path: str) -> tuple[int | str | None, str | None]:
+    """Splits a canonical data path into the bone ID and the property path (starting with ``].``). Cached as the same
+    data paths repeat across every F-curve component and every action."""
+    data_path_parts = canon_data_path.split('"')
+    if len(data_path_parts) < 3:
+        return None, None
+
+    bone_id = data_path_parts[1]
+    if bone_id.startswith("#") and bone_id[1:].isdecimal():
+        bone_id = int(bone_id[1:])
+    return bone_id, data_path_parts[2]
+
+
 def retarget_animation(animation_obj: bpy.types.Object, old_target_id: bpy.types.ID, new_target_id: bpy.types.ID):
     if isinstance(old_target_id, bpy.types.Armature):
         old_bone_map = build_bone_map(get_data_obj(old_target_id))
@@ -696,7 +738,6 @@ def retarget_animation(animation_obj: bpy.types.Object, old_target_id: bpy.types
             group.name = bone.name
 
     for fcurve in action_fcurves(action):
-        # TODO: can we somehow store the track ID in the F-Curve to avoid parsing the data paths?
         data_path = fcurve.data_path
 
         canon_data_path = track_data_path_to_canonical_form(data_path, old_target_id, old_bone_name_map)
@@ -704,11 +745,7 @@ def retarget_animation(animation_obj: bpy.types.Object, old_target_id: bpy.types
         data_path = track_data_path_to_target_form(canon_data_path, new_target_id, new_bone_map)
 
         # check if track needs to be transformed
-        data_path_parts = canon_data_path.split('"')
-        bone_id = data_path_parts[1]
-        if bone_id.startswith("#"):
-            bone_id = int(bone_id[1:])
-        prop_path = data_path_parts[2]
+        bone_id, prop_path = _split_canonical_data_path(canon_data_path)
         if prop_path == "].location":
             if bone_id not in bone_locations_to_transform:
                 bone_locations_to_transform[bone_id] = [None, None, None]
@@ -775,7 +812,10 @@ def is_any_sollumz_animation_obj(obj: bpy.types.Object) -> bool:
                                SollumType.CLIPS}
 
 
-def update_uv_clip_hash(clip_obj) -> bool:
+def update_uv_clip_hash(clip_obj, index: Optional[MaterialUsersIndex] = None) -> bool:
+    """Calculates the hash of a UV clip from the name of the model the target material is used by. Pass an ``index``
+    when updating multiple clips to avoid refreshing the material users index for each clip.
+    """
     if len(clip_obj.clip_properties.animations) == 0:
         logger.error(f"Clip '{clip_obj.name}' has no animations.")
         return False
@@ -786,7 +826,10 @@ def update_uv_clip_hash(clip_obj) -> bool:
         logger.error(f"Animation target is not a material.")
         return False
 
-    meshes = [obj for obj in bpy.data.meshes if obj.user_of_id(target)]
+    if index is None:
+        index = get_material_users_index(bpy.context)
+
+    meshes = index.get_meshes(target)
     if len(meshes) == 0:
         logger.error(f"Material '{target.name}' is not used by any mesh.")
         return False
@@ -794,7 +837,9 @@ def update_uv_clip_hash(clip_obj) -> bool:
         logger.warning(f"Material is used by more than one mesh. '{meshes[0].name}' will be used.")
 
     mesh = meshes[0]
-    drawable_models = [o for o in bpy.data.objects if o.sollum_type == SollumType.DRAWABLE_MODEL and o.data == mesh]
+    drawable_models = [
+        obj for obj in index.get_mesh_objects(mesh) if obj.sollum_type == SollumType.DRAWABLE_MODEL
+    ]
     if len(drawable_models) == 0:
         logger.error(f"Material '{target.name}' is not used by any drawable model.")
         return False
@@ -907,3 +952,40 @@ def action_remove_fcurves(action: bpy.types.Action, predicate: Callable[[bpy.typ
 
         for fcurve in to_delete:
             action.fcurves.remove(fcurve)
+
+
+def action_ensure_fcurve(
+    action: bpy.types.Action, target_id: bpy.types.ID, data_path: str, index: int = 0
+) -> bpy.types.FCurve:
+    """Gets or creates the F-curve of ``action`` for the given channel. ``action`` must be assigned to ``target_id``."""
+    if bpy.app.version >= (4, 4, 0):
+        return action.fcurve_ensure_for_datablock(target_id, data_path, index=index)
+
+    fcurve = action.fcurves.find(data_path, index=index)
+    if fcurve is None:
+        fcurve = action.fcurves.new(data_path, index=index)
+    return fcurve
+
+
+KEYFRAME_INTERPOLATION_VALUES = {
+    "CONSTANT": 0,
+    "LINEAR": 1,
+    "BEZIER": 2,
+}
+
+
+def fcurve_set_keyframes(fcurve: bpy.types.FCurve, frames: NDArray, values: NDArray, interpolation: str = "BEZIER"):
+    """Replaces all keyframes of the F-curve. ``frames`` must be sorted."""
+    num_keyframes = len(frames)
+    co = np.empty((num_keyframes, 2), dtype=np.float32)
+    co[:, 0] = frames
+    co[:, 1] = values
+
+    keyframe_points = fcurve.keyframe_points
+    keyframe_points.clear()
+    keyframe_points.add(num_keyframes)
+    keyframe_points.foreach_set("co", co.ravel())
+    keyframe_points.foreach_set(
+        "interpolation", np.full(num_keyframes, KEYFRAME_INTERPOLATION_VALUES[interpolation], dtype=np.int32)
+    )
+    fcurve.update()
@@ -9,6 +9,7 @@ from math import radians
 from ..sollumz_properties import SollumType, MaterialType
 from .utils import get_min_vector_list, get_max_vector_list
 from .blenderhelper import get_children_recursive
+from ..shared.mesh_updates import mark_mesh_updated, mesh_update_counter
 from szio.gta5 import ShaderManager
 
 
@@ -193,6 +194,34 @@ def create_plane(mesh, size: float, matrix: Matrix = None):
     return mesh
 
 
+def create_mesh_from_arrays(
+    mesh: bpy.types.Mesh,
+    vertices: NDArray[np.float32],
+    loop_vertex_indices: NDArray[np.int32],
+    face_loop_starts: NDArray[np.int32],
+    face_material_indices: Optional[NDArray[np.int32]] = None,
+) -> bpy.types.Mesh:
+    """Fill an empty mesh from flat arrays. Faces are given by the index of their first loop in
+    ``loop_vertex_indices``, each face ends where the next one starts. Faster alternative to ``Mesh.from_pydata``
+    for large meshes."""
+    vertices = np.asarray(vertices, dtype=np.float32).reshape((-1, 3))
+    loop_vertex_indices = np.asarray(loop_vertex_indices, dtype=np.int32)
+    face_loop_starts = np.asarray(face_loop_starts, dtype=np.int32)
+
+    mesh.vertices.add(len(vertices))
+    mesh.vertices.foreach_set("co", vertices.ravel())
+    mesh.loops.add(len(loop_vertex_indices))
+    mesh.loops.foreach_set("vertex_index", loop_vertex_indices)
+    mesh.polygons.add(len(face_loop_starts))
+    mesh.polygons.foreach_set("loop_start", face_loop_starts)
+    if face_material_indices is not None:
+        mesh.polygons.foreach_set("material_index", np.asarray(face_material_indices, dtype=np.int32))
+
+    mesh.update(calc_edges=True)
+    mark_mesh_updated(mesh)
+    return mesh
+
+
 def get_tangent_required(material: bpy.types.Material):
     if material.sollum_type != MaterialType.SHADER:
         return False
@@ -452,10 +481,56 @@ def get_total_bounds(obj):
     return corners
 
 
-def get_combined_bound_box(obj: bpy.types.Object, use_world: bool = False, matrix: Matrix = Matrix()):
-    """Adds the ``bound_box`` of ``obj`` and all of it's child mesh objects. Returhs bbmin, bbmax"""
-    total_bounds: list[Vector] = []
+def get_mesh_vertices_co(mesh: bpy.types.Mesh) -> NDArray[np.float32]:
+    """Get the positions of all vertices of the mesh as an array of shape (N, 3)."""
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    return co.reshape((-1, 3))
+
+
+_mesh_local_aabb_cache: dict[int, tuple[tuple[int, int], Optional[NDArray[np.float32]]]] = {}
+
+
+def get_mesh_local_aabb(mesh: bpy.types.Mesh, use_cache: bool = True) -> Optional[NDArray[np.float32]]:
+    """Get the AABB of the mesh vertices in local space as an array ``[bbmin, bbmax]``, or ``None`` if the mesh has no
+    vertices. Cached until the mesh data is updated. Code that writes vertex positions without a depsgraph update must
+    call ``mark_mesh_updated`` or pass ``use_cache=False``."""
+    key = (mesh_update_counter(mesh), len(mesh.vertices))
+    if use_cache:
+        cached = _mesh_local_aabb_cache.get(mesh.session_uid, None)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+    co = get_mesh_vertices_co(mesh)
+    aabb = np.array((co.min(axis=0), co.max(axis=0))) if len(co) > 0 else None
+    _mesh_local_aabb_cache[mesh.session_uid] = (key, aabb)
+    return aabb
+
+
+def clear_mesh_local_aabb_cache():
+    _mesh_local_aabb_cache.clear()
 
+
+def _transform_points(points: NDArray, matrix: Matrix) -> NDArray[np.float64]:
+    m = np.array(matrix, dtype=np.float64)
+    return points @ m[:3, :3].T + m[:3, 3]
+
+
+def _aabb_corners(aabb: NDArray) -> NDArray:
+    return np.array([
+        [aabb[i][0], aabb[j][1], aabb[k][2]]
+        for i in (0, 1) for j in (0, 1) for k in (0, 1)
+    ])
+
+
+def _is_axis_aligned_matrix(matrix: Matrix) -> bool:
+    """Checks whether the matrix only has translation and scale, so it keeps boxes axis-aligned."""
+    m = np.array(matrix, dtype=np.float64)[:3, :3]
+    return not np.any(m - np.diag(np.diag(m)))
+
+
+def _iter_combined_bound_box_children(obj: bpy.types.Object, use_world: bool, matrix: Matrix):
+    """Yields each mesh object in the hierarchy of ``obj`` and the matrix to transform it with."""
     for child in [obj, *obj.children_recursive]:
         if child.type != "MESH":
             continue
@@ -468,13 +543,26 @@ def get_combined_bound_box(obj: bpy.types.Object, use_world: bool = False, matri
             else:
                 child_matrix = matrix @ child.matrix_basis
 
-        total_bounds.extend([child_matrix @ Vector(v)
-                            for v in child.bound_box])
+        yield child, child_matrix
+
 
-    if not total_bounds:
+def _points_min_max(points: list[NDArray]) -> tuple[Vector, Vector]:
+    points = [p for p in points if len(p) > 0]
+    if not points:
         return Vector(), Vector()
 
-    return get_min_vector_list(total_bounds), get_max_vector_list(total_bounds)
+    points = np.concatenate(points)
+    return Vector(points.min(axis=0)), Vector(points.max(axis=0))
+
+
+def get_combined_bound_box(obj: bpy.types.Object, use_world: bool = False, matrix: Matrix = Matrix()):
+    """Adds the ``bound_box`` of ``obj`` and all of it's child mesh objects. Returhs bbmin, bbmax"""
+    total_bounds: list[NDArray] = [
+        _transform_points(np.array(child.bound_box, dtype=np.float64), child_matrix)
+        for child, child_matrix in _iter_combined_bound_box_children(obj, use_world, matrix)
+    ]
+
+    return _points_min_max(total_bounds)
 
 
 def get_combined_bound_box_tight(obj: bpy.types.Object, use_world: bool = False, matrix: Matrix = Matrix()):
@@ -484,27 +572,18 @@ def get_combined_bound_box_tight(obj: bpy.types.Object, use_world: bool = False,
     """
     # TODO: for now this is separate from get_combined_bound_box because it was needed to fix an issue with bound BVH
     # export, and I'm not sure if the other usages of get_combined_bound_box would keep working with this change
-    total_bounds: list[Vector] = []
-
-    for child in [obj, *obj.children_recursive]:
-        if child.type != "MESH":
-            continue
-
-        if use_world:
-            child_matrix = matrix @ child.matrix_world
+    total_bounds: list[NDArray] = []
+
+    for child, child_matrix in _iter_combined_bound_box_children(obj, use_world, matrix):
+        if _is_axis_aligned_matrix(child_matrix):
+            # Without rotation, the transformed local AABB of the vertices is already tight
+            local_aabb = get_mesh_local_aabb(child.data)
+            if local_aabb is not None:
+                total_bounds.append(_transform_points(_aabb_corners(local_aabb), child_matrix))
         else:
-            if child == obj:
-                child_matrix = matrix
-            else:
-                child_matrix = matrix @ child.matrix_basis
-
-        total_bounds.extend([child_matrix @ Vector(v.co)
-                            for v in child.data.vertices])
+            total_bounds.append(_transform_points(get_mesh_vertices_co(child.data), child_matrix))
 
-    if not total_bounds:
-        return Vector(), Vector()
-
-    return get_min_vector_list(total_bounds), get_max_vector_list(total_bounds)
+    return _points_min_max(total_bounds)
 
 
 def get_bound_center(obj):
@@ -543,3 +622,16 @@ def flip_uv(uv):
     v = (uv[1] - 1.0) * -1
 
     return [u, v]
+
+
+@bpy.app.handlers.persistent
+def load_post_handler(*args):
+    clear_mesh_local_aabb_cache()
+
+
+def register():
+    bpy.app.handlers.load_post.append(load_post_handler)
+
+
+def unregister():
+    bpy.app.handlers.load_post.remove(load_post_handler)
@@ -19,33 +19,10 @@ from functools import cache
 from typing import Iterable
 import bpy
 import bmesh
-import math
 import time
 from mathutils import Vector, Matrix
 import numpy as np
-
-
-def bbox_orient(bme_verts, mx):
-    """
-    takes a lsit of BMverts ora  list of vectors
-    """
-    if hasattr(bme_verts[0], "co"):
-        verts = [mx @ v.co for v in bme_verts]
-    else:
-        verts = [mx @ v for v in bme_verts]
-
-    xs = [v[0] for v in verts]
-    ys = [v[1] for v in verts]
-    zs = [v[2] for v in verts]
-
-    return (min(xs), max(xs), min(ys), max(ys), min(zs), max(zs))
-
-
-def bbox_vol(box: tuple[float, float, float, float, float, float]) -> float:
-
-    V = max(box[1] - box[0], 0.0001) * max(box[3] - box[2], 0.0001) * max(box[5] - box[4], 0.0001)
-
-    return V
+from numpy.typing import NDArray
 
 
 def box_coords(box):
@@ -88,8 +65,83 @@ def generate_vectors_structured(num_samples: int):
     return [Vector(vector[:]).freeze() for vector in vectors]
 
 
-def get_obb(verts: Iterable[Vector], num_samples: int, angle_step: int) -> tuple[list[Vector], Matrix]:
-    already_found = set[Matrix]()
+def rotation_matrices(axes: NDArray[np.float64], angles: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Builds the rotation matrices for every combination of axis and angle, same as ``Matrix.Rotation``. Returns an
+    array of shape ``(len(axes) * len(angles), 3, 3)``, ordered by axis first and angle second."""
+    x, y, z = (axes[:, np.newaxis, i] for i in range(3))
+    c = np.cos(angles)[np.newaxis, :]
+    s = np.sin(angles)[np.newaxis, :]
+    t = 1.0 - c
+
+    mats = np.empty((len(axes), len(angles), 3, 3))
+    mats[..., 0, 0] = t * x * x + c
+    mats[..., 0, 1] = t * x * y - s * z
+    mats[..., 0, 2] = t * x * z + s * y
+    mats[..., 1, 0] = t * x * y + s * z
+    mats[..., 1, 1] = t * y * y + c
+    mats[..., 1, 2] = t * y * z - s * x
+    mats[..., 2, 0] = t * x * z - s * y
+    mats[..., 2, 1] = t * y * z + s * x
+    mats[..., 2, 2] = t * z * z + c
+    return mats.reshape((-1, 3, 3))
+
+
+def bbox_orient_many(
+    verts: NDArray[np.float64],
+    rotations: NDArray[np.float64],
+    chunk_size: int = 4_000_000,
+) -> NDArray[np.float64]:
+    """Gets the bounding box of the vertices in the space of each rotation matrix. Returns an array of shape
+    ``(len(rotations), 6)`` with the boxes as ``(min_x, max_x, min_y, max_y, min_z, max_z)``."""
+    boxes = np.empty((len(rotations), 6))
+    # Process the rotations in chunks to limit the size of the temporary projected vertices array
+    rotations_per_chunk = max(1, chunk_size // max(1, len(verts) * 3))
+    for start in range(0, len(rotations), rotations_per_chunk):
+        end = start + rotations_per_chunk
+        projected = np.einsum("rij,vj->rvi", rotations[start:end], verts)
+        boxes[start:end, 0::2] = projected.min(axis=1)
+        boxes[start:end, 1::2] = projected.max(axis=1)
+    return boxes
+
+
+def bbox_vol_many(boxes: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Gets the volume of each box returned by ``bbox_orient_many``. Each side is at least 0.0001 so flat boxes still
+    have some volume to compare."""
+    sizes = np.maximum(boxes[:, 1::2] - boxes[:, 0::2], 0.0001)
+    return sizes.prod(axis=1)
+
+
+def refine_obb_rotation(
+    verts: NDArray[np.float64],
+    rotation: NDArray[np.float64],
+    volume: float,
+    initial_step: float,
+    num_iterations: int = 12,
+) -> tuple[NDArray[np.float64], float]:
+    """Locally improves the rotation of an oriented bounding box by trying small rotations around each local axis,
+    halving the step size whenever none of them reduce the volume. Returns the new rotation and volume."""
+    local_axes = np.identity(3)
+    step = initial_step
+    for _ in range(num_iterations):
+        deltas = rotation_matrices(local_axes, np.array((step, -step)))
+        candidates = deltas @ rotation
+        volumes = bbox_vol_many(bbox_orient_many(verts, candidates))
+        best = np.argmin(volumes)
+        if volumes[best] < volume:
+            rotation = candidates[best]
+            volume = volumes[best]
+        else:
+            step *= 0.5
+
+    return rotation, volume
+
+
+def get_obb(
+    verts: Iterable[Vector],
+    num_samples: int,
+    angle_step: int,
+    refine: bool = False,
+) -> tuple[list[Vector], Matrix]:
     world_mx = Matrix.Identity(4)
     scale = world_mx.to_scale()
     trans = world_mx.to_translation()
@@ -110,33 +162,30 @@ def get_obb(verts: Iterable[Vector], num_samples: int, angle_step: int) -> tuple
         bme, input=bme.verts, use_existing_faces=True, )
     total_hull = convex_hull["geom"]
 
-    hull_verts = [item.co for item in total_hull if hasattr(item, "co")]
+    hull_verts = np.array([item.co for item in total_hull if hasattr(item, "co")], dtype=np.float64)
 
     bme.free()
 
-    min_mx = Matrix.Identity(4)
-    min_box = bbox_orient(hull_verts, min_mx)
-    min_V = bbox_vol(min_box)
-    # Iterate through all degrees to obtain a more predictable result
-
-    axes = generate_vectors_structured(num_samples)
-
-    for axis in axes:
-        for n in range(0, 720, angle_step):
-            angle = math.pi * n / 360
-            rot_mx = Matrix.Rotation(angle, 4, axis)
-            rot_mx.freeze()
-            if rot_mx in already_found:
-                continue
-            already_found.add(rot_mx)
-
-            box = bbox_orient(hull_verts, rot_mx)
-            test_V = bbox_vol(box)
-
-            if test_V < min_V:
-                min_V = test_V
-                min_box = box
-                min_mx = rot_mx
+    min_rot = np.identity(3)
+    min_V = bbox_vol_many(bbox_orient_many(hull_verts, min_rot[np.newaxis]))[0]
+
+    # Iterate through all degrees to obtain a more predictable result. All candidate orientations are tested at once,
+    # in the same order as axis-angle pairs, so ties are resolved in favour of the first candidate found.
+    axes = np.array(generate_vectors_structured(num_samples), dtype=np.float64)
+    angles = np.pi * np.arange(0, 720, angle_step) / 360
+    rotations = rotation_matrices(axes, angles)
+
+    volumes = bbox_vol_many(bbox_orient_many(hull_verts, rotations))
+    best = np.argmin(volumes)
+    if volumes[best] < min_V:
+        min_V = volumes[best]
+        min_rot = rotations[best]
+
+    if refine:
+        min_rot, min_V = refine_obb_rotation(hull_verts, min_rot, min_V, np.pi * angle_step / 360)
+
+    min_box = tuple(bbox_orient_many(hull_verts, min_rot[np.newaxis])[0])
+    min_mx = Matrix(min_rot.tolist()).to_4x4()
 
     fmx = tr_mx @ r_mx @ min_mx.inverted_safe() @ sc_mx
 
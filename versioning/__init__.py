@@ -6,6 +6,8 @@ When saving a .blend file a Sollumz version identifier is stored. When an old
 .blend file is loaded, its data is upgraded to the current version.
 """
 
+import time
+
 import bpy
 from bpy.app.handlers import persistent
 
@@ -78,13 +80,19 @@ def do_versions(data: bpy.types.BlendData):
         return
 
     log(f"Upgrading Sollumz data from version {data_version} to version {SOLLUMZ_INTERNAL_VERSION}")
+    start_time = time.perf_counter()
 
+    from .engine import VersioningSteps
     from . import versioning_230, versioning_240, versioning_250, versioning_260, versioning_280
-    versioning_230.do_versions(data_version, data)
-    versioning_240.do_versions(data_version, data)
-    versioning_250.do_versions(data_version, data)
-    versioning_260.do_versions(data_version, data)
-    versioning_280.do_versions(data_version, data)
+    steps = VersioningSteps()
+    versioning_230.register_versioning_steps(steps)
+    versioning_240.register_versioning_steps(steps)
+    versioning_250.register_versioning_steps(steps)
+    versioning_260.register_versioning_steps(steps)
+    versioning_280.register_versioning_steps(steps)
+    steps.run(data, data_version, log)
+
+    log(f"Upgraded in {(time.perf_counter() - start_time) * 1000:.1f} ms")
 
 
 def register():
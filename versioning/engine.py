@@ -0,0 +1,83 @@
+"""
+Single-pass versioning engine.
+
+Versioning steps are registered per ``BlendData`` collection (materials, objects, scenes, etc.). When upgrading, each
+collection is traversed once and every datablock is passed through all the pending steps for its type, in the order
+they were registered, instead of each step traversing the whole collection on its own.
+"""
+
+import time
+from collections import defaultdict
+from typing import Callable, NamedTuple, Optional
+
+from bpy.types import (
+    ID,
+    BlendData,
+    Scene,
+)
+
+
+class VersioningStep(NamedTuple):
+    version: int
+    """The step runs on data with a version lower than this one."""
+    data_collection: Optional[str]
+    """Name of the ``BlendData`` collection with the datablocks passed to the step, or ``None`` for steps without
+    datablock that only run once."""
+    fn: Callable
+    name: str
+
+
+class VersioningSteps:
+    def __init__(self):
+        self.steps: list[VersioningStep] = []
+
+    def add(self, version: int, data_collection: Optional[str], fn: Callable):
+        """Registers ``fn`` to run on each datablock of ``data_collection`` that has a version lower than
+        ``version``. Steps on the same datablock run in the order they are registered.
+        """
+        self.steps.append(VersioningStep(version, data_collection, fn, fn.__name__))
+
+    def run(self, data: BlendData, data_version: int, log: Callable[[str], None]):
+        pending_steps = [step for step in self.steps if data_version < step.version]
+        step_times = defaultdict(float)
+        step_counts = defaultdict(int)
+
+        collection_names = list(dict.fromkeys(step.data_collection for step in pending_steps))
+        for collection_name in collection_names:
+            steps = [step for step in pending_steps if step.data_collection == collection_name]
+            if collection_name is None:
+                for step in steps:
+                    start_time = time.perf_counter()
+                    step.fn()
+                    step_times[step] += time.perf_counter() - start_time
+                    step_counts[step] += 1
+                continue
+
+            for datablock in getattr(data, collection_name):
+                if datablock.library is not None:
+                    # Linked datablocks are not editable
+                    continue
+
+                datablock_version = get_datablock_version(datablock, data_version)
+                for step in steps:
+                    if datablock_version >= step.version:
+                        continue
+
+                    start_time = time.perf_counter()
+                    step.fn(datablock)
+                    step_times[step] += time.perf_counter() - start_time
+                    step_counts[step] += 1
+
+        for step in pending_steps:
+            target = step.data_collection or "once"
+            log(f"  {step.name} ({target}): {step_counts[step]} run(s) in {step_times[step] * 1000:.1f} ms")
+
+
+def get_datablock_version(datablock: ID, data_version: int) -> int:
+    """Gets the version of the datablock data. Only scenes store their own version, any other datablock is assumed to
+    be at the version of the .blend file.
+    """
+    if isinstance(datablock, Scene):
+        return datablock.sollumz_internal_version
+
+    return data_version
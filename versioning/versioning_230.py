@@ -6,17 +6,19 @@ from bpy.types import (
     ShaderNodeValue,
     ShaderNodeGroup,
     Material,
-    BlendData,
     Object,
+    Armature,
     Bone,
     Light,
     PropertyGroup,
 )
+from bisect import bisect_left
 from typing import Optional, NamedTuple, Callable, Any
 from ..sollumz_properties import MaterialType
 from szio.gta5 import ShaderManager
 from ..ydr.shader_materials import create_parameter_node
 from ..yft.properties import FragmentTemplateAsset
+from .engine import VersioningSteps
 
 
 class OldShaderParam(NamedTuple):
@@ -30,23 +32,25 @@ class OldShaderArrayParam(NamedTuple):
     nodes: list[ShaderNode]
 
 
-def collect_material_old_shader_parameters(material: Material) -> dict[str, OldShaderParam]:
+def collect_material_old_shader_parameters(
+    material: Material,
+    nodes_by_name: dict[str, ShaderNode]
+) -> dict[str, OldShaderParam]:
     def _is_param_node(n: Optional[ShaderNode]) -> bool:
-        return n is not None and isinstance(n, ShaderNodeValue) and getattr(node, "is_sollumz", False)
+        return n is not None and isinstance(n, ShaderNodeValue) and getattr(n, "is_sollumz", False)
 
     result = {}
-    node_tree = material.node_tree
-    for node in node_tree.nodes:
-        if not node.name.endswith("_x"):
+    for node_name, node in nodes_by_name.items():
+        if not node_name.endswith("_x"):
             continue
         if not _is_param_node(node):
             continue
 
-        param_name = node.name[:-2]
+        param_name = node_name[:-2]
         param_x = node
-        param_y = node_tree.nodes.get(f"{param_name}_y", None)
-        param_z = node_tree.nodes.get(f"{param_name}_z", None)
-        param_w = node_tree.nodes.get(f"{param_name}_w", None)
+        param_y = nodes_by_name.get(f"{param_name}_y", None)
+        param_z = nodes_by_name.get(f"{param_name}_z", None)
+        param_w = nodes_by_name.get(f"{param_name}_w", None)
 
         if not all(_is_param_node(n) for n in (param_y, param_z, param_w)):
             continue
@@ -56,22 +60,32 @@ def collect_material_old_shader_parameters(material: Material) -> dict[str, OldS
     return result
 
 
-def collect_material_old_shader_array_parameters(material: Material) -> dict[str, OldShaderArrayParam]:
+def collect_material_old_shader_array_parameters(
+    material: Material,
+    nodes_by_name: dict[str, ShaderNode]
+) -> dict[str, OldShaderArrayParam]:
     def _is_array_param_node(n: Optional[ShaderNode]) -> bool:
-        return (n is not None and isinstance(n, ShaderNodeGroup) and getattr(node, "is_sollumz", False) and
-                n.node_tree.name == "ArrayNode")
+        return (n is not None and isinstance(n, ShaderNodeGroup) and getattr(n, "is_sollumz", False) and
+                n.node_tree is not None and n.node_tree.name == "ArrayNode")
 
     result = {}
-    node_tree = material.node_tree
-    for node in node_tree.nodes:
-        if not node.name.endswith(" 1"):
+    sorted_names = None
+    for node_name, node in nodes_by_name.items():
+        if not node_name.endswith(" 1"):
             continue
         if not _is_array_param_node(node):
             continue
 
-        param_name = node.name[:-2]
+        param_name = node_name[:-2]
 
-        all_array_nodes = [n for n in node_tree.nodes if n.name.startswith(param_name)]
+        # Names starting with the parameter name are contiguous once sorted
+        if sorted_names is None:
+            sorted_names = sorted(nodes_by_name.keys())
+        all_array_nodes = []
+        for name in sorted_names[bisect_left(sorted_names, param_name):]:
+            if not name.startswith(param_name):
+                break
+            all_array_nodes.append(nodes_by_name[name])
 
         if not all(_is_array_param_node(n) for n in all_array_nodes):
             continue
@@ -88,8 +102,10 @@ def upgrade_material_old_shader_parameters(material: Material):
     if not use_nodes or material.sollum_type != MaterialType.SHADER:
         return
 
-    params = collect_material_old_shader_parameters(material)
-    array_params = collect_material_old_shader_array_parameters(material)
+    # Index the nodes once, name lookups in the node tree collection are slow with many nodes
+    nodes_by_name = {node.name: node for node in material.node_tree.nodes}
+    params = collect_material_old_shader_parameters(material, nodes_by_name)
+    array_params = collect_material_old_shader_array_parameters(material, nodes_by_name)
     if len(params) == 0 and len(array_params) == 0:
         return
 
@@ -364,30 +380,28 @@ def upgrade_light_shadow_blur(light: Light):
     dst_light_props.shadow_blur = max(0.0, min(1.0, shadow_blur_val / 255))
 
 
-def do_versions(data_version: int, data: BlendData):
-    if data_version < 0:
-        # commit a588b5a (feat(shader): typed shader parameters)
-        for material in data.materials:
-            upgrade_material_old_shader_parameters(material)
-
-        for obj in data.objects:
-            # commit 268453b (tweak(yft): update fragment properties names)
-            upgrade_fragment_properties(obj)
-            upgrade_vehicle_window_properties(obj)
-
-        for armature in data.armatures:
-            for bone in armature.bones:
-                # commit 614dbf5 (Auto-calculate bone tag setting per bone)
-                # This is an older change but users still have problems when opening old .blend files with rigged models
-                # shared in resources lists or old tutorials, confused as to why their animation doesn't work when exported
-                upgrade_bone_tag(bone)
-
-                # commit 268453b (tweak(yft): update fragment properties names)
-                upgrade_bone_group_properties(bone)
-
-    if data_version < 1:
-        for light in data.lights:
-            # commit bc37e25 (feat(ydr): update light flags to correct names)
-            upgrade_light_flags(light)
-            # normalize shadow_blur property
-            upgrade_light_shadow_blur(light)
+def upgrade_armature_bones(armature: Armature):
+    for bone in armature.bones:
+        # commit 614dbf5 (Auto-calculate bone tag setting per bone)
+        # This is an older change but users still have problems when opening old .blend files with rigged models
+        # shared in resources lists or old tutorials, confused as to why their animation doesn't work when exported
+        upgrade_bone_tag(bone)
+
+        # commit 268453b (tweak(yft): update fragment properties names)
+        upgrade_bone_group_properties(bone)
+
+
+def register_versioning_steps(steps: VersioningSteps):
+    # commit a588b5a (feat(shader): typed shader parameters)
+    steps.add(0, "materials", upgrade_material_old_shader_parameters)
+
+    # commit 268453b (tweak(yft): update fragment properties names)
+    steps.add(0, "objects", upgrade_fragment_properties)
+    steps.add(0, "objects", upgrade_vehicle_window_properties)
+
+    steps.add(0, "armatures", upgrade_armature_bones)
+
+    # commit bc37e25 (feat(ydr): update light flags to correct names)
+    steps.add(1, "lights", upgrade_light_flags)
+    # normalize shadow_blur property
+    steps.add(1, "lights", upgrade_light_shadow_blur)
@@ -2,7 +2,6 @@
 
 import bpy
 from bpy.types import (
-    BlendData,
     Object,
     Mesh,
 )
@@ -10,6 +9,7 @@ from ..ytyp.properties.ytyp import (
     CMapTypesProperties
 )
 
+from .engine import VersioningSteps
 from .versioning_230 import get_src_props
 
 def update_lods(obj: Object):
@@ -146,20 +146,12 @@ def convert_constraint_child_of_to_copy_transform(obj: Object):
         add_child_of_bone_constraint(obj, armature_obj, bone_name)
 
 
-def do_versions(data_version: int, data: BlendData):
-    if data_version < 2:
-        for obj in data.objects:
-            update_lods(obj)
+def register_versioning_steps(steps: VersioningSteps):
+    steps.add(2, "objects", update_lods)
 
     # NOTE: moved to versioning_260 to correctly handle versioning after the multi-select collections
-    # if data_version < 3:
-    #     for scene in data.scenes:
-    #         for ytyp in scene.ytyps:
-    #             update_mlo_tcmods_percentage(ytyp)
+    # steps.add(3, "scenes", update_mlo_tcmods_percentage_in_scene)
 
-    if data_version < 4:
-        add_new_default_light_preset()
+    steps.add(4, None, add_new_default_light_preset)
 
-    if data_version < 5:
-        for obj in data.objects:
-            convert_constraint_child_of_to_copy_transform(obj)
+    steps.add(5, "objects", convert_constraint_child_of_to_copy_transform)
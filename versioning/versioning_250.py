@@ -2,10 +2,10 @@
 
 import bpy
 from bpy.types import (
-    BlendData,
     Material,
 )
 
+from .engine import VersioningSteps
 from .versioning_230 import get_src_props
 
 def update_mat_paint_layer(mat: Material):
@@ -36,7 +36,5 @@ def update_mat_paint_layer(mat: Material):
         del mat["sollumz_paint_layer"]
 
 
-def do_versions(data_version: int, data: BlendData):
-    if data_version < 6:
-        for mat in data.materials:
-            update_mat_paint_layer(mat)
+def register_versioning_steps(steps: VersioningSteps):
+    steps.add(6, "materials", update_mat_paint_layer)
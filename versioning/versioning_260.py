@@ -1,10 +1,11 @@
 """Handle changes between 2.6.0 and 2.7.0."""
 
 from bpy.types import (
-    BlendData,
     Scene,
 )
 
+from .engine import VersioningSteps
+
 
 def update_archetype_uuids_in_scene(scene: Scene):
     from uuid import uuid4
@@ -47,19 +48,17 @@ def update_archetype_multiselect_collections_in_scene(scene: Scene):
             unsafe_move_renamed_prop(arch_props, "entity_sets", "entity_sets_")
 
 
-def do_versions(data_version: int, data: BlendData):
-    if data_version < 8:
-        # Do this first as we need the archetype collections moved over before the UUIDs versinong
-        for scene in data.scenes:
-            update_archetype_multiselect_collections_in_scene(scene)
+def update_mlo_tcmods_percentage_in_scene(scene: Scene):
+    from .versioning_240 import update_mlo_tcmods_percentage
+    for ytyp in scene.ytyps:
+        update_mlo_tcmods_percentage(ytyp)
+
+
+def register_versioning_steps(steps: VersioningSteps):
+    # Do this first as we need the archetype collections moved over before the UUIDs versioning
+    steps.add(8, "scenes", update_archetype_multiselect_collections_in_scene)
 
     # NOTE: moved from versioning_240 as it needs to happen after the multi-select collections versioning
-    if data_version < 3:
-        from .versioning_240 import update_mlo_tcmods_percentage
-        for scene in data.scenes:
-            for ytyp in scene.ytyps:
-                update_mlo_tcmods_percentage(ytyp)
+    steps.add(3, "scenes", update_mlo_tcmods_percentage_in_scene)
 
-    if data_version < 7:
-        for scene in data.scenes:
-            update_archetype_uuids_in_scene(scene)
+    steps.add(7, "scenes", update_archetype_uuids_in_scene)
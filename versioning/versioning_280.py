@@ -1,10 +1,11 @@
 """Handle changes between 2.8.0 and 2.9.0."""
 
 from bpy.types import (
-    BlendData,
     Scene,
 )
 
+from .engine import VersioningSteps
+
 
 def update_archetype_spawn_point_extensions(scene: Scene):
     from .versioning_230 import move_renamed_prop, get_src_props
@@ -22,7 +23,5 @@ def update_archetype_spawn_point_extensions(scene: Scene):
                 move_renamed_prop(ext_dst_props, ext_src_props, "end", "end", time_float_to_int)
 
 
-def do_versions(data_version: int, data: BlendData):
-    if data_version < 9:
-        for scene in data.scenes:
-            update_archetype_spawn_point_extensions(scene)
+def register_versioning_steps(steps: VersioningSteps):
+    steps.add(9, "scenes", update_archetype_spawn_point_extensions)
@@ -58,6 +58,11 @@ class SOLLUMZ_OT_create_polygon_box_from_verts(bpy.types.Operator):
         min=1,
         max=10
     )
+    refine: bpy.props.BoolProperty(
+        name="Refine",
+        description="After finding the best orientation from the samples, try small rotations around it to find a tighter bounding box",
+        default=False
+    )
     sollum_type: bpy.props.EnumProperty(
         items=[
             (SollumType.BOUND_POLY_BOX.value, SOLLUMZ_UI_NAMES[SollumType.BOUND_POLY_BOX], "Create a bound polygon box object"),
@@ -92,7 +97,7 @@ class SOLLUMZ_OT_create_polygon_box_from_verts(bpy.types.Operator):
 
         pobj = create_blender_object(self.sollum_type)
 
-        obb, world_matrix = get_obb(verts, self.num_samples, self.angle_step)
+        obb, world_matrix = get_obb(verts, self.num_samples, self.angle_step, self.refine)
         bbmin, bbmax = get_obb_extents(obb)
 
         center = world_matrix @ (bbmin + bbmax) / 2
@@ -9,6 +9,12 @@ from .collision_materials import collisionmats
 from .flag_preset import FlagPresetsFile
 from ..tools.meshhelper import create_disc, create_cylinder, create_sphere, create_capsule, create_box
 from ..tools.blenderhelper import tag_redraw
+from ..shared.ui_collections import (
+    load_xml_file_cached,
+    sync_ui_collection,
+    refresh_ui_collections_deferred,
+    cancel_deferred_refresh,
+)
 from ..sollumz_preferences import get_addon_preferences
 from mathutils import Vector, Matrix
 import os
@@ -486,30 +492,36 @@ def get_default_flag_presets_path() -> str:
 flag_presets = FlagPresetsFile()
 
 
-def load_flag_presets():
-    bpy.context.window_manager.sz_flag_presets.clear()
+def _init_flag_preset_entry(item: FlagPresetProp, index: int):
+    item.index = index
 
+
+def load_flag_presets():
     path = get_flag_presets_path()
     if not os.path.exists(path):
         path = get_default_flag_presets_path()
         if not os.path.exists(path):
+            flag_presets.presets = []
+            bpy.context.window_manager.sz_flag_presets.clear()
             return
 
-    file = FlagPresetsFile.from_xml_file(path)
-    flag_presets.presets = file.presets
-    for index, preset in enumerate(flag_presets.presets):
-        item = bpy.context.window_manager.sz_flag_presets.add()
-        item.name = str(preset.name)
-        item.index = index
+    # Copy the list, operators add and remove presets before saving and the parsed file is cached
+    flag_presets.presets = list(load_xml_file_cached(path, FlagPresetsFile).presets)
+    names = [str(preset.name) for preset in flag_presets.presets]
+    sync_ui_collection(bpy.context.window_manager.sz_flag_presets, names, _init_flag_preset_entry)
+
+
+def _init_collision_material_entry(item: CollisionMaterial, index: int):
+    item.index = index
+    item.search_name = collisionmats[index].ui_name.replace(" ", "").replace("_", "")
 
 
 def load_collision_materials():
-    bpy.context.window_manager.sz_collision_materials.clear()
-    for index, mat in enumerate(collisionmats):
-        item = bpy.context.window_manager.sz_collision_materials.add()
-        item.index = index
-        item.name = mat.name
-        item.search_name = mat.ui_name.replace(" ", "").replace("_", "")
+    sync_ui_collection(
+        bpy.context.window_manager.sz_collision_materials,
+        [mat.name for mat in collisionmats],
+        _init_collision_material_entry
+    )
 
 
 def refresh_ui_collections():
@@ -519,7 +531,7 @@ def refresh_ui_collections():
 
 @persistent
 def on_blend_file_loaded(_):
-    refresh_ui_collections()
+    refresh_ui_collections_deferred(refresh_ui_collections)
 
 
 def register():
@@ -614,7 +626,7 @@ def register():
     )
 
     bpy.app.handlers.load_post.append(on_blend_file_loaded)
-    refresh_ui_collections()
+    refresh_ui_collections_deferred(refresh_ui_collections)
 
 
 def unregister():
@@ -634,6 +646,7 @@ def unregister():
     del bpy.types.WindowManager.sz_create_bound_box_parent
 
     bpy.app.handlers.load_post.remove(on_blend_file_loaded)
+    cancel_deferred_refresh(refresh_ui_collections)
 
     _collision_material_room_items_refs.clear()
     _collision_material_mlo_archetype_cache.clear()
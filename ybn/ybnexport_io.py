@@ -32,6 +32,7 @@ from ..tools.meshhelper import (
 from ..sollumz_properties import MaterialType, SOLLUMZ_UI_NAMES, SollumType, BOUND_POLYGON_TYPES
 from ..iecontext import export_context, ExportBundle
 from .. import logger
+from .. import profiling
 from .properties import CollisionMatFlags, get_collision_mat_raw_flags, BoundFlags
 
 MAX_VERTICES = 32767
@@ -41,6 +42,7 @@ def export_ybn(obj: Object) -> ExportBundle:
     return export_context().make_bundle(create_bound_composite_asset(obj))
 
 
+@profiling.traced()
 def create_bound_composite_asset(
     obj: Object,
     out_child_obj_to_index: dict[Object, int] = None,
@@ -473,6 +475,7 @@ def init_bound_geometry_primitives(
     return vertices, primitives
 
 
+@profiling.traced()
 def create_bound_geometry_vertices_and_primitives(
     bound: AssetBound,
     obj: Object
@@ -640,6 +643,7 @@ def _batch_extract_mesh_tri_data(mesh: Mesh, transforms: Matrix, color_attr):
     return tri_loop_indices, tri_mat_indices, loop_positions, loop_to_vert, colors_int
 
 
+@profiling.traced()
 def _dedupe_bound_vertices(loop_positions, loop_to_vert, colors_int, tri_loop_indices):
     """
     Deduplicate vertices using integer keys for fast 1D np.unique.
@@ -668,6 +672,8 @@ def _dedupe_bound_vertices(loop_positions, loop_to_vert, colors_int, tri_loop_in
     unique_colors = colors_int[unique_loop_idx] if colors_int is not None else None
 
     tri_vert_indices = inverse_indices.reshape((len(tri_loop_indices), 3)).astype(np.uint32)
+    profiling.count("triangles", len(tri_loop_indices))
+    profiling.count("unique_vertices", len(unique_positions))
 
     return unique_positions, unique_colors, tri_vert_indices
 
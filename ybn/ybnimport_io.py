@@ -30,6 +30,7 @@ from ..tools.utils import get_direction_of_vectors, abs_vector
 from ..tools.blenderhelper import create_blender_object, create_empty_object
 from mathutils import Matrix, Vector
 from math import radians
+from .. import profiling
 
 
 def import_ybn(asset: AssetBound, name: str):
@@ -37,6 +38,7 @@ def import_ybn(asset: AssetBound, name: str):
     return create_bound_composite(asset, name)
 
 
+@profiling.traced()
 def create_bound_composite(composite: AssetBound, name: Optional[str] = None, out_children: list[Object | None] | None = None) -> Object:
     obj = create_empty_object(SollumType.BOUND_COMPOSITE, name)
 
@@ -338,6 +340,7 @@ PRIM_TO_OBJ_MAP[BoundPrimitiveType.CAPSULE.value] = create_bound_primitive_capsu
 PRIM_TO_OBJ_MAP[BoundPrimitiveType.CYLINDER.value] = create_bound_primitive_cylinder
 
 
+@profiling.traced()
 def create_bound_geometry_triangle_mesh(
     vertices: list[BoundVertex],
     triangles: list[BoundPrimitive],
@@ -0,0 +1,109 @@
+"""
+Tolerance-driven reduction of the sampled animation tracks before they are encoded into YCD channels.
+
+The exporter samples every track at every frame. Still or linearly moving components still produce slightly different
+values each frame, which prevents static and indirect channels and forces quantized channels with a tiny quantum (i.e.
+many bits per value). Reducing the values to constant/linear spans and snapping them to a grid of ``tolerance`` fixes
+both, while keeping every value within ``tolerance`` of the original.
+"""
+import math
+import numpy as np
+from numpy.typing import NDArray
+from szio.gta5.cwxml import clipdictionary as ycdxml
+
+
+def _linear_span_fits(values: NDArray, start: int, end: int, tolerance: float) -> bool:
+    t = np.linspace(0.0, 1.0, end - start + 1)
+    line = values[start] + (values[end] - values[start]) * t
+    return np.abs(values[start:end + 1] - line).max() <= tolerance
+
+
+def find_linear_span_keys(values: NDArray, tolerance: float) -> NDArray[np.int64]:
+    """Finds the frames where linear spans start and end, such that linearly interpolating between these keys deviates
+    at most ``tolerance`` from ``values``. Spans are extended greedily with an exponential and then binary search.
+    """
+    last = len(values) - 1
+    keys = [0]
+    start = 0
+    while start < last:
+        good = start + 1  # a span between two consecutive frames always fits
+        bad = None
+        probe = start + 2
+        while probe <= last:
+            if not _linear_span_fits(values, start, probe, tolerance):
+                bad = probe
+                break
+            good = probe
+            probe = start + (probe - start) * 2
+
+        if bad is None and good < last:
+            if _linear_span_fits(values, start, last, tolerance):
+                good = last
+            else:
+                bad = last
+
+        if bad is not None:
+            while bad - good > 1:
+                mid = (good + bad) // 2
+                if _linear_span_fits(values, start, mid, tolerance):
+                    good = mid
+                else:
+                    bad = mid
+
+        keys.append(good)
+        start = good
+
+    return np.array(keys, dtype=np.int64)
+
+
+def reduce_component_values(values: list[float] | NDArray, tolerance: float) -> NDArray[np.float64]:
+    """Reduces the per-frame values of a single track component. Constant components are collapsed to a single value,
+    otherwise the values are replaced by linear spans and snapped to a grid with ``tolerance`` spacing. The result
+    deviates at most ``tolerance`` from the original values.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if tolerance <= 0.0 or len(values) < 2:
+        return values.copy()
+
+    min_value, max_value = values.min(), values.max()
+    if max_value - min_value <= tolerance * 2.0:
+        return np.full_like(values, (min_value + max_value) * 0.5)
+
+    # Half of the tolerance for the linear spans, the other half for snapping to the grid
+    keys = find_linear_span_keys(values, tolerance * 0.5)
+    reduced = np.interp(np.arange(len(values)), keys, values[keys])
+    offset = reduced.min()
+    return offset + np.round((reduced - offset) / tolerance) * tolerance
+
+
+def _quantized_bits(values: list[float], quantum: float) -> int:
+    if quantum <= 0.0:
+        return 32
+
+    value_range = max(values) - min(values)
+    return max(1, math.ceil(math.log2(value_range / quantum + 1.0)))
+
+
+def estimate_channel_size(channel: ycdxml.ChannelsList.Channel) -> int:
+    """Estimates the size in bytes of the channel when encoded in the binary resource."""
+    if isinstance(channel, ycdxml.ChannelsList.StaticFloat):
+        return 4
+    elif isinstance(channel, ycdxml.ChannelsList.StaticVector3):
+        return 12
+    elif isinstance(channel, ycdxml.ChannelsList.StaticQuaternion):
+        return 16
+    elif isinstance(channel, ycdxml.ChannelsList.RawFloat):
+        return len(channel.values) * 4
+    elif isinstance(channel, ycdxml.ChannelsList.IndirectQuantizeFloat):
+        values_bits = _quantized_bits(channel.values, channel.quantum) * len(channel.values)
+        frames_bits = max(1, math.ceil(math.log2(len(channel.values)))) * len(channel.frames)
+        return 8 + math.ceil(values_bits / 8) + math.ceil(frames_bits / 8)
+    elif isinstance(channel, ycdxml.ChannelsList.QuantizeFloat):
+        values_bits = _quantized_bits(channel.values, channel.quantum) * len(channel.values)
+        return 8 + math.ceil(values_bits / 8)
+    else:
+        assert False, f"Unsupported channel type: {type(channel).__name__}"
+
+
+def estimate_sequence_data_size(sequence_data: ycdxml.Animation.SequenceDataList.SequenceData) -> int:
+    return sum(estimate_channel_size(channel) for channel in sequence_data.channels)
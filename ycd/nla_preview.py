@@ -0,0 +1,300 @@
+"""
+Bulk NLA preview of the clips of a clip dictionary.
+
+All clips are laid out one after the other on shared NLA tracks, one set of tracks per animation target, so going from
+one clip to another only requires moving the current frame. Rebuilding the preview reuses the strips of clips that did
+not change.
+"""
+import math
+from typing import NamedTuple, Optional
+
+import bpy
+from bpy.types import (
+    Action,
+    ID,
+    NlaStrip,
+    NlaTrack,
+    Object,
+)
+from ..sollumz_properties import SollumType
+
+PREVIEW_TRACK_NAME_PREFIX = "Sollumz Preview"
+CLIP_GAP_FRAMES = 1
+
+
+class PreviewStrip(NamedTuple):
+    name: str
+    action: Action
+    frame_start: int
+    frame_end: float
+    action_frame_start: float
+    action_frame_end: float
+
+
+class PreviewStripRef(NamedTuple):
+    """Identifies a strip created for the preview, to check that it still exists."""
+    target_session_uid: int
+    track_name: str
+    strip_name: str
+    action_session_uid: int
+    frame_start: int
+
+
+class ClipPreviewRange(NamedTuple):
+    frame_start: int
+    frame_end: float
+    signature: tuple
+    strips: tuple[PreviewStripRef, ...]
+
+
+# clip dictionary object session UID -> clip object name -> frame range in the preview
+_preview_layouts: dict[int, dict[str, ClipPreviewRange]] = {}
+
+
+def clip_signature(clip_obj: Object) -> tuple:
+    """Gets a value that changes whenever the clip changes in a way that affects its NLA strips."""
+    clip_properties = clip_obj.clip_properties
+    animations = []
+    for clip_animation in clip_properties.animations:
+        animation_obj = clip_animation.animation
+        if animation_obj is None:
+            continue
+
+        animation_properties = animation_obj.animation_properties
+        target = animation_properties.get_target()
+        action = animation_properties.action
+        animations.append((
+            target.session_uid if target is not None else None,
+            action.session_uid if action is not None else None,
+            clip_animation.start_frame,
+            clip_animation.end_frame,
+        ))
+
+    return clip_properties.get_duration_in_frames(), tuple(animations)
+
+
+def find_clip_dictionary_obj(obj: Object) -> Optional[Object]:
+    """Finds the clip dictionary object that ``obj`` belongs to."""
+    while obj is not None and obj.sollum_type != SollumType.CLIP_DICTIONARY:
+        obj = obj.parent
+    return obj
+
+
+def _preview_track_name(layer: int) -> str:
+    return f"{PREVIEW_TRACK_NAME_PREFIX} {layer}"
+
+
+def _preview_strip_name(clip_obj: Object, layer: int) -> str:
+    # NLA strip names are unique per target, so clips playing multiple animations on the same target need a suffix
+    return clip_obj.name if layer == 0 else f"{clip_obj.name} ({layer})"
+
+
+def _strip_matches(strip: NlaStrip, preview_strip: PreviewStrip) -> bool:
+    return (
+        strip.action == preview_strip.action and
+        math.isclose(strip.frame_start, preview_strip.frame_start, abs_tol=1e-4) and
+        math.isclose(strip.frame_end, preview_strip.frame_end, abs_tol=1e-4) and
+        math.isclose(strip.action_frame_start, preview_strip.action_frame_start, abs_tol=1e-4) and
+        math.isclose(strip.action_frame_end, preview_strip.action_frame_end, abs_tol=1e-4)
+    )
+
+
+def _sync_track_strips(track: NlaTrack, preview_strips: list[PreviewStrip]):
+    """Updates the strips of the track to match ``preview_strips``. The leading strips that already match are kept as
+    is, every strip after the first mismatch is recreated.
+    """
+    # New strips are created spanning the whole action frame range before being trimmed, so there cannot be any strips
+    # after them or Blender fails to add the strip when the ranges overlap. Only keep the matching strips at the start
+    # of the track and recreate the rest in frame order.
+    strips = sorted(track.strips, key=lambda s: s.frame_start)
+    num_kept_strips = 0
+    for strip, preview_strip in zip(strips, preview_strips):
+        if strip.name != preview_strip.name or not _strip_matches(strip, preview_strip):
+            break
+        num_kept_strips += 1
+
+    for strip in strips[num_kept_strips:]:
+        track.strips.remove(strip)
+
+    for preview_strip in preview_strips[num_kept_strips:]:
+        strip = track.strips.new(preview_strip.name, preview_strip.frame_start, preview_strip.action)
+        strip.frame_end = preview_strip.frame_end
+        strip.blend_type = "COMBINE"
+        strip.extrapolation = "NOTHING"
+        strip.name = preview_strip.name
+
+        clip_frame_duration = preview_strip.frame_end - preview_strip.frame_start
+        action_frame_duration = preview_strip.action_frame_end - preview_strip.action_frame_start
+        strip.scale = clip_frame_duration / action_frame_duration
+        strip.action_frame_start = preview_strip.action_frame_start
+        strip.action_frame_end = preview_strip.action_frame_end
+
+
+def build_clip_dictionary_nla_preview(clip_dictionary_obj: Object) -> dict[str, ClipPreviewRange]:
+    """Lays out all clips of the clip dictionary sequentially on the NLA tracks of their targets. Returns the frame
+    range of each clip by clip object name.
+    """
+    clips_obj = next((c for c in clip_dictionary_obj.children if c.sollum_type == SollumType.CLIPS), None)
+    clip_objs = sorted(clips_obj.children, key=lambda o: o.name) if clips_obj is not None else []
+
+    # (target, layer) -> strips
+    preview_strips: dict[tuple[ID, int], list[PreviewStrip]] = {}
+    layout: dict[str, ClipPreviewRange] = {}
+    frame = 0
+    for clip_obj in clip_objs:
+        clip_properties = clip_obj.clip_properties
+        clip_frame_duration = clip_properties.get_duration_in_frames()
+        if clip_frame_duration <= 0.0:
+            continue
+
+        target_layers: dict[ID, int] = {}
+        strip_refs = []
+        for clip_animation in clip_properties.animations:
+            if clip_animation.animation is None:
+                continue
+
+            animation_properties = clip_animation.animation.animation_properties
+            target = animation_properties.get_target()
+            action = animation_properties.action
+            if target is None or action is None or clip_animation.end_frame <= clip_animation.start_frame:
+                continue
+
+            layer = target_layers.get(target, 0)
+            target_layers[target] = layer + 1
+            strip_name = _preview_strip_name(clip_obj, layer)
+            preview_strips.setdefault((target, layer), []).append(PreviewStrip(
+                strip_name,
+                action,
+                frame,
+                frame + clip_frame_duration,
+                clip_animation.start_frame,
+                clip_animation.end_frame,
+            ))
+            strip_refs.append(PreviewStripRef(
+                target.session_uid, _preview_track_name(layer), strip_name, action.session_uid, frame
+            ))
+
+        layout[clip_obj.name] = ClipPreviewRange(
+            frame, frame + clip_frame_duration, clip_signature(clip_obj), tuple(strip_refs)
+        )
+        frame = math.ceil(frame + clip_frame_duration) + CLIP_GAP_FRAMES
+
+    targets = {target for target, _ in preview_strips.keys()}
+
+    # The tracks of these targets are rebuilt below, any other clip dictionary previewed on them loses its strips
+    target_uids = {target.session_uid for target in targets}
+    for other_uid, other_layout in list(_preview_layouts.items()):
+        if other_uid == clip_dictionary_obj.session_uid:
+            continue
+
+        if not target_uids.isdisjoint(_layout_target_uids(other_layout)):
+            del _preview_layouts[other_uid]
+
+    for target in targets:
+        if target.animation_data is None:
+            target.animation_data_create()
+
+        nla_tracks = target.animation_data.nla_tracks
+        track_names = {_preview_track_name(layer) for t, layer in preview_strips.keys() if t == target}
+        for nla_track in list(nla_tracks):
+            if nla_track.name not in track_names:
+                # Remove tracks from previous single clip previews too, they would play on top of this preview
+                nla_tracks.remove(nla_track)
+
+        for (t, layer), strips in sorted(preview_strips.items(), key=lambda item: item[0][1]):
+            if t != target:
+                continue
+
+            track_name = _preview_track_name(layer)
+            nla_track = nla_tracks.get(track_name, None)
+            if nla_track is None:
+                nla_track = nla_tracks.new()
+                nla_track.name = track_name
+
+            _sync_track_strips(nla_track, strips)
+
+    _preview_layouts[clip_dictionary_obj.session_uid] = layout
+    return layout
+
+
+def get_clip_preview_range(clip_obj: Object) -> Optional[ClipPreviewRange]:
+    """Gets the frame range of the clip in the NLA preview of its clip dictionary. Returns ``None`` if there is no
+    preview or the clip changed since the preview was built.
+    """
+    clip_dictionary_obj = find_clip_dictionary_obj(clip_obj)
+    if clip_dictionary_obj is None:
+        return None
+
+    layout = _preview_layouts.get(clip_dictionary_obj.session_uid, None)
+    if layout is None:
+        return None
+
+    preview_range = layout.get(clip_obj.name, None)
+    if preview_range is None or preview_range.signature != clip_signature(clip_obj):
+        return None
+
+    if not _are_preview_strips_present(clip_obj, preview_range):
+        # Tracks modified after building the preview, e.g. manual NLA edits
+        del layout[clip_obj.name]
+        return None
+
+    return preview_range
+
+
+def _layout_target_uids(layout: dict[str, ClipPreviewRange]) -> set[int]:
+    return {strip_ref.target_session_uid for preview_range in layout.values() for strip_ref in preview_range.strips}
+
+
+def _are_preview_strips_present(clip_obj: Object, preview_range: ClipPreviewRange) -> bool:
+    """Checks that the NLA strips created for the clip are still on the tracks of its targets."""
+    targets_by_uid = {}
+    for clip_animation in clip_obj.clip_properties.animations:
+        if clip_animation.animation is not None:
+            target = clip_animation.animation.animation_properties.get_target()
+            if target is not None:
+                targets_by_uid[target.session_uid] = target
+
+    for strip_ref in preview_range.strips:
+        target = targets_by_uid.get(strip_ref.target_session_uid, None)
+        if target is None or target.animation_data is None:
+            return False
+
+        nla_track = target.animation_data.nla_tracks.get(strip_ref.track_name, None)
+        strip = nla_track.strips.get(strip_ref.strip_name, None) if nla_track is not None else None
+        if (
+            strip is None or
+            strip.action is None or
+            strip.action.session_uid != strip_ref.action_session_uid or
+            not math.isclose(strip.frame_start, strip_ref.frame_start, abs_tol=1e-4)
+        ):
+            return False
+
+    return True
+
+
+def clear_nla_previews():
+    """Forgets all built previews. Used when the NLA tracks are modified outside of the preview."""
+    _preview_layouts.clear()
+
+
+@bpy.app.handlers.persistent
+def load_post_handler(*args):
+    clear_nla_previews()
+
+
+@bpy.app.handlers.persistent
+def undo_redo_post_handler(*args):
+    # Undo/redo can restore the NLA tracks to any previous state
+    clear_nla_previews()
+
+
+def register():
+    bpy.app.handlers.load_post.append(load_post_handler)
+    bpy.app.handlers.undo_post.append(undo_redo_post_handler)
+    bpy.app.handlers.redo_post.append(undo_redo_post_handler)
+
+
+def unregister():
+    bpy.app.handlers.load_post.remove(load_post_handler)
+    bpy.app.handlers.undo_post.remove(undo_redo_post_handler)
+    bpy.app.handlers.redo_post.remove(undo_redo_post_handler)
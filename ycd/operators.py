@@ -1,4 +1,7 @@
 import bpy
+import math
+import numpy as np
+from numpy.typing import NDArray
 from ..sollumz_helper import SOLLUMZ_OT_base
 from ..sollumz_properties import SollumType
 from ..tools.blenderhelper import find_child_by_type
@@ -8,10 +11,19 @@ from ..tools.animationhelper import (
     is_any_sollumz_animation_obj,
     update_uv_clip_hash,
     get_scene_fps,
-    action_fcurves,
     action_remove_fcurves,
+    action_ensure_fcurve,
+    fcurve_set_keyframes,
+    is_uv_animation_supported,
+)
+from ..shared.material_users import get_material_users_index
+from .nla_preview import (
+    ClipPreviewRange,
+    build_clip_dictionary_nla_preview,
+    clear_nla_previews,
+    find_clip_dictionary_obj,
+    get_clip_preview_range,
 )
-from .ycdimport import create_clip_dictionary_template, create_anim_obj
 from .. import logger
 
 
@@ -77,6 +89,12 @@ class SOLLUMZ_OT_clip_apply_nla(SOLLUMZ_OT_base, bpy.types.Operator):
         if clip_obj.sollum_type != SollumType.CLIP:
             return {"FINISHED"}
 
+        preview_range = get_clip_preview_range(clip_obj)
+        if preview_range is not None:
+            # The clip is already laid out in the clip dictionary preview, just jump to it
+            set_scene_frame_range_to_clip_preview(context.scene, preview_range)
+            return {"FINISHED"}
+
         clip_properties = clip_obj.clip_properties
         if len(clip_properties.animations) <= 0:
             return {"FINISHED"}
@@ -118,6 +136,7 @@ class SOLLUMZ_OT_clip_apply_nla(SOLLUMZ_OT_base, bpy.types.Operator):
 
         for nla_track in target.animation_data.nla_tracks:
             target.animation_data.nla_tracks.remove(nla_track)
+        clear_nla_previews()
 
         for group_name, clips in groups.items():
             track = target.animation_data.nla_tracks.new()
@@ -143,6 +162,42 @@ class SOLLUMZ_OT_clip_apply_nla(SOLLUMZ_OT_base, bpy.types.Operator):
         return {"FINISHED"}
 
 
+def set_scene_frame_range_to_clip_preview(scene: bpy.types.Scene, preview_range: ClipPreviewRange):
+    scene.frame_start = preview_range.frame_start
+    scene.frame_end = math.ceil(preview_range.frame_end)
+    scene.frame_current = preview_range.frame_start
+
+
+class SOLLUMZ_OT_clip_dictionary_preview_nla(SOLLUMZ_OT_base, bpy.types.Operator):
+    bl_idname = "sollumz.clip_dictionary_preview_nla"
+    bl_label = "Preview All Clips in NLA"
+    bl_description = (
+        "Lays out all clips of the clip dictionary one after the other as Nonlinear Animation. Applying a clip to NLA "
+        "afterwards jumps to the clip in this preview instead of rebuilding the NLA tracks"
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return context.active_object is not None and find_clip_dictionary_obj(context.active_object) is not None
+
+    def run(self, context):
+        clip_dictionary_obj = find_clip_dictionary_obj(context.active_object)
+        layout = build_clip_dictionary_nla_preview(clip_dictionary_obj)
+        if not layout:
+            self.warning(f"Clip dictionary '{clip_dictionary_obj.name}' has no clips to preview.")
+            return False
+
+        active_range = get_clip_preview_range(context.active_object)
+        if active_range is not None:
+            set_scene_frame_range_to_clip_preview(context.scene, active_range)
+        else:
+            context.scene.frame_start = 0
+            context.scene.frame_end = math.ceil(max(r.frame_end for r in layout.values()))
+
+        self.message(f"Laid out {len(layout)} clip(s) of '{clip_dictionary_obj.name}'.")
+        return True
+
+
 class SOLLUMZ_OT_clip_recalculate_uv_hash(SOLLUMZ_OT_base, bpy.types.Operator):
     bl_idname = "sollumz.clip_recalculate_uv_hash"
     bl_label = "Recalculate UV Clip Hash"
@@ -161,6 +216,48 @@ class SOLLUMZ_OT_clip_recalculate_uv_hash(SOLLUMZ_OT_base, bpy.types.Operator):
                 return {"CANCELLED"}
 
 
+class SOLLUMZ_OT_clip_dictionary_recalculate_uv_hashes(SOLLUMZ_OT_base, bpy.types.Operator):
+    bl_idname = "sollumz.clip_dictionary_recalculate_uv_hashes"
+    bl_label = "Recalculate All UV Clip Hashes"
+    bl_description = (
+        "Recalculate the hash of all UV clips in the clip dictionary based on their target material and model name"
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return context.active_object is not None and find_clip_dictionary_obj(context.active_object) is not None
+
+    def run(self, context):
+        with logger.use_operator_logger(self):
+            clip_dictionary_obj = find_clip_dictionary_obj(context.active_object)
+            clips_obj = find_child_by_type(clip_dictionary_obj, SollumType.CLIPS)
+            if clips_obj is None:
+                return {"CANCELLED"}
+
+            index = None
+            num_updated = 0
+            num_failed = 0
+            for clip_obj in clips_obj.children:
+                clip_animations = clip_obj.clip_properties.animations
+                if (
+                    len(clip_animations) == 0 or
+                    clip_animations[0].animation is None or
+                    clip_animations[0].animation.animation_properties.target_id_type != "MATERIAL"
+                ):
+                    continue
+
+                if index is None:
+                    index = get_material_users_index(context)
+
+                if update_uv_clip_hash(clip_obj, index):
+                    num_updated += 1
+                else:
+                    num_failed += 1
+
+            logger.info(f"Recalculated {num_updated} UV clip hash(es), {num_failed} failed.")
+            return {"FINISHED"}
+
+
 class SOLLUMZ_OT_clip_new_animation(SOLLUMZ_OT_base, bpy.types.Operator):
     bl_idname = "sollumz.clip_new_animation"
     bl_label = "Add a new Animation Link"
@@ -548,6 +645,8 @@ class SOLLUMZ_OT_create_clip_dictionary(SOLLUMZ_OT_base, bpy.types.Operator):
     bl_label = "Create clip dictionary template"
 
     def run(self, context):
+        from .ycdimport import create_clip_dictionary_template
+
         create_clip_dictionary_template("Clip Dictionary")
         return {"FINISHED"}
 
@@ -585,6 +684,8 @@ class SOLLUMZ_OT_create_clip(SOLLUMZ_OT_base, bpy.types.Operator):
                 clip_dictionary_obj, SollumType.CLIPS)
 
         if clips_obj is not None:
+            from .ycdimport import create_anim_obj
+
             animation_obj = create_anim_obj(SollumType.CLIP)
 
             animation_obj.parent = clips_obj
@@ -625,6 +726,8 @@ class SOLLUMZ_OT_create_animation(SOLLUMZ_OT_base, bpy.types.Operator):
                 clip_dictionary_obj, SollumType.ANIMATIONS)
 
         if animations_obj is not None:
+            from .ycdimport import create_anim_obj
+
             animation_obj = create_anim_obj(SollumType.ANIMATION)
 
             animation_obj.parent = animations_obj
@@ -699,6 +802,46 @@ class SOLLUMZ_OT_uv_transform_move(SOLLUMZ_OT_base, bpy.types.Operator):
         return {"FINISHED"}
 
 
+def create_uv_sprite_sheet_animation(
+    mat: bpy.types.Material,
+    scale: tuple[float, float],
+    keyframes: NDArray,
+    translations: NDArray,
+):
+    """Replaces the UV transforms of the material with a scale and a translation transform, and builds their F-curves
+    directly from the keyframe arrays with constant interpolation."""
+    animation_tracks = mat.animation_tracks
+
+    if mat.animation_data and mat.animation_data.action:
+        # clear uv_transforms channels
+        action = mat.animation_data.action
+        action_remove_fcurves(action, lambda fcurve: fcurve.data_path.startswith("animation_tracks.uv_transforms"))
+
+    animation_tracks.uv_transforms.clear()
+    scale_transform = animation_tracks.uv_transforms.add()
+    scale_transform.mode = "SCALE"
+    translate_transform = animation_tracks.uv_transforms.add()
+    translate_transform.mode = "TRANSLATE"
+    scale_transform.scale = scale
+
+    if mat.animation_data is None:
+        mat.animation_data_create()
+    if mat.animation_data.action is None:
+        mat.animation_data.action = bpy.data.actions.new(f"{mat.name}Action")
+    action = mat.animation_data.action
+
+    scale_data_path = scale_transform.path_from_id("scale")
+    for i in range(2):
+        fcurve = action_ensure_fcurve(action, mat, scale_data_path, i)
+        fcurve_set_keyframes(fcurve, np.zeros(1), np.array((scale[i],)), interpolation="CONSTANT")
+
+    if len(keyframes) > 0:
+        translation_data_path = translate_transform.path_from_id("translation")
+        for i in range(2):
+            fcurve = action_ensure_fcurve(action, mat, translation_data_path, i)
+            fcurve_set_keyframes(fcurve, keyframes, translations[:, i], interpolation="CONSTANT")
+
+
 # helper properties for SOLLUMZ_OT_uv_sprite_sheet_anim
 class UVSpriteSheetFrame(bpy.types.PropertyGroup):
     def on_use_changed(self, context):
@@ -861,25 +1004,15 @@ class SOLLUMZ_OT_uv_sprite_sheet_anim(SOLLUMZ_OT_base, bpy.types.Operator):
     auto_dst_frame_offset_y: bpy.props.FloatProperty(default=0, subtype="PIXEL", step=100)
     auto_dst_frame_width: bpy.props.FloatProperty(min=1, default=1, subtype="PIXEL", step=100)
     auto_dst_frame_height: bpy.props.FloatProperty(min=1, default=1, subtype="PIXEL", step=100)
+    all_selected_materials: bpy.props.BoolProperty(
+        name="All Selected Materials",
+        description="Create the animation on the active material of all selected objects, not only the active one. "
+                    "All materials must use the same sprite sheet layout",
+        default=False)
 
     def run(self, context):
         self.render_shutdown(context)
 
-        obj = context.active_object
-        mat = obj.active_material
-        animation_tracks = mat.animation_tracks
-
-        if mat.animation_data and mat.animation_data.action:
-            # clear uv_transforms channels
-            action = mat.animation_data.action
-            action_remove_fcurves(action, lambda fcurve: fcurve.data_path.startswith("animation_tracks.uv_transforms"))
-
-        animation_tracks.uv_transforms.clear()
-        scale_transform = animation_tracks.uv_transforms.add()
-        scale_transform.mode = "SCALE"
-        translate_transform = animation_tracks.uv_transforms.add()
-        translate_transform.mode = "TRANSLATE"
-
         img_w, img_h = self._image.size
         frame_w = self.frame_width / img_w
         frame_h = self.frame_height / img_h
@@ -890,39 +1023,42 @@ class SOLLUMZ_OT_uv_sprite_sheet_anim(SOLLUMZ_OT_base, bpy.types.Operator):
         frame_sep_x = self.separation_horizontal / img_w
         frame_sep_y = self.separation_vertical / img_h
 
-        scale_transform.scale = (scale_x, scale_y)
-        scale_transform.keyframe_insert(data_path="scale", frame=0)
+        num_frames = len(self.frames)
+        frames_use = np.empty(num_frames, dtype=bool)
+        frames_order = np.empty(num_frames, dtype=np.int32)
+        self.frames.foreach_get("use", frames_use)
+        self.frames.foreach_get("order", frames_order)
+
+        frames_indices = np.arange(num_frames)[frames_use]
+        frames_x = frames_indices % self.frames_horizontal
+        frames_y = frames_indices // self.frames_horizontal
+        frames_order = frames_order[frames_use]
+        translations = np.column_stack((
+            frame_offset_x + frames_x * frame_w + frames_x * frame_sep_x,
+            frame_offset_y + frames_y * frame_h + frames_y * frame_sep_y,
+        ))
+        keyframes = frames_order * self.keyframe_interval
+
+        sort_indices = np.argsort(keyframes, kind="stable")
+        keyframes = keyframes[sort_indices]
+        translations = translations[sort_indices]
 
         frame_end = 0
-        frame_end_translation = (0.0, 0.0)
-        for y in range(self.frames_vertical):
-            for x in range(self.frames_horizontal):
-                i = y * self.frames_horizontal + x
-                frame = self.frames[i]
-                if frame.use:
-                    frame_x = frame_offset_x + x * frame_w + x * frame_sep_x
-                    frame_y = frame_offset_y + y * frame_h + y * frame_sep_y
-
-                    frame_idx = frame.order * self.keyframe_interval
-                    translate_transform.translation = (frame_x, frame_y)
-                    translate_transform.keyframe_insert(data_path="translation", frame=frame_idx)
-
-                    next_frame_idx = (frame.order + 1) * self.keyframe_interval
-                    if next_frame_idx > frame_end:
-                        frame_end = next_frame_idx
-                        frame_end_translation = (frame_x, frame_y)
-
-        if frame_end != 0:
+        if len(keyframes) > 0:
             # insert one last keyframe to keep the last frame visible for the specified duration before it loops
-            translate_transform.translation = frame_end_translation
-            translate_transform.keyframe_insert(data_path="translation", frame=frame_end)
-
-        # make all keyframes constant
-        action = mat.animation_data.action
-        for fcurve in action_fcurves(action):
-            if fcurve.data_path.startswith("animation_tracks.uv_transforms"):
-                for keyframe in fcurve.keyframe_points:
-                    keyframe.interpolation = "CONSTANT"
+            frame_end = int(keyframes[-1]) + self.keyframe_interval
+            keyframes = np.append(keyframes, frame_end)
+            translations = np.vstack((translations, translations[-1]))
+
+        materials = [context.active_object.active_material]
+        if self.all_selected_materials:
+            materials.extend(
+                obj.active_material
+                for obj in context.selected_objects
+                if obj.active_material is not None and is_uv_animation_supported(obj.active_material)
+            )
+        for mat in dict.fromkeys(materials):
+            create_uv_sprite_sheet_animation(mat, (scale_x, scale_y), keyframes, translations)
 
         bpy.context.scene.frame_start = 0
         bpy.context.scene.frame_end = frame_end
@@ -964,6 +1100,7 @@ class SOLLUMZ_OT_uv_sprite_sheet_anim(SOLLUMZ_OT_base, bpy.types.Operator):
         col.prop(self, "separation_vertical", text="Vertical")
 
         left_col.prop(self, "keyframe_interval")
+        left_col.prop(self, "all_selected_materials")
 
         left_col.prop(self, "use_dst_frame", text="Destination Frame")
         col = left_col.column(align=True)
@@ -522,6 +522,8 @@ class SOLLUMZ_PT_ANIMATIONS_TOOL_PANEL(bpy.types.Panel):
             if is_any_sollumz_animation_obj(active_object):
                 layout.operator(ycd_ops.SOLLUMZ_OT_create_clip.bl_idname)
                 layout.operator(ycd_ops.SOLLUMZ_OT_create_animation.bl_idname)
+                layout.operator(ycd_ops.SOLLUMZ_OT_clip_dictionary_preview_nla.bl_idname, icon="NLA")
+                layout.operator(ycd_ops.SOLLUMZ_OT_clip_dictionary_recalculate_uv_hashes.bl_idname, icon="FILE_REFRESH")
             else:
                 row = layout.row(align=False)
                 row.operator(ycd_ops.SOLLUMZ_OT_create_clip_dictionary.bl_idname)
@@ -1,8 +1,9 @@
 import bpy
 from mathutils import Vector, Quaternion
+import contextlib
 import math
 import struct
-from typing import Optional
+from typing import Optional, NamedTuple
 from szio.gta5.cwxml import clipdictionary as ycdxml
 from ..sollumz_properties import SollumType
 from ..tools import jenkhash
@@ -21,9 +22,12 @@ from ..tools.animationhelper import (
     get_action_export_frame_count,
     action_fcurves,
 )
+from ..sollumz_preferences import get_export_settings
 from .properties import ClipAttribute, ClipTag, calculate_final_uv_transform_matrix
+from .keyframe_reduction import reduce_component_values, estimate_channel_size, estimate_sequence_data_size
 
 from .. import logger
+from .. import profiling
 
 
 def parse_uv_transform_data_path(data_path: str) -> tuple[int, str]:
@@ -243,8 +247,9 @@ def build_values_channel(
         channel.offset = min_value
         channel.quantum = quantum
 
+        uniq_values_indices = {value: i for i, value in enumerate(uniq_values)}
         for value in values:
-            channel.frames.append(uniq_values.index(value))
+            channel.frames.append(uniq_values_indices[value])
     else:
         channel = ycdxml.ChannelsList.QuantizeFloat()
 
@@ -262,84 +267,161 @@ def build_values_channel(
     return channel
 
 
+def build_cheapest_values_channel(values: list[float], uniq_values: list[float]) -> ycdxml.ChannelsList.Channel:
+    """Builds the channel type with the smallest encoded size for the given values."""
+    if len(uniq_values) == 1:
+        return build_values_channel(values, uniq_values)
+
+    indirect_channel = build_values_channel(values, uniq_values, indirect_percentage=1.0)
+    quantize_channel = build_values_channel(values, uniq_values, indirect_percentage=0.0)
+    if estimate_channel_size(indirect_channel) < estimate_channel_size(quantize_channel):
+        return indirect_channel
+    else:
+        return quantize_channel
+
+
 def sequence_data_from_frames_data(
     track: Track,
-    frames_data: TrackFramesData
+    frames_data: TrackFramesData,
+    reduction_tolerance: Optional[float] = None,
 ) -> ycdxml.Animation.SequenceDataList.SequenceData:
+    """Encodes the frames of a track into channels. If ``reduction_tolerance`` is given, the frames are reduced first
+    (see ``keyframe_reduction.reduce_component_values``) and the cheapest channel type is chosen for each component.
+    """
     sequence_data = ycdxml.Animation.SequenceDataList.SequenceData()
 
     track_format = TrackFormatMap[track]
 
     if track_format == TrackFormat.Vector3:
-        values_x = []
-        values_y = []
-        values_z = []
-
-        for vector in frames_data:
-            values_x.append(vector.x)
-            values_y.append(vector.y)
-            values_z.append(vector.z)
+        components = [
+            [vector.x for vector in frames_data],
+            [vector.y for vector in frames_data],
+            [vector.z for vector in frames_data],
+        ]
+    elif track_format == TrackFormat.Quaternion:
+        components = [
+            [quat.x for quat in frames_data],
+            [quat.y for quat in frames_data],
+            [quat.z for quat in frames_data],
+            [quat.w for quat in frames_data],
+        ]
+    elif track_format == TrackFormat.Float:
+        components = [list(frames_data)]
 
-        uniq_x = list(set(values_x))
-        len_uniq_x = len(uniq_x)
+    if reduction_tolerance is not None:
+        components = [reduce_component_values(values, reduction_tolerance).tolist() for values in components]
+        build_channel = build_cheapest_values_channel
+    else:
+        build_channel = build_values_channel
 
-        uniq_y = list(set(values_y))
-        len_uniq_y = len(uniq_y)
+    uniq_components = [list(set(values)) for values in components]
+    is_static = all(len(uniq_values) == 1 for uniq_values in uniq_components)
 
-        uniq_z = list(set(values_z))
-        len_uniq_z = len(uniq_z)
+    if is_static and track_format == TrackFormat.Vector3:
+        channel = ycdxml.ChannelsList.StaticVector3()
+        channel.value = Vector([values[0] for values in components])
 
-        if len_uniq_x == 1 and len_uniq_y == 1 and len_uniq_z == 1:
-            channel = ycdxml.ChannelsList.StaticVector3()
-            channel.value = frames_data[0]
+        sequence_data.channels.append(channel)
+    elif is_static and track_format == TrackFormat.Quaternion:
+        x, y, z, w = (values[0] for values in components)
+        channel = ycdxml.ChannelsList.StaticQuaternion()
+        channel.value = Quaternion((w, x, y, z))
 
-            sequence_data.channels.append(channel)
-        else:
-            sequence_data.channels.append(build_values_channel(values_x, uniq_x))
-            sequence_data.channels.append(build_values_channel(values_y, uniq_y))
-            sequence_data.channels.append(build_values_channel(values_z, uniq_z))
-    elif track_format == TrackFormat.Quaternion:
-        values_x = []
-        values_y = []
-        values_z = []
-        values_w = []
-
-        for quat in frames_data:
-            values_x.append(quat.x)
-            values_y.append(quat.y)
-            values_z.append(quat.z)
-            values_w.append(quat.w)
-
-        uniq_x = list(set(values_x))
-        len_uniq_x = len(uniq_x)
-
-        uniq_y = list(set(values_y))
-        len_uniq_y = len(uniq_y)
-
-        uniq_z = list(set(values_z))
-        len_uniq_z = len(uniq_z)
-
-        uniq_w = list(set(values_w))
-        len_uniq_w = len(uniq_w)
-
-        if len_uniq_x == 1 and len_uniq_y == 1 and len_uniq_z == 1 and len_uniq_w == 1:
-            channel = ycdxml.ChannelsList.StaticQuaternion()
-            channel.value = frames_data[0]
-
-            sequence_data.channels.append(channel)
-        else:
-            sequence_data.channels.append(build_values_channel(values_x, uniq_x))
-            sequence_data.channels.append(build_values_channel(values_y, uniq_y))
-            sequence_data.channels.append(build_values_channel(values_z, uniq_z))
-            sequence_data.channels.append(build_values_channel(values_w, uniq_w))
-    elif track_format == TrackFormat.Float:
-        values = frames_data
-        uniq = list(set(values))
-        sequence_data.channels.append(build_values_channel(values, uniq))
+        sequence_data.channels.append(channel)
+    else:
+        for values, uniq_values in zip(components, uniq_components):
+            sequence_data.channels.append(build_channel(values, uniq_values))
 
     return sequence_data
 
 
+class EncodedSequence(NamedTuple):
+    tracks: list[tuple[int, Track]]
+    sequence_datas: list[ycdxml.Animation.SequenceDataList.SequenceData]
+    original_size: int
+    reduced_size: int
+
+
+@profiling.traced()
+def encode_sequence_items(sequence_items: SequenceItems, reduction_tolerance: Optional[float]) -> EncodedSequence:
+    """Encodes the sampled tracks into channels, sorted in the order expected by the game."""
+    tracks = []
+    sequence_datas = []
+    original_size = 0
+    reduced_size = 0
+
+    sorted_sequence_items = [(bone_id, track, frames_data)
+                             for bone_id, bones_data in sequence_items.items()
+                             for track, frames_data in bones_data.items()]
+    sorted_sequence_items.sort(key=lambda x: x[0] | (x[1].value << 16))
+    for bone_id, track, frames_data in sorted_sequence_items:
+        sequence_data = sequence_data_from_frames_data(track, frames_data, reduction_tolerance)
+        if reduction_tolerance is not None:
+            original_size += estimate_sequence_data_size(sequence_data_from_frames_data(track, frames_data))
+            reduced_size += estimate_sequence_data_size(sequence_data)
+
+        tracks.append((bone_id, track))
+        sequence_datas.append(sequence_data)
+
+    return EncodedSequence(tracks, sequence_datas, original_size, reduced_size)
+
+
+class ClipDictionaryExportPlanner:
+    """Shares work between the animations exported within a ``clip_dictionary_export_scope``. Animations that play the
+    same action on the same target produce the same sequence, so the action is sampled and encoded only once no matter
+    how many animations, in one or more clip dictionaries, use it.
+    """
+
+    def __init__(self):
+        self._encoded_sequences: dict[tuple, EncodedSequence] = {}
+        self.num_requests = 0
+
+    def encoded_sequence(
+        self,
+        action: bpy.types.Action,
+        target_id: Optional[bpy.types.ID],
+        reduction_tolerance: Optional[float]
+    ) -> EncodedSequence:
+        self.num_requests += 1
+        key = (action.session_uid, target_id.session_uid if target_id is not None else None, reduction_tolerance)
+        encoded = self._encoded_sequences.get(key, None)
+        if encoded is None:
+            sequence_items = sequence_items_from_action(action, target_id)
+            encoded = encode_sequence_items(sequence_items, reduction_tolerance)
+            self._encoded_sequences[key] = encoded
+        return encoded
+
+    @property
+    def num_encoded_sequences(self) -> int:
+        return len(self._encoded_sequences)
+
+
+g_clip_dictionary_export_planner: Optional[ClipDictionaryExportPlanner] = None
+
+
+@contextlib.contextmanager
+def clip_dictionary_export_scope():
+    """Starts a clip dictionary export scope, where all exported clip dictionaries share a single
+    ``ClipDictionaryExportPlanner``. Returns a context manager. Nested scopes reuse the outer planner.
+    """
+    global g_clip_dictionary_export_planner
+    if g_clip_dictionary_export_planner is not None:
+        yield g_clip_dictionary_export_planner
+        return
+
+    planner = ClipDictionaryExportPlanner()
+    g_clip_dictionary_export_planner = planner
+    try:
+        yield planner
+    finally:
+        g_clip_dictionary_export_planner = None
+        if planner.num_requests > planner.num_encoded_sequences:
+            logger.info(
+                f"Sampled {planner.num_encoded_sequences} unique action(s) for {planner.num_requests} animation(s)."
+            )
+
+
+@profiling.traced()
 def animation_from_object(animation_obj: bpy.types.Object) -> Optional[ycdxml.Animation]:
     animation_properties = animation_obj.animation_properties
     action = animation_properties.action
@@ -359,23 +441,23 @@ def animation_from_object(animation_obj: bpy.types.Object) -> Optional[ycdxml.An
     # TODO: CW should calculate this on import with the proper hash function
     animation.unknown1C = f"hash_{jenkhash.Generate(animation_properties.hash) + 1:08X}"
 
+    export_settings = get_export_settings()
+    reduction_tolerance = (
+        export_settings.ycd_keyframe_reduction_tolerance if export_settings.ycd_keyframe_reduction else None
+    )
+
     target_id = animation_properties.target_id
-    sequence_items = sequence_items_from_action(action, target_id)
+    with clip_dictionary_export_scope() as planner:
+        encoded = planner.encoded_sequence(action, target_id, reduction_tolerance)
 
     sequence = ycdxml.Animation.SequenceList.Sequence()
     sequence.frame_count = export_frame_count
     sequence.hash = "hash_00000000"  # TODO: calculate signature
 
-    sequence_datas = [(bone_id, track, frames_data)
-                      for bone_id, bones_data in sequence_items.items()
-                      for track, frames_data in bones_data.items()]
-    sequence_datas.sort(key=lambda x: x[0] | (x[1].value << 16))
-    for bone_id, track, frames_data in sequence_datas:
+    for (bone_id, track), sequence_data in zip(encoded.tracks, encoded.sequence_datas):
         if track == Track.MoverPosition or track == Track.MoverRotation:
             animation.unknown10 |= AnimationFlag.RootMotion
 
-        sequence_data = sequence_data_from_frames_data(track, frames_data)
-
         seq_bone_id = ycdxml.Animation.BoneIdList.BoneId()
         seq_bone_id.bone_id = bone_id
         seq_bone_id.track = track.value
@@ -386,6 +468,12 @@ def animation_from_object(animation_obj: bpy.types.Object) -> Optional[ycdxml.An
 
     animation.sequences.append(sequence)
 
+    if reduction_tolerance is not None and encoded.original_size > 0:
+        logger.info(
+            f"Animation '{animation_obj.name}' keyframe reduction: {encoded.original_size} -> {encoded.reduced_size} "
+            f"bytes ({encoded.reduced_size / encoded.original_size:.1%} of original size)."
+        )
+
     # Get int value from enum, a bit junky...
     animation.unknown10 = animation.unknown10.value
 
@@ -469,6 +557,7 @@ def clip_tag_calc_signature(tag: ClipTag) -> int:
     return signature
 
 
+@profiling.traced()
 def clip_from_object(clip_obj: bpy.types.Object) -> ycdxml.Clip:
     clip_properties = clip_obj.clip_properties
 
@@ -533,6 +622,7 @@ def clip_from_object(clip_obj: bpy.types.Object) -> ycdxml.Clip:
     return xml_clip
 
 
+@profiling.traced()
 def clip_dictionary_from_object(obj: bpy.types.Object) -> Optional[ycdxml.ClipDictionary]:
     clip_dictionary = ycdxml.ClipDictionary()
 
@@ -567,6 +657,8 @@ def clip_dictionary_from_object(obj: bpy.types.Object) -> Optional[ycdxml.ClipDi
 
 
 def export_ycd(obj: bpy.types.Object, filepath: str) -> bool:
+    """Exports the clip dictionary to ``filepath``. To export multiple clip dictionaries sharing the sampled actions,
+    call this inside a ``clip_dictionary_export_scope``."""
     clip_dict = clip_dictionary_from_object(obj)
     if clip_dict is None:
         return False
@@ -12,6 +12,7 @@ from ..tools.animationhelper import (
     get_scene_fps
 )
 from ..tools.utils import color_hash
+from .. import profiling
 
 
 def create_anim_obj(sollum_type: SollumType) -> bpy.types.Object:
@@ -243,6 +244,7 @@ def action_data_to_action(action_name: str, action_data, frame_count: int, durat
     return action
 
 
+@profiling.traced()
 def animation_to_obj(animation: ycdxml.Animation) -> bpy.types.Object:
     animation_obj = create_anim_obj(SollumType.ANIMATION)
 
@@ -256,6 +258,7 @@ def animation_to_obj(animation: ycdxml.Animation) -> bpy.types.Object:
     return animation_obj
 
 
+@profiling.traced()
 def clip_to_obj(
     clip: ycdxml.Clip,
     animations_map: dict[str, ycdxml.Animation],
@@ -349,6 +352,7 @@ def create_clip_dictionary_template(name: str) -> tuple[bpy.types.Object, bpy.ty
     return clip_dictionary_obj, clips_obj, animations_obj
 
 
+@profiling.traced()
 def clip_dictionary_to_obj(clip_dictionary: ycdxml.ClipDictionary, name: str) -> bpy.types.Object:
     clip_dict_obj, clips_obj, animations_obj = create_clip_dictionary_template(name)
 
@@ -371,6 +375,7 @@ def clip_dictionary_to_obj(clip_dictionary: ycdxml.ClipDictionary, name: str) ->
     return clip_dict_obj
 
 
+@profiling.traced()
 def import_ycd(filepath: str) -> bpy.types.Object:
     ycd_xml = ycdxml.YCD.from_xml_file(filepath)
 
@@ -0,0 +1,246 @@
+"""
+Drawable model LOD generation via decimation.
+
+LOD meshes are built from the evaluated mesh of a temporary object with a DECIMATE modifier, so no mode switches or
+``modifier_apply`` calls are needed and many drawable models can be processed in a single run.
+"""
+from typing import NamedTuple, Optional
+
+import bpy
+import numpy as np
+from bpy.types import (
+    Context,
+    DecimateModifier,
+    Mesh,
+    Object,
+)
+
+from ..shared.lod_stats import mesh_triangle_count
+from ..sollumz_helper import find_sollumz_parent
+from ..sollumz_properties import SOLLUMZ_UI_NAMES, LODLevel, SollumType
+from ..tools.meshhelper import get_mesh_vertices_co
+from .properties import AutoLODSettings
+
+LOD_DISTANCE_RADIUS_FACTORS = {
+    LODLevel.HIGH: ("lod_dist_high", 10),
+    LODLevel.MEDIUM: ("lod_dist_med", 25),
+    LODLevel.LOW: ("lod_dist_low", 50),
+    LODLevel.VERYLOW: ("lod_dist_vlow", 100),
+}
+
+
+class LodMeshStats(NamedTuple):
+    lod_level: LODLevel
+    tri_count: int
+    vert_count: int
+
+
+class ModelLodSummary(NamedTuple):
+    model_name: str
+    ref_mesh_name: str
+    lods: list[LodMeshStats]
+    radius: Optional[float]
+    errors: list[str]
+
+
+def mesh_bounding_radius(mesh: Mesh) -> Optional[float]:
+    """Gets the distance from the average vertex position to the furthest vertex, or ``None`` if the mesh is empty."""
+    co = get_mesh_vertices_co(mesh)
+    if len(co) == 0:
+        return None
+
+    center = co.mean(axis=0, dtype=np.float64)
+    return float(np.sqrt(((co - center) ** 2).sum(axis=1).max()))
+
+
+def get_lod_mesh_name(obj_name: str, lod_level: LODLevel) -> str:
+    return f"{obj_name}.{SOLLUMZ_UI_NAMES[lod_level].lower()}"
+
+
+def get_selected_lods_sorted(settings: AutoLODSettings) -> tuple[LODLevel]:
+    return tuple(lod for lod in LODLevel if lod in settings.levels)
+
+
+def get_decimate_ratio(settings: AutoLODSettings, lod_level: LODLevel, index: int, source_mesh: Mesh) -> float:
+    """Calculate the decimation ratio for a given LOD level."""
+    if settings.use_per_lod_ratios:
+        lod_settings = settings.get_lod_settings(lod_level)
+        if lod_settings.use_target_tri_count:
+            source_tri_count = len(source_mesh.polygons)
+            if source_tri_count > 0:
+                return max(0.01, min(1.0, lod_settings.target_tri_count / source_tri_count))
+            return 1.0
+        else:
+            return lod_settings.ratio
+    else:
+        step = settings.decimate_step
+        if settings.decimate_from_original:
+            return max(0.01, 1.0 - step * (index + 1))
+        else:
+            return 1.0 - step
+
+
+def set_auto_lod_distances(obj: Object, radius: Optional[float], lods: tuple[LODLevel]):
+    """Calculate and set LOD distances on the parent Drawable of ``obj`` from the radius of its reference mesh."""
+    drawable = find_sollumz_parent(obj, SollumType.DRAWABLE)
+    if drawable is None or radius is None:
+        return
+
+    if radius < 0.01:
+        radius = 1.0
+
+    props = drawable.drawable_properties
+    for lod_level in lods:
+        if lod_level in LOD_DISTANCE_RADIUS_FACTORS:
+            attr, factor = LOD_DISTANCE_RADIUS_FACTORS[lod_level]
+            setattr(props, attr, float(min(9998, round(radius * factor))))
+
+
+class LodDecimator:
+    """Decimates meshes through a temporary object with a DECIMATE modifier. Must be used as a context manager, the
+    temporary object is shared by all decimations and removed on exit.
+    """
+
+    def __init__(self, context: Context, settings: AutoLODSettings):
+        self.context = context
+        self.settings = settings
+        self.obj: Optional[Object] = None
+        self.modifier: Optional[DecimateModifier] = None
+
+    def __enter__(self) -> "LodDecimator":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.obj is not None:
+            bpy.data.objects.remove(self.obj)
+            self.obj = None
+            self.modifier = None
+
+    def _configure_modifier(self, ratio: float):
+        settings = self.settings
+        mod = self.modifier
+        method = settings.decimate_method
+        if method == "COLLAPSE":
+            mod.decimate_type = "COLLAPSE"
+            mod.ratio = ratio
+            mod.use_collapse_triangulate = True
+
+            delimit = set()
+            if settings.preserve_uvs:
+                delimit.add("UV")
+            if settings.preserve_sharp:
+                delimit.add("SHARP")
+            if settings.preserve_materials:
+                delimit.add("MATERIAL")
+            if delimit:
+                mod.delimit = delimit
+
+        elif method == "UNSUBDIV":
+            mod.decimate_type = "UNSUBDIV"
+            mod.iterations = settings.unsubdiv_iterations
+
+        elif method == "DISSOLVE":
+            mod.decimate_type = "DISSOLVE"
+            mod.angle_limit = settings.planar_angle_limit
+            if settings.preserve_materials:
+                mod.delimit = {"MATERIAL"}
+
+    def decimate(self, source_mesh: Mesh, ratio: float, name: str) -> Mesh:
+        """Creates a new mesh named ``name`` with the result of decimating ``source_mesh``."""
+        obj = self.obj
+        if obj is None:
+            # Created with the first mesh, an object cannot change from empty to mesh
+            obj = self.obj = bpy.data.objects.new(".sz_auto_lod", source_mesh)
+            self.context.scene.collection.objects.link(obj)
+            self.modifier = obj.modifiers.new(name="AutoLOD_Decimate", type="DECIMATE")
+        else:
+            obj.data = source_mesh
+
+        self._configure_modifier(ratio)
+
+        self.context.view_layer.update()
+        depsgraph = self.context.evaluated_depsgraph_get()
+        obj_eval = obj.evaluated_get(depsgraph)
+        mesh = bpy.data.meshes.new_from_object(obj_eval, preserve_all_data_layers=True, depsgraph=depsgraph)
+        mesh.name = name
+        return mesh
+
+
+def generate_model_lods(
+    decimator: LodDecimator,
+    obj: Object,
+    ref_mesh: Mesh,
+    lods: tuple[LODLevel],
+) -> ModelLodSummary:
+    """Generates the ``lods`` of the drawable model ``obj`` by decimating ``ref_mesh``."""
+    settings = decimator.settings
+    obj_lods = obj.sz_lods
+    errors = []
+    last_mesh = ref_mesh
+    for i, lod_level in enumerate(lods):
+        source_mesh = ref_mesh if settings.decimate_from_original else last_mesh
+        ratio = get_decimate_ratio(settings, lod_level, i, source_mesh)
+        try:
+            mesh = decimator.decimate(source_mesh, ratio, get_lod_mesh_name(obj.name, lod_level))
+        except RuntimeError as e:
+            errors.append(f"Decimation failed for {SOLLUMZ_UI_NAMES[lod_level]}: {e}")
+            mesh = source_mesh.copy()
+            mesh.name = get_lod_mesh_name(obj.name, lod_level)
+
+        obj_lods.get_lod(lod_level).mesh = mesh
+        last_mesh = mesh
+
+    radius = mesh_bounding_radius(ref_mesh)
+    if settings.auto_set_distances:
+        set_auto_lod_distances(obj, radius, lods)
+
+    stats = []
+    for lod_level in lods:
+        mesh = obj_lods.get_lod(lod_level).mesh
+        if mesh is not None:
+            stats.append(LodMeshStats(lod_level, mesh_triangle_count(mesh), len(mesh.vertices)))
+
+    return ModelLodSummary(obj.name, ref_mesh.name, stats, radius, errors)
+
+
+def get_model_ref_lod(obj: Object) -> tuple[Optional[Mesh], Optional[LODLevel]]:
+    """Gets the mesh of the highest LOD level of the drawable model and its level, used as reference when generating
+    LODs in batch. Falls back to the object mesh, with no level, if the model has no LOD meshes.
+    """
+    obj_lods = obj.sz_lods
+    for lod_level in LODLevel:
+        lod = obj_lods.get_lod(lod_level)
+        if lod is not None and lod.mesh is not None:
+            return lod.mesh, lod_level
+
+    return (obj.data, None) if obj.type == "MESH" else (None, None)
+
+
+def get_lods_below(lods: tuple[LODLevel], ref_lod_level: Optional[LODLevel]) -> tuple[LODLevel]:
+    """Filters ``lods`` to the levels strictly lower than ``ref_lod_level``, so the reference mesh is never replaced by
+    a decimated copy of itself.
+    """
+    if ref_lod_level is None:
+        return lods
+
+    all_levels = list(LODLevel)
+    ref_index = all_levels.index(ref_lod_level)
+    return tuple(lod_level for lod_level in lods if all_levels.index(lod_level) > ref_index)
+
+
+def format_lod_summary_table(summaries: list[ModelLodSummary], lods: tuple[LODLevel]) -> list[str]:
+    """Formats the summaries as text table rows, one per model, with the triangle and vertex counts of each LOD."""
+    headers = ["Model", *(SOLLUMZ_UI_NAMES[lod_level] for lod_level in lods)]
+    rows = []
+    for summary in summaries:
+        lod_stats = {s.lod_level: s for s in summary.lods}
+        rows.append([
+            summary.model_name,
+            *(
+                f"{s.tri_count} tris / {s.vert_count} verts" if (s := lod_stats.get(lod_level, None)) else "-"
+                for lod_level in lods
+            ),
+        ])
+
+    widths = [max(len(row[col]) for row in (headers, *rows)) for col in range(len(headers))]
+    return [" | ".join(cell.ljust(width) for cell, width in zip(row, widths)) for row in (headers, *rows)]
@@ -4,7 +4,10 @@ from bpy.types import (
     Object,
 )
 import gpu
+from gpu.types import GPUBatch, GPUShader
 from gpu_extras.batch import batch_for_shader
+import numpy as np
+from numpy.typing import NDArray
 import blf
 from mathutils import Vector
 from collections.abc import Sequence
@@ -18,6 +21,7 @@ from .cable import (
 from bpy_extras.view3d_utils import location_3d_to_region_2d
 from bpy_extras.mesh_utils import edge_loops_from_edges
 import bmesh
+from .overlay_batch_cache import OverlayBatchCache
 
 
 class CableOverlaysDrawHandler:
@@ -26,6 +30,7 @@ class CableOverlaysDrawHandler:
     def __init__(self):
         self.handler_text = None
         self.handler_geometry = None
+        self.batch_cache = OverlayBatchCache()
 
     def register(self):
         self.handler_text = SpaceView3D.draw_handler_add(self.draw_text, (), "WINDOW", "POST_PIXEL")
@@ -34,6 +39,7 @@ class CableOverlaysDrawHandler:
     def unregister(self):
         SpaceView3D.draw_handler_remove(self.handler_text, "WINDOW")
         SpaceView3D.draw_handler_remove(self.handler_geometry, "WINDOW")
+        self.batch_cache.clear()
 
     def can_draw_anything(self) -> bool:
         context = bpy.context
@@ -136,95 +142,98 @@ class CableOverlaysDrawHandler:
         blf.disable(font_id, blf.SHADOW)
 
     def draw_radius_geometry(self, cable_obj: Object):
+        shader = gpu.shader.from_builtin("UNIFORM_COLOR")
+        batch = self.batch_cache.get(cable_obj, "radius", lambda: self.build_radius_batch(cable_obj, shader))
+        if batch is None:
+            return
+
+        shader.uniform_float("color", get_theme_settings().cable_overlay_radius)
+        batch.draw(shader)
+
+    def build_radius_batch(self, cable_obj: Object, shader: GPUShader) -> GPUBatch | None:
         mesh = cable_obj.data
         if cable_obj.mode == "EDIT":
             edit_mesh = bmesh.from_edit_mesh(mesh)
             try:
                 edit_edges = [TempEditEdge((e.verts[0].index, e.verts[1].index))for e in edit_mesh.edges]
                 pieces = edge_loops_from_edges(None, edges=edit_edges)
+
+                radius_layer = edit_mesh.verts.layers.float.get(CableAttr.RADIUS, None)
+                positions = np.array([v.co for v in edit_mesh.verts], dtype=np.float32).reshape((-1, 3))
+                if radius_layer is None:
+                    radius_values = np.full(len(positions), CableAttr.RADIUS.default_value, dtype=np.float32)
+                else:
+                    radius_values = np.array([v[radius_layer] for v in edit_mesh.verts], dtype=np.float32)
             finally:
                 edit_mesh.free()
         else:
             pieces = edge_loops_from_edges(mesh)
 
-        coords = []
-        for piece in pieces:
-            coords.extend(self.build_radius_geometry_for_cable_piece(cable_obj, piece))
-
-        shader = gpu.shader.from_builtin("UNIFORM_COLOR")
-        batch = batch_for_shader(shader, "LINES", {"pos": coords})
-        shader.uniform_float("color", get_theme_settings().cable_overlay_radius)
-        batch.draw(shader)
+            positions = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+            mesh.vertices.foreach_get("co", positions)
+            positions = positions.reshape((-1, 3))
+            radius_values = mesh_get_cable_attribute_values(mesh, CableAttr.RADIUS)
 
-    def build_radius_geometry_for_cable_piece(self, cable_obj: Object, piece: list[int]) -> list[Vector]:
+        matrix_world = np.array(cable_obj.matrix_world, dtype=np.float32)
+        coords = [
+            self.build_radius_geometry_for_cable_piece(matrix_world, positions, radius_values, piece)
+            for piece in pieces
+        ]
+        if not coords:
+            return None
+
+        coords = np.concatenate(coords)
+        if len(coords) == 0:
+            return None
+
+        return batch_for_shader(shader, "LINES", {"pos": coords})
+
+    def build_radius_geometry_for_cable_piece(
+        self,
+        matrix_world: NDArray[np.float32],
+        positions: NDArray[np.float32],
+        radius_values: NDArray[np.float32],
+        piece: list[int],
+    ) -> NDArray[np.float32]:
         """Builds the geometry to visualize the radius of this cable piece. The radius is represented with 4 lines
-        around the cable mesh.
+        around the cable mesh. Returns the line vertices in world space.
         """
         num_piece_verts = len(piece)
-        mesh = cable_obj.data
-        matrix_world = cable_obj.matrix_world
-
-        num_verts_per_line = (num_piece_verts * 2 - 2)
-        num_lines = 4
-        coords = [None] * (num_lines * num_verts_per_line)
-
-        def _add_piece_vertex(index_in_piece: int, pos: Vector, tangent: Vector, radius: float):
-            world_up = Vector((0.0, 0.0, 1.0))
-            right = tangent.cross(world_up).normalized()
-            up = tangent.cross(right).normalized()
-            pos = matrix_world @ pos
-            va = pos + up * radius
-            vb = pos - up * radius
-            vc = pos + right * radius
-            vd = pos - right * radius
-            verts_per_line = (va, vb, vc, vd)
-            if index_in_piece == 0:
-                for k in range(num_lines):
-                    coords[(num_verts_per_line * k) + 0] = verts_per_line[k]
-            elif index_in_piece == (num_piece_verts - 1):
-                for k in range(num_lines):
-                    coords[(num_verts_per_line * (k + 1)) - 1] = verts_per_line[k]
-            else:
-                for k in range(num_lines):
-                    coords[(num_verts_per_line * k) + index_in_piece * 2 - 1] = verts_per_line[k]
-                    coords[(num_verts_per_line * k) + index_in_piece * 2] = verts_per_line[k]
-
-        if cable_obj.mode == "EDIT":
-            edit_mesh = bmesh.from_edit_mesh(mesh)
-            try:
-                radius_layer = edit_mesh.verts.layers.float.get(CableAttr.RADIUS, None)
-                prev_pos = None
-                for i, vi in enumerate(piece):
-                    v = edit_mesh.verts[vi]
-                    radius_value = CableAttr.RADIUS.default_value if radius_layer is None else v[radius_layer]
-                    if prev_pos is None:
-                        if i + 1 < num_piece_verts:
-                            tangent = (edit_mesh.verts[piece[i + 1]].co - v.co).normalized()
-                        else:
-                            tangent = Vector()
-                    else:
-                        tangent = (v.co - prev_pos).normalized()
-                    _add_piece_vertex(i, v.co, tangent, radius_value)
-                    prev_pos = v.co
-            finally:
-                edit_mesh.free()
-        else:
-            radius_values = mesh_get_cable_attribute_values(mesh, CableAttr.RADIUS)
-            prev_pos = None
-            for i, vi in enumerate(piece):
-                v = mesh.vertices[vi]
-                radius_value = radius_values[vi]
-                if prev_pos is None:
-                    if i + 1 < num_piece_verts:
-                        tangent = (mesh.vertices[piece[i + 1]].co - v.co).normalized()
-                    else:
-                        tangent = Vector()
-                else:
-                    tangent = (v.co - prev_pos).normalized()
-                _add_piece_vertex(i, v.co, tangent, radius_value)
-                prev_pos = v.co
-
-        return coords
+        if num_piece_verts < 2:
+            return np.empty((0, 3), dtype=np.float32)
+
+        piece = np.asarray(piece, dtype=np.int64)
+        piece_positions = positions[piece]
+        piece_radius = radius_values[piece][:, np.newaxis]
+
+        # Tangent of each vertex is the direction from the previous vertex, or to the next vertex for the first one
+        tangents = np.empty_like(piece_positions)
+        tangents[1:] = piece_positions[1:] - piece_positions[:-1]
+        tangents[0] = tangents[1]
+        tangents = _normalized(tangents)
+
+        world_up = np.array((0.0, 0.0, 1.0), dtype=np.float32)
+        right = _normalized(np.cross(tangents, world_up))
+        up = _normalized(np.cross(tangents, right))
+
+        world_positions = piece_positions @ matrix_world[:3, :3].T + matrix_world[:3, 3]
+        verts_per_line = (
+            world_positions + up * piece_radius,
+            world_positions - up * piece_radius,
+            world_positions + right * piece_radius,
+            world_positions - right * piece_radius,
+        )
+
+        # Each line goes through all the vertices in the piece, inner vertices are repeated as they end a segment and
+        # start the next one
+        line_verts_repeat = np.full(num_piece_verts, 2, dtype=np.int64)
+        line_verts_repeat[[0, -1]] = 1
+        return np.concatenate([np.repeat(line_verts, line_verts_repeat, axis=0) for line_verts in verts_per_line])
+
+
+def _normalized(vectors: NDArray[np.float32]) -> NDArray[np.float32]:
+    lengths = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.divide(vectors, lengths, out=np.zeros_like(vectors), where=lengths != 0)
 
 
 class TempEditEdge(NamedTuple):
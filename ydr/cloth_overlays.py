@@ -4,7 +4,9 @@ from bpy.types import (
     Object,
 )
 import gpu
+from gpu.types import GPUBatch, GPUShader
 from gpu_extras import batch
+import numpy as np
 import blf
 from mathutils import Vector
 from collections.abc import Sequence
@@ -18,6 +20,7 @@ from .cloth_diagnostics import (
     ClothDiagnosticsOverlayFlags,
     cloth_last_export_contexts,
 )
+from .overlay_batch_cache import OverlayBatchCache
 import bmesh
 
 if bpy.app.version >= (4, 5, 0):
@@ -32,6 +35,7 @@ class ClothOverlaysDrawHandler:
     def __init__(self):
         self.handler_text = None
         self.handler_geometry = None
+        self.batch_cache = OverlayBatchCache()
 
     def register(self):
         self.handler_text = SpaceView3D.draw_handler_add(self.draw_text, (), "WINDOW", "POST_PIXEL")
@@ -40,6 +44,7 @@ class ClothOverlaysDrawHandler:
     def unregister(self):
         SpaceView3D.draw_handler_remove(self.handler_text, "WINDOW")
         SpaceView3D.draw_handler_remove(self.handler_geometry, "WINDOW")
+        self.batch_cache.clear()
 
     def can_draw_anything(self) -> bool:
         context = bpy.context
@@ -163,35 +168,46 @@ class ClothOverlaysDrawHandler:
         blf.disable(font_id, blf.SHADOW)
 
     def draw_pinned_geometry(self, cloth_obj: Object):
-        transform = cloth_obj.matrix_world
-        mesh = cloth_obj.data
+        shader = gpu.shader.from_builtin(POINT_UNIFORM_COLOR_SHADER_NAME)
+        pinned_verts_batch = self.batch_cache.get(
+            cloth_obj, "pinned", lambda: self.build_pinned_batch(cloth_obj, shader)
+        )
+        if pinned_verts_batch is None:
+            return
+
+        theme = get_theme_settings()
+        gpu.state.point_size_set(theme.cloth_overlay_pinned_size)
+        gpu.state.blend_set("ALPHA")
+        shader.uniform_float("color", theme.cloth_overlay_pinned)
+        pinned_verts_batch.draw(shader)
 
-        coords = []
+    def build_pinned_batch(self, cloth_obj: Object, shader: GPUShader) -> GPUBatch | None:
+        mesh = cloth_obj.data
 
         if cloth_obj.mode == "EDIT":
             edit_mesh = bmesh.from_edit_mesh(mesh)
             try:
                 pinned_layer = edit_mesh.verts.layers.int.get(ClothAttr.PINNED, None)
-                for v in edit_mesh.verts:
-                    is_pinned = ClothAttr.PINNED.default_value if pinned_layer is None else v[pinned_layer]
-                    if is_pinned:
-                        coords.append(transform @ v.co)
+                if pinned_layer is None:
+                    coords = [v.co for v in edit_mesh.verts] if ClothAttr.PINNED.default_value else []
+                else:
+                    coords = [v.co for v in edit_mesh.verts if v[pinned_layer]]
+                coords = np.array(coords, dtype=np.float32).reshape((-1, 3))
             finally:
                 edit_mesh.free()
         else:
+            coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+            mesh.vertices.foreach_get("co", coords)
+            coords = coords.reshape((-1, 3))
             pinned_values = mesh_get_cloth_attribute_values(mesh, ClothAttr.PINNED)
-            for v in mesh.vertices:
-                is_pinned = pinned_values[v.index] != 0
-                if is_pinned:
-                    coords.append(transform @ v.co)
+            coords = coords[pinned_values != 0]
 
-        theme = get_theme_settings()
-        gpu.state.point_size_set(theme.cloth_overlay_pinned_size)
-        gpu.state.blend_set("ALPHA")
-        shader = gpu.shader.from_builtin(POINT_UNIFORM_COLOR_SHADER_NAME)
-        pinned_verts_batch = batch.batch_for_shader(shader, "POINTS", {"pos": coords})
-        shader.uniform_float("color", theme.cloth_overlay_pinned)
-        pinned_verts_batch.draw(shader)
+        if len(coords) == 0:
+            return None
+
+        transform = np.array(cloth_obj.matrix_world, dtype=np.float32)
+        coords = coords @ transform[:3, :3].T + transform[:3, 3]
+        return batch.batch_for_shader(shader, "POINTS", {"pos": coords})
 
     def draw_diagnostics_overlays(self):
         last = cloth_last_export_contexts()
@@ -0,0 +1,376 @@
+"""
+Texture atlas material merge.
+
+Packs the texture of each material of a mesh into a single atlas image and remaps the UVs of the faces of each material
+into its region of the atlas. Much faster than baking, but only possible when every material is driven by an image
+texture; procedural materials still need to be baked.
+"""
+import hashlib
+import math
+from typing import NamedTuple, Optional
+
+import bpy
+import numpy as np
+from bpy.types import (
+    Image,
+    Material,
+    Mesh,
+    ShaderNode,
+)
+from numpy.typing import NDArray
+
+from ..sollumz_properties import MaterialType
+from ..tools.blenderhelper import find_bsdf_and_material_output
+
+MAX_UV_TILES = 4
+"""Maximum number of times a texture is repeated in the atlas to support UVs outside of the [0, 1] range."""
+
+SHADER_SAMPLER_BY_BAKE_TYPE = {
+    "DIFFUSE": "DiffuseSampler",
+    "NORMAL": "BumpSampler",
+}
+
+BSDF_INPUT_BY_BAKE_TYPE = {
+    "DIFFUSE": "Base Color",
+    "NORMAL": "Normal",
+    "ROUGHNESS": "Roughness",
+    "METALLIC": "Metallic",
+}
+
+
+class AtlasSource(NamedTuple):
+    material_index: int
+    image: Image
+    uv_map_name: Optional[str]
+
+
+class AtlasRegion(NamedTuple):
+    uv_origin: tuple[int, int]
+    """Integer UV coordinates where the repeated texture starts."""
+    uv_tiles: tuple[int, int]
+    """Number of times the texture is repeated in each axis."""
+    position: tuple[int, int]
+    """Position of the region in the atlas, in pixels."""
+    size: tuple[int, int]
+    """Size of the region in the atlas, in pixels."""
+
+
+def _linked_image_node(socket) -> Optional[ShaderNode]:
+    if not socket.is_linked:
+        return None
+
+    node = socket.links[0].from_node
+    if node.bl_idname == "ShaderNodeNormalMap":
+        return _linked_image_node(node.inputs["Color"])
+
+    return node if node.bl_idname == "ShaderNodeTexImage" else None
+
+
+def find_material_source_image_node(material: Material, bake_type: str) -> Optional[ShaderNode]:
+    """Finds the image texture node that provides the ``bake_type`` texture of the material, or ``None`` if the
+    material does not use a single image for it (e.g. procedural materials).
+    """
+    if material is None or material.node_tree is None:
+        return None
+
+    if material.sollum_type == MaterialType.SHADER:
+        sampler_name = SHADER_SAMPLER_BY_BAKE_TYPE.get(bake_type, None)
+        node = material.node_tree.nodes.get(sampler_name, None) if sampler_name else None
+    else:
+        bsdf, _ = find_bsdf_and_material_output(material)
+        node = _linked_image_node(bsdf.inputs[BSDF_INPUT_BY_BAKE_TYPE[bake_type]]) if bsdf is not None else None
+
+    if node is None or node.bl_idname != "ShaderNodeTexImage":
+        return None
+
+    image = node.image
+    if image is None or image.size[0] == 0 or image.size[1] == 0:
+        return None
+
+    return node
+
+
+def _image_node_uv_map_name(node: ShaderNode) -> Optional[str]:
+    vector_input = node.inputs["Vector"]
+    if vector_input.is_linked:
+        from_node = vector_input.links[0].from_node
+        if from_node.bl_idname == "ShaderNodeUVMap" and from_node.uv_map:
+            return from_node.uv_map
+
+    return None
+
+
+def get_atlas_sources(mesh: Mesh, bake_type: str) -> Optional[list[AtlasSource]]:
+    """Gets the texture of each material used by the mesh faces. Returns ``None`` if any of them cannot be atlased."""
+    material_indices = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("material_index", material_indices)
+    used_material_indices = np.unique(np.clip(material_indices, 0, max(0, len(mesh.materials) - 1)))
+
+    sources = []
+    for material_index in used_material_indices.tolist():
+        material = mesh.materials[material_index] if material_index < len(mesh.materials) else None
+        node = find_material_source_image_node(material, bake_type)
+        if node is None:
+            return None
+
+        sources.append(AtlasSource(material_index, node.image, _image_node_uv_map_name(node)))
+
+    return sources
+
+
+def pack_rects(sizes: list[tuple[int, int]], bin_size: int, padding: int) -> Optional[list[tuple[int, int]]]:
+    """Packs the rectangles into a square bin with shelf packing, tallest first. Returns the position of each
+    rectangle, excluding the padding, or ``None`` if they do not fit.
+    """
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    positions = [None] * len(sizes)
+    x = y = shelf_height = 0
+    for i in order:
+        w, h = sizes[i]
+        padded_w, padded_h = w + padding * 2, h + padding * 2
+        if padded_w > bin_size:
+            return None
+
+        if x + padded_w > bin_size:
+            # Start a new shelf
+            y += shelf_height
+            x = shelf_height = 0
+
+        if y + padded_h > bin_size:
+            return None
+
+        positions[i] = (x + padding, y + padding)
+        x += padded_w
+        shelf_height = max(shelf_height, padded_h)
+
+    return positions
+
+
+def fit_rects(
+    sizes: list[tuple[int, int]], bin_size: int, padding: int
+) -> tuple[list[tuple[int, int]], list[tuple[int, int]]]:
+    """Packs the rectangles into the bin, scaling them down uniformly until they fit. Returns the scaled sizes and the
+    positions of the rectangles.
+    """
+    scale = 1.0
+    while True:
+        scaled_sizes = [(max(1, int(w * scale)), max(1, int(h * scale))) for w, h in sizes]
+        positions = pack_rects(scaled_sizes, bin_size, padding)
+        if positions is not None:
+            return scaled_sizes, positions
+
+        if all(size == (1, 1) for size in scaled_sizes):
+            raise ValueError(f"Cannot fit {len(sizes)} textures in a {bin_size}x{bin_size} atlas")
+
+        scale *= 0.9
+
+
+def get_uv_tiles(uvs: NDArray[np.float32]) -> tuple[tuple[int, int], tuple[int, int]]:
+    """Gets the integer UV origin and number of texture repetitions needed to cover the UVs."""
+    if len(uvs) == 0:
+        return (0, 0), (1, 1)
+
+    uv_min = np.floor(uvs.min(axis=0) + 1e-4).astype(int)
+    uv_max = np.ceil(uvs.max(axis=0) - 1e-4).astype(int)
+    tiles = np.clip(uv_max - uv_min, 1, MAX_UV_TILES)
+    return (int(uv_min[0]), int(uv_min[1])), (int(tiles[0]), int(tiles[1]))
+
+
+def get_image_pixels(image: Image) -> NDArray[np.float32]:
+    """Gets the pixels of the image as an array of shape (height, width, 4). The first row is the bottom row."""
+    w, h = image.size
+    pixels = np.empty(w * h * 4, dtype=np.float32)
+    image.pixels.foreach_get(pixels)
+    return pixels.reshape((h, w, 4))
+
+
+def resample_tiled(
+    pixels: NDArray[np.float32], uv_tiles: tuple[int, int], size: tuple[int, int]
+) -> NDArray[np.float32]:
+    """Resamples the image repeated ``uv_tiles`` times to ``size`` with nearest neighbour sampling."""
+    src_h, src_w = pixels.shape[:2]
+    w, h = size
+    xs = (((np.arange(w) + 0.5) * (uv_tiles[0] * src_w / w)).astype(np.int64)) % src_w
+    ys = (((np.arange(h) + 0.5) * (uv_tiles[1] * src_h / h)).astype(np.int64)) % src_h
+    return pixels[ys[:, np.newaxis], xs[np.newaxis, :]]
+
+
+def build_atlas_layout(
+    sources: list[AtlasSource],
+    source_uvs: list[NDArray[np.float32]],
+    atlas_size: int,
+    padding: int,
+) -> list[AtlasRegion]:
+    """Calculates the region of each source texture in the atlas. ``source_uvs`` are the UVs of the faces of each
+    source material, used to know how many times the texture repeats.
+    """
+    tiles = [get_uv_tiles(uvs) for uvs in source_uvs]
+    sizes = [
+        (source.image.size[0] * uv_tiles[0], source.image.size[1] * uv_tiles[1])
+        for source, (_, uv_tiles) in zip(sources, tiles)
+    ]
+    scaled_sizes, positions = fit_rects(sizes, atlas_size, padding)
+    return [
+        AtlasRegion(uv_origin, uv_tiles, position, size)
+        for (uv_origin, uv_tiles), position, size in zip(tiles, positions, scaled_sizes)
+    ]
+
+
+def get_sources_pixels(sources: list[AtlasSource]) -> dict[str, NDArray[np.float32]]:
+    """Gets the pixels of each source image by image name. Images shared by multiple sources are only read once."""
+    pixels_by_image = {}
+    for source in sources:
+        if source.image.name not in pixels_by_image:
+            pixels_by_image[source.image.name] = get_image_pixels(source.image)
+    return pixels_by_image
+
+
+def build_atlas_pixels(
+    sources: list[AtlasSource],
+    regions: list[AtlasRegion],
+    atlas_size: int,
+    padding: int,
+    sources_pixels: dict[str, NDArray[np.float32]],
+) -> NDArray[np.float32]:
+    """Writes the textures into their atlas regions. Padding is filled by extending the region edges to avoid colors
+    bleeding between regions when sampling with filtering or mipmaps.
+    """
+    atlas = np.zeros((atlas_size, atlas_size, 4), dtype=np.float32)
+    for source, region in zip(sources, regions):
+        pixels = sources_pixels[source.image.name]
+        region_pixels = resample_tiled(pixels, region.uv_tiles, region.size)
+        if padding > 0:
+            region_pixels = np.pad(region_pixels, ((padding, padding), (padding, padding), (0, 0)), mode="edge")
+
+        x, y = region.position[0] - padding, region.position[1] - padding
+        h, w = region_pixels.shape[:2]
+        atlas[y:y + h, x:x + w] = region_pixels
+
+    return atlas
+
+
+def remap_uvs_to_atlas(
+    uvs: NDArray[np.float32], region: AtlasRegion, atlas_size: int
+) -> NDArray[np.float32]:
+    """Transforms UVs of a source texture to UVs in its region of the atlas."""
+    uv_origin = np.array(region.uv_origin, dtype=np.float32)
+    uv_tiles = np.array(region.uv_tiles, dtype=np.float32)
+    uvs = np.clip(uvs, uv_origin, uv_origin + uv_tiles)
+    return ((uvs - uv_origin) / uv_tiles * region.size + region.position) / atlas_size
+
+
+def _get_uv_map_data(mesh: Mesh, uv_map_name: Optional[str]) -> NDArray[np.float32]:
+    uv_layer = mesh.uv_layers.get(uv_map_name, None) if uv_map_name else None
+    if uv_layer is None:
+        uv_layer = mesh.uv_layers.active or (mesh.uv_layers[0] if mesh.uv_layers else None)
+
+    uvs = np.zeros((len(mesh.loops), 2), dtype=np.float32)
+    if uv_layer is not None:
+        uv_layer.uv.foreach_get("vector", uvs.ravel())
+    return uvs
+
+
+def get_loop_material_indices(mesh: Mesh) -> NDArray[np.int32]:
+    material_indices = np.empty(len(mesh.polygons), dtype=np.int32)
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("material_index", material_indices)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    return np.repeat(material_indices, loop_totals)
+
+
+def get_atlas_key(
+    sources: list[AtlasSource],
+    regions: list[AtlasRegion],
+    atlas_size: int,
+    padding: int,
+    sources_pixels: dict[str, NDArray[np.float32]],
+) -> str:
+    """Gets a key that identifies the atlas contents, used to share the atlas between meshes (e.g. LOD levels).
+    Includes the pixels of the source images so an atlas is not reused after its textures are edited or reloaded.
+    """
+    pixels_hashes = {
+        name: hashlib.sha1(pixels.tobytes()).hexdigest() for name, pixels in sources_pixels.items()
+    }
+    desc = repr((
+        atlas_size,
+        padding,
+        [
+            (s.image.name, s.image.filepath_raw, tuple(s.image.size), pixels_hashes[s.image.name], r)
+            for s, r in zip(sources, regions)
+        ],
+    ))
+    return hashlib.sha1(desc.encode()).hexdigest()
+
+
+def find_atlas_image(key: str) -> Optional[Image]:
+    return next((image for image in bpy.data.images if image.get("sz_atlas_key", None) == key), None)
+
+
+def find_atlas_material(key: str) -> Optional[Material]:
+    return next((mat for mat in bpy.data.materials if mat.get("sz_atlas_key", None) == key), None)
+
+
+def create_atlas_image(
+    name: str,
+    key: str,
+    sources: list[AtlasSource],
+    regions: list[AtlasRegion],
+    atlas_size: int,
+    padding: int,
+    colorspace: str,
+    sources_pixels: dict[str, NDArray[np.float32]],
+) -> Image:
+    image = bpy.data.images.new(name=name, width=atlas_size, height=atlas_size, alpha=True)
+    image.colorspace_settings.name = colorspace
+    image.pixels.foreach_set(build_atlas_pixels(sources, regions, atlas_size, padding, sources_pixels).ravel())
+    image.pack()
+    image["sz_atlas_key"] = key
+    return image
+
+
+def merge_mesh_materials_into_atlas(
+    mesh: Mesh,
+    sources: list[AtlasSource],
+    atlas_size: int,
+    margin: float,
+    uv_layer_name: str,
+    image_name: str,
+    colorspace: str,
+) -> tuple[Image, bool]:
+    """Remaps the UVs of each material of the mesh into its atlas region, storing them in the ``uv_layer_name`` UV map.
+    Returns the atlas image and whether it was reused. Meshes with the same textures and UV tiling, such as the LOD
+    levels of a model, share the same atlas image.
+    """
+    padding = math.ceil(margin * atlas_size)
+    loop_material_indices = get_loop_material_indices(mesh)
+    np.clip(loop_material_indices, 0, max(0, len(mesh.materials) - 1), out=loop_material_indices)
+
+    uv_maps_data = {}
+    source_loops = []
+    source_uvs = []
+    for source in sources:
+        uvs = uv_maps_data.get(source.uv_map_name, None)
+        if uvs is None:
+            uvs = uv_maps_data[source.uv_map_name] = _get_uv_map_data(mesh, source.uv_map_name)
+
+        loops = np.flatnonzero(loop_material_indices == source.material_index)
+        source_loops.append(loops)
+        source_uvs.append(uvs[loops])
+
+    regions = build_atlas_layout(sources, source_uvs, atlas_size, padding)
+
+    atlas_uvs = np.zeros((len(mesh.loops), 2), dtype=np.float32)
+    for loops, uvs, region in zip(source_loops, source_uvs, regions):
+        atlas_uvs[loops] = remap_uvs_to_atlas(uvs, region, atlas_size)
+
+    uv_layer = mesh.uv_layers.get(uv_layer_name, None) or mesh.uv_layers.new(name=uv_layer_name)
+    uv_layer.uv.foreach_set("vector", atlas_uvs.ravel())
+
+    sources_pixels = get_sources_pixels(sources)
+    key = get_atlas_key(sources, regions, atlas_size, padding, sources_pixels)
+    image = find_atlas_image(key)
+    if image is not None:
+        return image, True
+
+    image = create_atlas_image(image_name, key, sources, regions, atlas_size, padding, colorspace, sources_pixels)
+    return image, False
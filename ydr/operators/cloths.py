@@ -20,9 +20,6 @@ from ..cloth import (
     mesh_has_cloth_attribute,
     mesh_get_cloth_attribute_values,
 )
-from ..cloth_env import (
-    cloth_env_find_mesh_objects,
-)
 from ..cloth_diagnostics import (
     cloth_last_export_contexts,
 )
@@ -253,6 +250,8 @@ class SOLLUMZ_OT_cloth_refresh_diagnostics(Operator):
     )
 
     def execute(self, context: bpy.types.Context):
+        from ..cloth_env import cloth_env_find_mesh_objects
+
         with logger.use_operator_logger(self):
             # Technically we only have diagnostics to visualize for character cloth, but fragment cloth export may
             # also log some errors so also try to export them
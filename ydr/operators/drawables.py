@@ -15,6 +15,15 @@ from ...tools.meshhelper import (
     mesh_rename_color_attrs_by_order,
 )
 from ..shader_materials import shadermats_by_filename
+from ..auto_lod import (
+    LodDecimator,
+    ModelLodSummary,
+    format_lod_summary_table,
+    generate_model_lods,
+    get_lods_below,
+    get_model_ref_lod,
+    get_selected_lods_sorted,
+)
 
 
 class SOLLUMZ_OT_create_drawable(bpy.types.Operator):
@@ -527,7 +536,7 @@ class SOLLUMZ_OT_auto_lod(bpy.types.Operator):
             self.report({"INFO"}, "No reference mesh specified! You must specify a mesh to use as the highest LOD level!")
             return {"CANCELLED"}
 
-        lods = self._get_selected_lods_sorted(settings)
+        lods = get_selected_lods_sorted(settings)
 
         if not lods:
             self.report({"INFO"}, "No LOD levels selected!")
@@ -537,23 +546,14 @@ class SOLLUMZ_OT_auto_lod(bpy.types.Operator):
 
         previous_mode = aobj.mode
         previous_lod_level = obj_lods.active_lod_level
-        last_mesh = ref_mesh
-
-        for i, lod_level in enumerate(lods):
+        if previous_mode != "OBJECT":
             bpy.ops.object.mode_set(mode="OBJECT")
 
-            source_mesh = ref_mesh if settings.decimate_from_original else last_mesh
-            mesh = source_mesh.copy()
-            mesh.name = self._get_lod_mesh_name(aobj.name, lod_level)
-
-            obj_lods.get_lod(lod_level).mesh = mesh
-            obj_lods.active_lod_level = lod_level
-
-            self._apply_decimation(context, aobj, settings, lod_level, i, source_mesh)
-
-            last_mesh = mesh
+        with LodDecimator(context, settings) as decimator:
+            summary = generate_model_lods(decimator, aobj, ref_mesh, lods)
 
-        bpy.ops.object.mode_set(mode="OBJECT")
+        for error in summary.errors:
+            self.report({"WARNING"}, error)
 
         if settings.auto_merge_materials:
             for lod_level in lods:
@@ -561,12 +561,10 @@ class SOLLUMZ_OT_auto_lod(bpy.types.Operator):
                 self._merge_materials(context, aobj, lod_level)
 
         obj_lods.active_lod_level = previous_lod_level
-        bpy.ops.object.mode_set(mode=previous_mode)
+        if previous_mode != "OBJECT":
+            bpy.ops.object.mode_set(mode=previous_mode)
 
-        if settings.auto_set_distances:
-            self._set_auto_distances(aobj, ref_mesh, lods)
-
-        self._report_stats(aobj, lods, obj_lods)
+        self._report_stats(summary)
 
         return {"FINISHED"}
 
@@ -592,125 +590,83 @@ class SOLLUMZ_OT_auto_lod(bpy.types.Operator):
         if old_mat_name in bpy.data.materials:
             bpy.data.materials[old_mat_name].name = f"{obj.name}_{lod_suffix}_MergedMaterial"
 
-    def _apply_decimation(self, context: Context, obj, settings, lod_level: LODLevel, index: int, source_mesh):
-        """Apply decimation to the active LOD mesh using the modifier API."""
-        method = settings.decimate_method
-
-        mod = obj.modifiers.new(name="AutoLOD_Decimate", type="DECIMATE")
-
-        if method == "COLLAPSE":
-            ratio = self._get_effective_ratio(settings, lod_level, index, source_mesh)
-            mod.decimate_type = "COLLAPSE"
-            mod.ratio = ratio
-            mod.use_collapse_triangulate = True
-
-            delimit = set()
-            if settings.preserve_uvs:
-                delimit.add("UV")
-            if settings.preserve_sharp:
-                delimit.add("SHARP")
-            if settings.preserve_materials:
-                delimit.add("MATERIAL")
-            if delimit:
-                mod.delimit = delimit
-
-            if settings.preserve_vertex_groups and hasattr(mod, "use_symmetry"):
-                # Vertex group preservation is handled by the delimit options
-                # and by Blender's internal weighting in collapse mode
-                pass
-
-        elif method == "UNSUBDIV":
-            mod.decimate_type = "UNSUBDIV"
-            mod.iterations = settings.unsubdiv_iterations
-
-        elif method == "DISSOLVE":
-            mod.decimate_type = "DISSOLVE"
-            mod.angle_limit = settings.planar_angle_limit
-            if settings.preserve_materials:
-                mod.delimit = {"MATERIAL"}
+    def _report_stats(self, summary: ModelLodSummary):
+        """Report triangle/vertex counts for each generated LOD."""
+        stats = [
+            f"{SOLLUMZ_UI_NAMES[s.lod_level]}: {s.tri_count} tris, {s.vert_count} verts"
+            for s in summary.lods
+        ]
+        if stats:
+            self.report({"INFO"}, "LODs generated - " + " | ".join(stats))
 
-        try:
-            bpy.ops.object.modifier_apply(modifier=mod.name)
-        except RuntimeError as e:
-            self.report({"WARNING"}, f"Modifier apply failed for {SOLLUMZ_UI_NAMES[lod_level]}: {e}")
-            if mod.name in obj.modifiers:
-                obj.modifiers.remove(mod)
-
-    def _get_effective_ratio(self, settings, lod_level: LODLevel, index: int, source_mesh) -> float:
-        """Calculate the decimation ratio for a given LOD level."""
-        if settings.use_per_lod_ratios:
-            lod_settings = settings.get_lod_settings(lod_level)
-            if lod_settings.use_target_tri_count:
-                source_tri_count = len(source_mesh.polygons)
-                if source_tri_count > 0:
-                    return max(0.01, min(1.0, lod_settings.target_tri_count / source_tri_count))
-                return 1.0
-            else:
-                return lod_settings.ratio
-        else:
-            step = settings.decimate_step
-            if settings.decimate_from_original:
-                return max(0.01, 1.0 - step * (index + 1))
-            else:
-                return 1.0 - step
-
-    def _set_auto_distances(self, obj, ref_mesh, lods: tuple[LODLevel]):
-        """Calculate and set LOD distances on the parent Drawable."""
-        drawable = find_sollumz_parent(obj, SollumType.DRAWABLE)
-        if drawable is None:
-            return
 
-        verts = ref_mesh.vertices
-        if len(verts) == 0:
-            return
+class SOLLUMZ_OT_auto_lod_batch(bpy.types.Operator):
+    bl_idname = "sollumz.auto_lod_batch"
+    bl_label = "Generate LODs for Selected"
+    bl_options = {"REGISTER", "UNDO"}
+    bl_description = (
+        "Generate LODs via decimation for all selected drawable models, using the Auto LOD settings. The highest "
+        "LOD mesh of each model is used as its reference mesh and only lower LOD levels are generated"
+    )
 
-        import mathutils
-        center = mathutils.Vector((0, 0, 0))
-        for v in verts:
-            center += v.co
-        center /= len(verts)
-
-        radius = max((v.co - center).length for v in verts)
-        if radius < 0.01:
-            radius = 1.0
-
-        props = drawable.drawable_properties
-        dist_map = {
-            LODLevel.HIGH: min(9998, round(radius * 10)),
-            LODLevel.MEDIUM: min(9998, round(radius * 25)),
-            LODLevel.LOW: min(9998, round(radius * 50)),
-            LODLevel.VERYLOW: min(9998, round(radius * 100)),
-        }
-
-        attr_map = {
-            LODLevel.HIGH: "lod_dist_high",
-            LODLevel.MEDIUM: "lod_dist_med",
-            LODLevel.LOW: "lod_dist_low",
-            LODLevel.VERYLOW: "lod_dist_vlow",
-        }
-
-        for lod_level in lods:
-            attr = attr_map.get(lod_level)
-            if attr:
-                setattr(props, attr, float(dist_map[lod_level]))
-
-    def _report_stats(self, obj, lods: tuple[LODLevel], obj_lods: LODLevels):
-        """Report triangle/vertex counts for each generated LOD."""
-        stats = []
-        for lod_level in lods:
-            mesh = obj_lods.get_lod(lod_level).mesh
-            if mesh is not None:
-                tri_count = sum(max(1, len(p.vertices) - 2) for p in mesh.polygons)
-                stats.append(f"{SOLLUMZ_UI_NAMES[lod_level]}: {tri_count} tris, {len(mesh.vertices)} verts")
+    @classmethod
+    def poll(cls, context):
+        return any(obj.sollum_type == SollumType.DRAWABLE_MODEL for obj in context.selected_objects)
 
-        if stats:
-            self.report({"INFO"}, "LODs generated - " + " | ".join(stats))
+    def execute(self, context: Context):
+        settings = context.scene.sollumz_auto_lod_settings
+        lods = get_selected_lods_sorted(settings)
+
+        if not lods:
+            self.report({"INFO"}, "No LOD levels selected!")
+            return {"CANCELLED"}
+
+        model_objs = [obj for obj in context.selected_objects if obj.sollum_type == SollumType.DRAWABLE_MODEL]
 
-    def _get_lod_mesh_name(self, obj_name: str, lod_level: LODLevel):
-        return f"{obj_name}.{SOLLUMZ_UI_NAMES[lod_level].lower()}"
+        aobj = context.active_object
+        previous_mode = aobj.mode if aobj is not None else "OBJECT"
+        if previous_mode != "OBJECT":
+            bpy.ops.object.mode_set(mode="OBJECT")
+
+        wm = context.window_manager
+        wm.progress_begin(0, len(model_objs))
+        summaries = []
+        try:
+            with LodDecimator(context, settings) as decimator:
+                for i, obj in enumerate(model_objs):
+                    ref_mesh, ref_lod_level = get_model_ref_lod(obj)
+                    if ref_mesh is None:
+                        self.report({"WARNING"}, f"Drawable model '{obj.name}' has no mesh, skipped.")
+                        continue
+
+                    model_lods = get_lods_below(lods, ref_lod_level)
+                    if not model_lods:
+                        self.report(
+                            {"WARNING"},
+                            f"Drawable model '{obj.name}' has no selected LOD levels below its reference mesh "
+                            f"({SOLLUMZ_UI_NAMES[ref_lod_level]}), skipped."
+                        )
+                        continue
+
+                    summary = generate_model_lods(decimator, obj, ref_mesh, model_lods)
+                    for error in summary.errors:
+                        self.report({"WARNING"}, f"{obj.name}: {error}")
+
+                    summaries.append(summary)
+                    wm.progress_update(i + 1)
+        finally:
+            wm.progress_end()
+
+        if previous_mode != "OBJECT":
+            bpy.ops.object.mode_set(mode=previous_mode)
 
-    def _get_selected_lods_sorted(self, settings) -> tuple[LODLevel]:
-        return tuple(lod for lod in LODLevel if lod in settings.levels)
+        if settings.auto_merge_materials:
+            self.report({"WARNING"}, "Material merge is not supported when generating LODs in batch, skipped.")
+
+        table = format_lod_summary_table(summaries, lods)
+        self.report({"INFO"}, f"LODs generated for {len(summaries)} drawable model(s)\n" + "\n".join(table))
+
+        return {"FINISHED"}
 
 
 class SOLLUMZ_OT_extract_lods(bpy.types.Operator):
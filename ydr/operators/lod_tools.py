@@ -1,5 +1,6 @@
 import bpy
 from bpy.types import Operator
+from ..material_atlas import get_atlas_sources, find_atlas_material, merge_mesh_materials_into_atlas
 
 
 class SOLLUMZ_OT_material_merge_bake(Operator):
@@ -17,6 +18,13 @@ class SOLLUMZ_OT_material_merge_bake(Operator):
         obj = context.active_object
         settings = context.scene.sollumz_material_merge_settings
 
+        if settings.merge_method == "ATLAS":
+            sources = get_atlas_sources(obj.data, settings.bake_type)
+            if sources is not None:
+                return self.execute_atlas(obj, settings, sources)
+
+            self.report({"INFO"}, "Some materials are not driven by an image texture, baking them instead")
+
         original_engine = context.scene.render.engine
         original_samples = context.scene.cycles.samples if hasattr(context.scene, "cycles") else 128
 
@@ -79,6 +87,43 @@ class SOLLUMZ_OT_material_merge_bake(Operator):
 
         return {"FINISHED"}
 
+    def execute_atlas(self, obj, settings, sources):
+        mesh = obj.data
+        uv_layer_name = "MaterialMerge_UV"
+        try:
+            image, reused = merge_mesh_materials_into_atlas(
+                mesh,
+                sources,
+                int(settings.texture_size),
+                settings.uv_margin,
+                uv_layer_name,
+                f"{obj.name}_Atlas",
+                "sRGB" if settings.bake_type != "NORMAL" else "Non-Color",
+            )
+        except ValueError as e:
+            self.report({"ERROR"}, f"Atlas packing failed: {str(e)}")
+            return {"CANCELLED"}
+
+        mesh.uv_layers[uv_layer_name].active = True
+        mesh.uv_layers[uv_layer_name].active_render = True
+
+        key = image["sz_atlas_key"]
+        merged_mat = find_atlas_material(key)
+        if merged_mat is None:
+            merged_mat = self.create_merged_material(obj.name, image, settings.bake_type)
+            merged_mat["sz_atlas_key"] = key
+
+        mesh.materials.clear()
+        mesh.materials.append(merged_mat)
+        mesh.polygons.foreach_set("material_index", [0] * len(mesh.polygons))
+        mesh.update()
+
+        self.report(
+            {"INFO"},
+            f"Successfully packed {len(sources)} materials into atlas '{image.name}'" + (" (reused)" if reused else "")
+        )
+        return {"FINISHED"}
+
     def smart_unwrap_object(self, context, obj, margin):
         original_mode = obj.mode
 
@@ -1,3 +1,4 @@
+import fnmatch
 import traceback
 import bpy
 from bpy.types import (
@@ -8,6 +9,7 @@ from bpy.types import (
 from bpy.props import (
     IntProperty,
     BoolProperty,
+    StringProperty,
 )
 from ..shader_preset import ShaderPreset, ShaderPresetParam
 from szio.gta5.shader import (
@@ -27,7 +29,8 @@ from ...tools.meshhelper import (
     mesh_rename_color_attrs_by_order,
 )
 from ...shared.shader_nodes import SzShaderNodeParameter
-from ..properties import get_shader_presets_path, load_shader_presets, shader_presets
+from ...shared.material_users import get_material_users_index
+from ..properties import get_shader_presets_path, load_shader_presets, read_shader_presets, shader_presets
 from ..shader_materials import (
     create_shader,
     create_tinted_shader_graph,
@@ -189,8 +192,9 @@ class SOLLUMZ_OT_load_shader_preset(SOLLUMZ_OT_base, bpy.types.Operator):
             cls.poll_message_set("No Sollumz shader material selected.")
             return False
 
-        wm = context.window_manager
-        if not (0 <= wm.sz_shader_preset_index < len(wm.sz_shader_presets)):
+        # The UI collection may not be populated yet, check the presets file instead
+        read_shader_presets()
+        if not (0 <= context.window_manager.sz_shader_preset_index < len(shader_presets.presets)):
             cls.poll_message_set("No shader preset available.")
             return False
 
@@ -218,8 +222,8 @@ class SOLLUMZ_OT_delete_shader_preset(SOLLUMZ_OT_base, bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        wm = context.window_manager
-        return 0 <= wm.sz_shader_preset_index < len(wm.sz_shader_presets)
+        read_shader_presets()
+        return 0 <= context.window_manager.sz_shader_preset_index < len(shader_presets.presets)
 
     def run(self, context):
         index = context.window_manager.sz_shader_preset_index
@@ -629,36 +633,105 @@ class SOLLUMZ_OT_change_shader(SOLLUMZ_OT_base, bpy.types.Operator):
         shader_preset_apply_to_material(mat, tmp_preset, apply_textures=True)
 
         post_create_shader_add_default_images(mat)
-        for obj in bpy.data.objects:  # update all objects that are using this material
-            if obj.type == "MESH" and mat.name in obj.data.materials:
-                post_create_shader_update_object(obj, mat)
+        # Update all objects that are using this material
+        for obj in get_material_users_index(context).get_objects(mat):
+            post_create_shader_update_object(obj, mat)
 
         self.message(f"Changed {old_shader_filename} shader to {new_shader_filename}.")
         return True
 
 
+class SOLLUMZ_OT_change_shader_matching(SOLLUMZ_OT_base, bpy.types.Operator):
+    """Change the shader used by all materials matching the name pattern and current shader"""
+    bl_idname = "sollumz.change_shader_matching"
+    bl_label = "Change Shader of Matching Materials"
+    bl_action = "Change Shader of Matching Materials"
+
+    shader_index: IntProperty(name="Shader Index", min=0, max=len(shadermats) - 1)
+    name_pattern: StringProperty(
+        name="Material Name",
+        description="Only change materials with a name matching this pattern. Supports * and ? wildcards",
+        default="*",
+    )
+    current_shader: StringProperty(
+        name="Current Shader",
+        description="Only change materials currently using this shader (e.g. default.sps). Leave empty for any shader",
+        default="",
+    )
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def draw(self, context):
+        layout = self.layout
+        layout.use_property_split = True
+        layout.label(text=f"New Shader: {shadermats[self.shader_index].ui_name}")
+        layout.prop(self, "name_pattern")
+        layout.prop(self, "current_shader")
+
+    def run(self, context):
+        new_shader_filename = shadermats[self.shader_index].value
+        materials = [
+            mat for mat in bpy.data.materials
+            if mat.sollum_type == MaterialType.SHADER and
+            fnmatch.fnmatchcase(mat.name, self.name_pattern) and
+            (not self.current_shader or mat.shader_properties.filename == self.current_shader)
+        ]
+        if not materials:
+            self.message("No materials match the filter.")
+            return False
+
+        for mat in materials:
+            tmp_preset = shader_preset_from_material(mat)
+            create_shader(new_shader_filename, in_place_material=mat)
+            shader_preset_apply_to_material(mat, tmp_preset, apply_textures=True)
+            post_create_shader_add_default_images(mat)
+
+        index = get_material_users_index(context)
+        for mat in materials:
+            for obj in index.get_objects(mat):
+                post_create_shader_update_object(obj, mat)
+
+        self.message(f"Changed shader of {len(materials)} material(s) to {new_shader_filename}.")
+        return True
+
+
+def _selected_objects_materials(
+    op: SOLLUMZ_OT_base, objs: list[bpy.types.Object], active_only: bool
+) -> dict[Material, bpy.types.Object]:
+    """Gets the materials of the objects, each one mapped to the first object using it, so materials shared by many
+    objects are only processed once.
+    """
+    materials = {}
+    for obj in objs:
+        if active_only:
+            mat = obj.active_material
+            if mat is None:
+                op.message(f"No active material on {obj.name} will be skipped")
+                continue
+            obj_materials = (mat,)
+        else:
+            obj_materials = obj.data.materials
+
+        for mat in obj_materials:
+            if mat is not None:
+                materials.setdefault(mat, obj)
+
+    return materials
+
+
+def _set_material_textures_embedded(mat: Material, embedded: bool):
+    for node in mat.node_tree.nodes:
+        if isinstance(node, bpy.types.ShaderNodeTexImage):
+            node.texture_properties.embedded = embedded
+
+
 class SOLLUMZ_OT_set_all_textures_embedded(SOLLUMZ_OT_base, bpy.types.Operator):
     """Sets all textures to embedded on the selected objects active material"""
     bl_idname = "sollumz.setallembedded"
     bl_label = "Set all Textures Embedded"
     bl_action = "Set all Textures Embedded"
 
-    def set_textures_embedded(self, obj):
-        mat = obj.active_material
-        if mat is None:
-            self.message(f"No active material on {obj.name} will be skipped")
-            return
-
-        if mat.sollum_type == MaterialType.SHADER:
-            for node in mat.node_tree.nodes:
-                if isinstance(node, bpy.types.ShaderNodeTexImage):
-                    node.texture_properties.embedded = True
-            self.message(
-                f"Set {obj.name}s material {mat.name} textures to embedded.")
-        else:
-            self.message(
-                f"Skipping object {obj.name} because it does not have a sollumz shader active.")
-
     def run(self, context):
         objs = [obj for obj in context.selected_objects if obj.type == "MESH"]
         if len(objs) == 0:
@@ -666,8 +739,14 @@ class SOLLUMZ_OT_set_all_textures_embedded(SOLLUMZ_OT_base, bpy.types.Operator):
                 f"No mesh objects selected!")
             return False
 
-        for obj in objs:
-            self.set_textures_embedded(obj)
+        for mat, obj in _selected_objects_materials(self, objs, active_only=True).items():
+            if mat.sollum_type == MaterialType.SHADER:
+                _set_material_textures_embedded(mat, True)
+                self.message(
+                    f"Set {obj.name}s material {mat.name} textures to embedded.")
+            else:
+                self.message(
+                    f"Skipping object {obj.name} because it does not have a sollumz shader active.")
 
         return True
 
@@ -678,18 +757,6 @@ class SOLLUMZ_OT_set_all_materials_embedded(SOLLUMZ_OT_base, bpy.types.Operator)
     bl_label = "Set all Materials Embedded"
     bl_action = "Set All Materials Embedded"
 
-    def set_materials_embedded(self, obj):
-        for mat in obj.data.materials:
-            if mat.sollum_type == MaterialType.SHADER:
-                for node in mat.node_tree.nodes:
-                    if isinstance(node, bpy.types.ShaderNodeTexImage):
-                        node.texture_properties.embedded = True
-                self.message(
-                    f"Set {obj.name}s material {mat.name} textures to embedded.")
-            else:
-                self.message(
-                    f"Skipping object {obj.name} because it does not have a sollumz shader active.")
-
     def run(self, context):
         objs = [obj for obj in context.selected_objects if obj.type == "MESH"]
         if len(objs) == 0:
@@ -697,8 +764,14 @@ class SOLLUMZ_OT_set_all_materials_embedded(SOLLUMZ_OT_base, bpy.types.Operator)
                 f"No mesh objects selected!")
             return False
 
-        for obj in objs:
-            self.set_materials_embedded(obj)
+        for mat, obj in _selected_objects_materials(self, objs, active_only=False).items():
+            if mat.sollum_type == MaterialType.SHADER:
+                _set_material_textures_embedded(mat, True)
+                self.message(
+                    f"Set {obj.name}s material {mat.name} textures to embedded.")
+            else:
+                self.message(
+                    f"Skipping material {mat.name} of {obj.name} because it is not a sollumz shader.")
 
         return True
 
@@ -709,22 +782,6 @@ class SOLLUMZ_OT_remove_all_textures_embedded(SOLLUMZ_OT_base, bpy.types.Operato
     bl_label = "Remove all Embeded Textures"
     bl_action = "Remove all Embeded Textures"
 
-    def set_textures_unembedded(self, obj):
-        mat = obj.active_material
-        if mat == None:
-            self.message(f"No active material on {obj.name} will be skipped")
-            return
-
-        if mat.sollum_type == MaterialType.SHADER:
-            for node in mat.node_tree.nodes:
-                if (isinstance(node, bpy.types.ShaderNodeTexImage)):
-                    node.texture_properties.embedded = False
-            self.message(
-                f"Set {obj.name}s material {mat.name} textures to unembedded.")
-        else:
-            self.message(
-                f"Skipping object {obj.name} because it does not have a sollumz shader active.")
-
     def run(self, context):
         objs = [obj for obj in context.selected_objects if obj.type == "MESH"]
         if len(objs) == 0:
@@ -732,8 +789,14 @@ class SOLLUMZ_OT_remove_all_textures_embedded(SOLLUMZ_OT_base, bpy.types.Operato
                 f"No mesh objects selected!")
             return False
 
-        for obj in objs:
-            self.set_textures_unembedded(obj)
+        for mat, obj in _selected_objects_materials(self, objs, active_only=True).items():
+            if mat.sollum_type == MaterialType.SHADER:
+                _set_material_textures_embedded(mat, False)
+                self.message(
+                    f"Set {obj.name}s material {mat.name} textures to unembedded.")
+            else:
+                self.message(
+                    f"Skipping object {obj.name} because it does not have a sollumz shader active.")
 
         return True
 
@@ -744,18 +807,6 @@ class SOLLUMZ_OT_unset_all_materials_embedded(SOLLUMZ_OT_base, bpy.types.Operato
     bl_label = "Set all Materials Unembedded"
     bl_action = "Set all Materials Unembedded"
 
-    def set_materials_unembedded(self, obj):
-        for mat in obj.data.materials:
-            if mat.sollum_type == MaterialType.SHADER:
-                for node in mat.node_tree.nodes:
-                    if (isinstance(node, bpy.types.ShaderNodeTexImage)):
-                        node.texture_properties.embedded = False
-                self.message(
-                    f"Set {obj.name}s materials to unembedded.")
-            else:
-                self.message(
-                    f"Skipping object {obj.name} because it does not have a sollumz shader active.")
-
     def run(self, context):
         objs = [obj for obj in context.selected_objects if obj.type == "MESH"]
         if len(objs) == 0:
@@ -763,8 +814,14 @@ class SOLLUMZ_OT_unset_all_materials_embedded(SOLLUMZ_OT_base, bpy.types.Operato
                 f"No mesh objects selected!")
             return False
 
-        for obj in objs:
-            self.set_materials_unembedded(obj)
+        for mat, obj in _selected_objects_materials(self, objs, active_only=False).items():
+            if mat.sollum_type == MaterialType.SHADER:
+                _set_material_textures_embedded(mat, False)
+                self.message(
+                    f"Set {obj.name}s material {mat.name} textures to unembedded.")
+            else:
+                self.message(
+                    f"Skipping material {mat.name} of {obj.name} because it is not a sollumz shader.")
 
         return True
 
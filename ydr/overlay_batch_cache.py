@@ -0,0 +1,48 @@
+from bpy.types import Object
+from gpu.types import GPUBatch
+from collections.abc import Callable, Hashable
+from ..shared.mesh_updates import mesh_update_counter
+
+
+class OverlayBatchCache:
+    """Caches the GPU batches drawn by viewport overlays, so they are only rebuilt when the data they are built from
+    changes instead of on every redraw.
+
+    Batches are keyed by object and a batch name. A batch is rebuilt when the object's mesh is updated, the object's
+    world transform or mode changes, or the extra ``state`` passed by the caller changes.
+    """
+
+    MAX_ENTRIES = 16
+
+    def __init__(self):
+        self._entries: dict[tuple[int, str], tuple[Hashable, GPUBatch | None]] = {}
+
+    def get(
+        self,
+        obj: Object,
+        name: str,
+        build: Callable[[], GPUBatch | None],
+        state: Hashable = None,
+    ) -> GPUBatch | None:
+        key = (obj.as_pointer(), name)
+        full_state = (
+            mesh_update_counter(obj.data),
+            obj.mode,
+            tuple(tuple(row) for row in obj.matrix_world),
+            state,
+        )
+
+        entry = self._entries.get(key, None)
+        if entry is not None and entry[0] == full_state:
+            return entry[1]
+
+        batch = build()
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.MAX_ENTRIES:
+            # Overlays are usually only drawn for the active object, so just drop the oldest entry
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (full_state, batch)
+        return batch
+
+    def clear(self):
+        self._entries.clear()
@@ -20,6 +20,12 @@ from ..tools.blenderhelper import lod_level_enum_flag_prop_factory
 from ..sollumz_helper import find_sollumz_parent
 from .light_preset import LightPresetsFile
 from .shader_preset import ShaderPresetsFile
+from ..shared.ui_collections import (
+    load_xml_file_cached,
+    sync_ui_collection,
+    refresh_ui_collections_deferred,
+    cancel_deferred_refresh,
+)
 from ..sollumz_properties import SOLLUMZ_UI_NAMES, items_from_enums, LODLevel, SollumType, LightType, FlagPropertyGroup, TimeFlagsMixin
 from ..ydr.shader_materials import shadermats, shadermats_by_filename
 from .render_bucket import RenderBucket, RenderBucketEnumItems
@@ -31,6 +37,17 @@ from bpy.path import basename
 class MaterialMergeSettings(bpy.types.PropertyGroup):
     """Settings for material merge baking"""
 
+    merge_method: EnumProperty(
+        name="Method",
+        description="How the materials are merged into a single texture",
+        items=[
+            ("BAKE", "Bake", "Unwrap the mesh and bake all materials with Cycles. Supports procedural materials"),
+            ("ATLAS", "Atlas", "Pack the texture of each material into an atlas and remap the existing UVs. Much "
+                               "faster than baking, falls back to baking if any material is not driven by a texture"),
+        ],
+        default="BAKE"
+    )
+
     texture_size: EnumProperty(
         name="Texture Size",
         description="Resolution of the baked texture",
@@ -853,38 +870,46 @@ light_presets = LightPresetsFile()
 shader_presets = ShaderPresetsFile()
 
 
-def load_light_presets():
-    bpy.context.window_manager.sz_light_presets.clear()
+def _init_preset_entry(item: PresetEntry, index: int):
+    item.index = index
 
+
+def read_light_presets():
+    """Updates ``light_presets`` from the presets file, without updating the UI collection."""
     path = get_light_presets_path()
     if not os.path.exists(path):
         path = get_default_light_presets_path()
         if not os.path.exists(path):
+            light_presets.presets = []
             return
 
-    file = LightPresetsFile.from_xml_file(path)
-    light_presets.presets = file.presets
-    for index, preset in enumerate(light_presets.presets):
-        item = bpy.context.window_manager.sz_light_presets.add()
-        item.name = str(preset.name)
-        item.index = index
+    # Copy the list, operators add and remove presets before saving and the parsed file is cached
+    light_presets.presets = list(load_xml_file_cached(path, LightPresetsFile).presets)
 
 
-def load_shader_presets():
-    bpy.context.window_manager.sz_shader_presets.clear()
+def load_light_presets():
+    read_light_presets()
+    names = [str(preset.name) for preset in light_presets.presets]
+    sync_ui_collection(bpy.context.window_manager.sz_light_presets, names, _init_preset_entry)
+
 
+def read_shader_presets():
+    """Updates ``shader_presets`` from the presets file, without updating the UI collection."""
     path = get_shader_presets_path()
     if not os.path.exists(path):
         path = get_default_shader_presets_path()
         if not os.path.exists(path):
+            shader_presets.presets = []
             return
 
-    file = ShaderPresetsFile.from_xml_file(path)
-    shader_presets.presets = file.presets
-    for index, preset in enumerate(shader_presets.presets):
-        item = bpy.context.window_manager.sz_shader_presets.add()
-        item.name = str(preset.name)
-        item.index = index
+    # Copy the list, operators add and remove presets before saving and the parsed file is cached
+    shader_presets.presets = list(load_xml_file_cached(path, ShaderPresetsFile).presets)
+
+
+def load_shader_presets():
+    read_shader_presets()
+    names = [str(preset.name) for preset in shader_presets.presets]
+    sync_ui_collection(bpy.context.window_manager.sz_shader_presets, names, _init_preset_entry)
 
 
 def get_texture_name(self):
@@ -909,15 +934,19 @@ def get_model_properties(model_obj: bpy.types.Object, lod_level: LODLevel) -> Dr
     return lod_mesh.drawable_model_properties
 
 
+def _init_shader_material_entry(item: ShaderMaterial, index: int):
+    item.index = index
+    item.search_name = shadermats[index].ui_name.replace(" ", "").replace("_", "")
+
+
 def refresh_ui_collections():
     # Initialize shader materials collection with an entry per shader
     # We need the shader list as a collection property to be able to display it on the UI
-    bpy.context.window_manager.sz_shader_materials.clear()
-    for index, mat in enumerate(shadermats):
-        item = bpy.context.window_manager.sz_shader_materials.add()
-        item.index = index
-        item.name = mat.name
-        item.search_name = mat.ui_name.replace(" ", "").replace("_", "")
+    sync_ui_collection(
+        bpy.context.window_manager.sz_shader_materials,
+        [mat.name for mat in shadermats],
+        _init_shader_material_entry
+    )
 
     load_light_presets()
     load_shader_presets()
@@ -925,7 +954,7 @@ def refresh_ui_collections():
 
 @persistent
 def on_blend_file_loaded(_):
-    refresh_ui_collections()
+    refresh_ui_collections_deferred(refresh_ui_collections)
 
 
 def register():
@@ -1121,7 +1150,7 @@ def register():
     )
 
     bpy.app.handlers.load_post.append(on_blend_file_loaded)
-    refresh_ui_collections()
+    refresh_ui_collections_deferred(refresh_ui_collections)
 
 
 def unregister():
@@ -1180,3 +1209,4 @@ def unregister():
     del bpy.types.Scene.sollumz_material_merge_settings
 
     bpy.app.handlers.load_post.remove(on_blend_file_loaded)
+    cancel_deferred_refresh(refresh_ui_collections)
@@ -17,7 +17,6 @@ from .operators import (
 from .shader_materials import shadermats
 from .cable import CableAttr, is_cable_mesh
 from .cloth import ClothAttr
-from .cloth_char import cloth_char_find_mesh_objects
 from .cloth_diagnostics import cloth_last_export_contexts
 from szio.gta5 import ShaderManager
 from ..sollumz_ui import SOLLUMZ_PT_OBJECT_PANEL, SOLLUMZ_PT_MAT_PANEL
@@ -27,6 +26,7 @@ from ..sollumz_helper import find_sollumz_parent
 from ..sollumz_preferences import get_addon_preferences
 from ..icons import icon_manager
 from ..shared.shader_nodes import SzShaderNodeParameter
+from ..shared.lod_stats import get_mesh_stats
 from ..tools.meshhelper import (
     get_uv_map_name,
     get_color_attr_name,
@@ -147,6 +147,8 @@ class SOLLUMZ_PT_CHAR_CLOTH_PANEL(bpy.types.Panel):
 
     @property
     def has_cloth(self) -> bool:
+        from .cloth_char import cloth_char_find_mesh_objects
+
         obj = bpy.context.view_layer.objects.active
         cloth_objs = cloth_char_find_mesh_objects(obj, silent=True)
         return bool(cloth_objs)
@@ -782,8 +784,13 @@ class SOLLUMZ_PT_change_shader(bpy.types.Panel):
             SOLLUMZ_UL_SHADER_MATERIALS_LIST.bl_idname, "",
             wm, "sz_shader_materials", wm, "sz_shader_material_index"
         )
-        op = layout.operator(mat_ops.SOLLUMZ_OT_change_shader.bl_idname)
+        row = layout.row(align=True)
+        op = row.operator(mat_ops.SOLLUMZ_OT_change_shader.bl_idname)
+        op.shader_index = wm.sz_shader_material_index
+        op = row.operator(mat_ops.SOLLUMZ_OT_change_shader_matching.bl_idname, text="Matching Materials...")
         op.shader_index = wm.sz_shader_material_index
+        mat = context.active_object.active_material if context.active_object else None
+        op.current_shader = mat.shader_properties.filename if mat is not None else ""
 
 
 def collect_parameter_nodes(mat: bpy.types.Material, filter_func) -> list[bpy.types.Node]:
@@ -993,18 +1000,15 @@ class SOLLUMZ_PT_AUTO_LOD_PANEL(bpy.types.Panel):
                         stats_col = stats_box.column(align=True)
                         stats_col.label(text="LOD Stats:", icon="INFO")
                         has_any = True
-                    tri_count = self._count_tris(mesh)
+                    stats = get_mesh_stats(mesh)
                     row = stats_col.row()
                     row.label(text=f"{SOLLUMZ_UI_NAMES[lod_level]}:")
-                    row.label(text=f"{tri_count} tris / {len(mesh.vertices)} verts")
+                    row.label(text=f"{stats.tri_count} tris / {stats.vert_count} verts / {stats.material_count} mats")
 
         box.separator()
-        box.operator("sollumz.auto_lod", icon="MOD_DECIM")
-
-    @staticmethod
-    def _count_tris(mesh):
-        """Count triangles in a mesh (accounting for n-gons)."""
-        return sum(max(1, len(p.vertices) - 2) for p in mesh.polygons)
+        row = box.row(align=True)
+        row.operator("sollumz.auto_lod", icon="MOD_DECIM")
+        row.operator("sollumz.auto_lod_batch", text="Selected", icon="MOD_DECIM")
 
 
 class SOLLUMZ_PT_EXTRACT_LODS_PANEL(bpy.types.Panel):
@@ -1050,15 +1054,17 @@ class SOLLUMZ_PT_MATERIAL_MERGE_PANEL(bpy.types.Panel):
 
         box = layout.box()
 
+        box.prop(settings, "merge_method")
         box.prop(settings, "texture_size")
         box.prop(settings, "bake_type")
         box.prop(settings, "uv_margin")
-        box.prop(settings, "samples")
+        if settings.merge_method == "BAKE":
+            box.prop(settings, "samples")
 
         box.separator()
 
         if obj is not None and obj.type == "MESH":
-            mat_count = len(obj.data.materials)
+            mat_count = get_mesh_stats(obj.data).material_count
             box.label(text=f"Object: {obj.name}")
             box.label(text=f"Materials: {mat_count}")
         else:
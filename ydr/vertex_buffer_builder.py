@@ -35,6 +35,7 @@ from .cloth_diagnostics import (
 from .vertex_buffer_builder_domain import VBBuilderDomain
 
 from .. import logger
+from .. import profiling
 
 VGROUP_INVALID_BONE_ID = -1
 VGROUP_CLOTH_ID = -2
@@ -100,6 +101,7 @@ def remove_unused_uvs(vertex_arr: NDArray, used_texcoords: set[str]) -> NDArray:
     return vertex_arr[new_names]
 
 
+@profiling.traced()
 def dedupe_and_get_indices(vertex_arr: NDArray) -> Tuple[NDArray, NDArray[np.uint32]]:
     """Remove duplicate vertices from the buffer and get the new vertex indices in triangle order (used for IndexBuffer). Returns vertices, indices."""
 
@@ -140,6 +142,8 @@ def dedupe_and_get_indices(vertex_arr: NDArray) -> Tuple[NDArray, NDArray[np.uin
     # Lookup the vertices in the original structured and un-rounded array
     vertex_arr = vertex_arr[unique_indices]
     index_arr = np.asarray(inverse_indices, dtype=np.uint32)
+    profiling.count("input_vertices", num_verts)
+    profiling.count("unique_vertices", len(vertex_arr))
     return vertex_arr, index_arr
 
 
@@ -351,7 +351,7 @@ def create_geometries_xml(
     del colors_missing
     del colors_incorrect_format
 
-    loop_inds_by_mat = get_loop_inds_by_material(mesh_eval, materials)
+    sorted_loop_inds, loop_ranges_by_mat = get_loop_partition_by_material(mesh_eval, materials)
 
     geometries: list[Geometry] = []
 
@@ -366,15 +366,19 @@ def create_geometries_xml(
         # bit dirty to use private data of the builder class, but we need this array here and it is already computed
         loop_to_vert_inds = vb_builder._loop_to_vert_inds
 
-    for mat_index, loop_inds in loop_inds_by_mat.items():
+    # Gather the vertices in material order once, each geometry is then built from a contiguous view of this buffer
+    if domain == VBBuilderDomain.FACE_CORNER:
+        sorted_vert_buffer = total_vert_buffer[sorted_loop_inds]
+    elif domain == VBBuilderDomain.VERTEX:
+        sorted_vert_buffer = total_vert_buffer[loop_to_vert_inds[sorted_loop_inds]]
+    del total_vert_buffer
+
+    for mat_index, loop_range in loop_ranges_by_mat.items():
         material = materials[mat_index]
         tangent_required = get_tangent_required(material)
         normal_required = get_normal_required(material)
 
-        if domain == VBBuilderDomain.FACE_CORNER:
-            vert_buffer = total_vert_buffer[loop_inds]
-        elif domain == VBBuilderDomain.VERTEX:
-            vert_buffer = total_vert_buffer[loop_to_vert_inds[loop_inds]]
+        vert_buffer = sorted_vert_buffer[loop_range]
         used_texcoords = get_used_texcoords(material)
         used_colors = get_used_colors(material)
 
@@ -412,45 +416,57 @@ def sort_geoms_by_shader(geometries: list[Geometry]):
 
 
 def get_loop_inds_by_material(mesh: bpy.types.Mesh, drawable_mats: list[bpy.types.Material]):
-    loop_inds_by_mat: dict[int, NDArray[np.uint32]] = {}
+    sorted_loop_inds, loop_ranges_by_mat = get_loop_partition_by_material(mesh, drawable_mats)
+    return {shader_index: sorted_loop_inds[loop_range] for shader_index, loop_range in loop_ranges_by_mat.items()}
+
+
+def get_loop_partition_by_material(
+    mesh: bpy.types.Mesh,
+    drawable_mats: list[bpy.types.Material]
+) -> tuple[NDArray[np.uint32], dict[int, slice]]:
+    """Partition the loop triangles of the mesh by drawable material with a single stable sort.
 
+    Returns the loop indices sorted by shader index and the slice of that array used by each shader index. Loops of
+    material slots that share the same material stay in slot order, and triangles keep their original order within
+    each slot. Loops of material slots without a drawable material are discarded.
+    """
     if not mesh.loop_triangles:
         mesh.calc_loop_triangles()
 
+    num_tris = len(mesh.loop_triangles)
+
     # Material indices for each triangle
-    tri_mat_indices = np.empty(len(mesh.loop_triangles), dtype=np.uint32)
+    tri_mat_indices = np.empty(num_tris, dtype=np.uint32)
     mesh.loop_triangles.foreach_get("material_index", tri_mat_indices)
 
-    # Material indices for each loop triangle
-    loop_mat_inds = np.repeat(tri_mat_indices, 3)
-
-    all_loop_inds = np.empty(len(mesh.loop_triangles) * 3, dtype=np.uint32)
+    all_loop_inds = np.empty(num_tris * 3, dtype=np.uint32)
     mesh.loop_triangles.foreach_get("loops", all_loop_inds)
 
-    mat_inds: dict[str, int] = {mat: i for i, mat in enumerate(drawable_mats)}
+    mat_inds: dict[bpy.types.Material, int] = {mat: i for i, mat in enumerate(drawable_mats)}
 
+    # Get index of material on drawable (different from mesh material index) for each material slot
+    num_slots = len(mesh.materials)
+    slot_shader_inds = np.full(num_slots + 1, -1, dtype=np.int64)  # extra slot for out-of-range material indices
     for i, mat in enumerate(mesh.materials):
-        original_mat = mat.original
-
-        if original_mat not in mat_inds:
-            continue
+        if mat is not None:
+            slot_shader_inds[i] = mat_inds.get(mat.original, -1)
 
-        # Get index of material on drawable (different from mesh material index)
-        shader_index = mat_inds[original_mat]
-        tri_loop_inds = np.where(loop_mat_inds == i)[0]
-
-        if tri_loop_inds.size == 0:
-            continue
+    tri_slots = np.minimum(tri_mat_indices, num_slots).astype(np.int64)
+    tri_shader_inds = slot_shader_inds[tri_slots]
+    valid_tris = np.flatnonzero(tri_shader_inds != -1)
 
-        loop_indices = all_loop_inds[tri_loop_inds]
+    # Sort by shader index first and material slot second, so slots sharing a material are merged in slot order
+    tri_sort_keys = tri_shader_inds[valid_tris] * (num_slots + 1) + tri_slots[valid_tris]
+    sorted_tris = valid_tris[np.argsort(tri_sort_keys, kind="stable")]
+    sorted_loop_inds = all_loop_inds.reshape((num_tris, 3))[sorted_tris].ravel()
 
-        if shader_index in loop_inds_by_mat:
-            # Merge arrays when multiple material slots use the same material
-            loop_inds_by_mat[shader_index] = np.concatenate((loop_inds_by_mat[shader_index], loop_indices))
-        else:
-            loop_inds_by_mat[shader_index] = loop_indices
+    shader_inds, starts, counts = np.unique(tri_shader_inds[sorted_tris], return_index=True, return_counts=True)
+    loop_ranges_by_mat: dict[int, slice] = {
+        int(shader_index): slice(int(start) * 3, int(start + count) * 3)
+        for shader_index, start, count in zip(shader_inds, starts, counts)
+    }
 
-    return loop_inds_by_mat
+    return sorted_loop_inds, loop_ranges_by_mat
 
 
 def get_geom_extents(positions: NDArray[np.float32]):
@@ -80,6 +80,7 @@ from .lights_io import export_lights
 
 from ..iecontext import export_context, ExportBundle
 from .. import logger
+from .. import profiling
 
 
 def export_ydr(obj: Object) -> ExportBundle:
@@ -88,6 +89,7 @@ def export_ydr(obj: Object) -> ExportBundle:
     return export_context().make_bundle(d, extra_files=[t.data for t in embedded_tex])
 
 
+@profiling.traced()
 def create_drawable_asset(
     drawable_obj: Object,
     armature_obj: Optional[Object] = None,
@@ -148,6 +150,7 @@ def create_drawable_asset(
     return drawable
 
 
+@profiling.traced()
 def create_models(
     drawable: AssetDrawable,
     drawable_obj: Object,
@@ -263,6 +266,7 @@ def get_model_bone_index(model_obj: Object) -> int:
     return impl(model_obj)
 
 
+@profiling.traced()
 def create_geometries(
     model_obj: Object,
     mesh_eval: Mesh,
@@ -339,7 +343,7 @@ def create_geometries(
     del colors_missing
     del colors_incorrect_format
 
-    loop_inds_by_mat = get_loop_inds_by_material(mesh_eval, materials)
+    sorted_loop_inds, loop_ranges_by_mat = get_loop_partition_by_material(mesh_eval, materials)
 
     geometries: list[Geometry] = []
 
@@ -348,20 +352,26 @@ def create_geometries(
 
     domain = export_context().settings.mesh_domain if mesh_domain_override is None else mesh_domain_override
     vb_builder = VertexBufferBuilder(mesh_eval, bone_by_vgroup, domain, materials, char_cloth)
-    total_vert_buffer = vb_builder.build()
+    with profiling.span("build vertex buffer"):
+        total_vert_buffer = vb_builder.build()
+    profiling.count("loops", len(mesh_eval.loops))
     if domain == VBBuilderDomain.VERTEX:
         # bit dirty to use private data of the builder class, but we need this array here and it is already computed
         loop_to_vert_inds = vb_builder._loop_to_vert_inds
 
-    for mat_index, loop_inds in loop_inds_by_mat.items():
+    # Gather the vertices in material order once, each geometry is then built from a contiguous view of this buffer
+    if domain == VBBuilderDomain.FACE_CORNER:
+        sorted_vert_buffer = total_vert_buffer[sorted_loop_inds]
+    elif domain == VBBuilderDomain.VERTEX:
+        sorted_vert_buffer = total_vert_buffer[loop_to_vert_inds[sorted_loop_inds]]
+    del total_vert_buffer
+
+    for mat_index, loop_range in loop_ranges_by_mat.items():
         material = materials[mat_index]
         tangent_required = get_tangent_required(material)
         normal_required = get_normal_required(material)
 
-        if domain == VBBuilderDomain.FACE_CORNER:
-            vert_buffer = total_vert_buffer[loop_inds]
-        elif domain == VBBuilderDomain.VERTEX:
-            vert_buffer = total_vert_buffer[loop_to_vert_inds[loop_inds]]
+        vert_buffer = sorted_vert_buffer[loop_range]
         used_texcoords = get_used_texcoords(material)
         used_colors = get_used_colors(material)
 
@@ -392,6 +402,7 @@ def create_geometries(
         geometries.append(geom)
 
     geometries = sort_geoms_by_shader(geometries)
+    profiling.count("geometries", len(geometries))
 
     return geometries
 
@@ -405,6 +416,14 @@ def get_loop_inds_by_material(mesh: Mesh, drawable_mats: list[Material]) -> dict
     return impl(mesh, drawable_mats)
 
 
+def get_loop_partition_by_material(
+    mesh: Mesh,
+    drawable_mats: list[Material]
+) -> tuple[NDArray[np.uint32], dict[int, slice]]:
+    from .ydrexport import get_loop_partition_by_material as impl
+    return impl(mesh, drawable_mats)
+
+
 def get_bone_ids(bones: list[Bone]) -> list[int]:
     from .ydrexport import get_bone_ids as impl
     return impl(bones)
@@ -442,13 +461,7 @@ def join_skinned_models(models: list[Model]) -> list[Model]:
 
     skinned_geoms: list[Geometry] = [geom for model in skinned_models for geom in model.geometries]
 
-    geoms_by_shader: dict[int, list[Geometry]] = defaultdict(list)
-
-    for geom in skinned_geoms:
-        geoms_by_shader[geom.shader_index].append(geom)
-
-    joined_skinned_geoms = [join_geometries(geoms, shader_ind) for shader_ind, geoms in geoms_by_shader.items()]
-    joined_skinned_geoms = sort_geoms_by_shader(joined_skinned_geoms)
+    joined_skinned_geoms = join_geometries_by_shader(skinned_geoms)
     joined_skinned_model = Model(
         bone_index=0,
         geometries=joined_skinned_geoms,
@@ -461,6 +474,16 @@ def join_skinned_models(models: list[Model]) -> list[Model]:
     return [joined_skinned_model, *non_skinned_models]
 
 
+def join_geometries_by_shader(geometries: list[Geometry]) -> list[Geometry]:
+    """Join all geometries that use the same shader into a single geometry. Returns the joined geometries sorted by
+    shader index."""
+    geoms_by_shader: dict[int, list[Geometry]] = defaultdict(list)
+    for geom in geometries:
+        geoms_by_shader[geom.shader_index].append(geom)
+
+    return [join_geometries(geoms_by_shader[shader_ind], shader_ind) for shader_ind in sorted(geoms_by_shader.keys())]
+
+
 def join_geometries(geometries: list[Geometry], shader_index: int) -> Geometry:
     vert_arrs = [g.vertex_buffer for g in geometries]
     ind_arrs = [g.index_buffer for g in geometries]
@@ -481,32 +504,31 @@ def join_geometries(geometries: list[Geometry], shader_index: int) -> Geometry:
 
 def join_vert_arrs(vert_arrs: list[NDArray]) -> NDArray:
     """Join vertex buffer structured arrays. Works with arrays that have different layouts."""
-    num_verts = sum(len(vert_arr) for vert_arr in vert_arrs)
+    vert_counts = np.array([len(vert_arr) for vert_arr in vert_arrs], dtype=np.int64)
+    row_ends = np.cumsum(vert_counts)
+    row_starts = row_ends - vert_counts
+    num_verts = int(row_ends[-1]) if len(row_ends) > 0 else 0
+
     struct_dtype = get_joined_vert_arr_dtype(vert_arrs)
     joined_arr = np.zeros(num_verts, dtype=struct_dtype)
 
     for attr_name in joined_arr.dtype.names:
-        row_start = 0
-
-        for vert_arr in vert_arrs:
-            num_attr_verts = len(vert_arr)
+        joined_attr = joined_arr[attr_name]
+        if all(attr_name in vert_arr.dtype.names for vert_arr in vert_arrs):
+            # Common case, all arrays have this attribute so copy it with a single concatenation
+            np.concatenate([vert_arr[attr_name] for vert_arr in vert_arrs], out=joined_attr)
+            continue
 
+        for vert_arr, row_start, row_end in zip(vert_arrs, row_starts, row_ends):
             if attr_name in vert_arr.dtype.names:
-                row_end = row_start + num_attr_verts
-                joined_arr[attr_name][row_start:row_end] = vert_arr[attr_name]
-
-            row_start += num_attr_verts
+                joined_attr[row_start:row_end] = vert_arr[attr_name]
 
     return joined_arr
 
 
 def get_joined_vert_arr_dtype(vert_arrs: list[NDArray]):
     """Create a new structured dtype containing all vertex attrs present in all vert_arrs"""
-    attr_names = []
-
-    for vert_arr in vert_arrs:
-        attr_names.extend(
-            name for name in vert_arr.dtype.names if name not in attr_names)
+    attr_names = dict.fromkeys(name for vert_arr in vert_arrs for name in vert_arr.dtype.names)
 
     from szio.gta5.cwxml import VertexBuffer
     return [VertexBuffer.VERT_ATTR_DTYPES[name] for name in attr_names]
@@ -514,15 +536,13 @@ def get_joined_vert_arr_dtype(vert_arrs: list[NDArray]):
 
 def join_ind_arrs(ind_arrs: list[NDArray[np.uint32]], vert_counts: list[int]) -> NDArray[np.uint32]:
     """Join vertex index arrays by simply concatenating and offsetting indices based on vertex counts"""
-    def get_vert_ind_offset(arr_ind: int) -> int:
-        if arr_ind == 0:
-            return 0
+    vert_counts = np.asarray(vert_counts, dtype=np.uint32)
+    vert_ind_offsets = np.cumsum(vert_counts, dtype=np.uint32) - vert_counts
+    ind_counts = [len(ind_arr) for ind_arr in ind_arrs]
 
-        return sum(num_verts for num_verts in vert_counts[:arr_ind])
-
-    offset_ind_arrs = [ind_arr + get_vert_ind_offset(i) for i, ind_arr in enumerate(ind_arrs)]
-
-    return np.concatenate(offset_ind_arrs)
+    joined_ind_arr = np.concatenate(ind_arrs).astype(np.uint32, copy=False)
+    joined_ind_arr += np.repeat(vert_ind_offsets, ind_counts)
+    return joined_ind_arr
 
 
 def split_models_by_vert_count(models: list[Model]) -> list[Model]:
@@ -562,39 +582,28 @@ def split_vert_buffers(
     Returns tuple of split vertex buffers and tuple of index buffers"""
     MAX_INDEX = 65535
 
-    total_index = 0
-    idx_count = len(ind_buffer)
-
     split_vert_arrs = []
     split_ind_arrs = []
-    while total_index < idx_count:
-        old_index_to_new_index = {}
-        chunk_vertices_indices = []
-        chunk_indices = []
-        chunk_index = 0
-        while total_index < idx_count and len(chunk_indices) < MAX_INDEX:
-            old_index = ind_buffer[total_index]
-            existing_index = old_index_to_new_index.get(old_index, None)
-            if existing_index is not None:
-                # we already have this index vertex addedm simply remap it to new index
-                chunk_indices.append(existing_index)
-            else:
-                # We got new index unseen before, we have to add both vertex and index
-                chunk_indices.append(chunk_index)
-                chunk_vertices_indices.append(old_index)
-                old_index_to_new_index[old_index] = chunk_index
-                chunk_index += 1
+    for chunk_start in range(0, len(ind_buffer), MAX_INDEX):
+        chunk_old_indices = ind_buffer[chunk_start:chunk_start + MAX_INDEX]
 
-            total_index += 1
+        # Remap the indices of this chunk to new indices, in order of first appearance in the chunk
+        unique_old_indices, first_appearance, unique_inverse = np.unique(
+            chunk_old_indices, return_index=True, return_inverse=True
+        )
+        appearance_order = np.argsort(first_appearance, kind="stable")
+        new_index_by_unique = np.empty(len(unique_old_indices), dtype=np.uint32)
+        new_index_by_unique[appearance_order] = np.arange(len(unique_old_indices), dtype=np.uint32)
 
-        chunk_vertices_arr = vert_buffer[chunk_vertices_indices]
-        chunk_indices_arr = np.array(chunk_indices, dtype=np.uint32)
+        chunk_vertices_arr = vert_buffer[unique_old_indices[appearance_order]]
+        chunk_indices_arr = new_index_by_unique[unique_inverse.ravel()]
         split_vert_arrs.append(chunk_vertices_arr)
         split_ind_arrs.append(chunk_indices_arr)
 
     return (split_vert_arrs, split_ind_arrs)
 
 
+@profiling.traced()
 def create_shader_group(materials: list[Material]) -> ShaderGroup:
     return ShaderGroup(
         shaders=[create_shader(m) for m in materials],
@@ -691,6 +700,7 @@ def create_shader_parameters_list_template(shader_def: Optional[ShaderDef]) -> l
     return parameters
 
 
+@profiling.traced()
 def get_embedded_textures_from_materials(materials: list[Material]) -> dict[str, EmbeddedTexture]:
     textures = {}
 
@@ -751,6 +761,7 @@ def get_embedded_texture_nodes_from_materials(materials: list[Material]) -> list
     return nodes
 
 
+@profiling.traced()
 def create_skeleton(armature_obj: bpy.types.Object, apply_transforms: bool = False) -> Skeleton:
     assert armature_obj.type == "ARMATURE" and armature_obj.pose.bones
 
@@ -875,6 +886,7 @@ def get_bone_rotation_limit(pose_bone: PoseBone) -> Optional[SkelBoneRotationLim
     ) if constraint is not None else None
 
 
+@profiling.traced()
 def create_embedded_bounds_asset(drawable_obj: Object) -> Optional[AssetBound]:
     bound_objs = [
         child for child in drawable_obj.children
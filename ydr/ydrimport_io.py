@@ -49,6 +49,7 @@ from .lights_io import create_light_objs
 from .properties import DrawableModelProperties
 from ..iecontext import import_context, ImportTexturesMode
 from .. import logger
+from .. import profiling
 
 
 def import_ydr(asset: AssetDrawable, name: str) -> Object:
@@ -58,6 +59,7 @@ def import_ydr(asset: AssetDrawable, name: str) -> Object:
     return create_drawable(asset, name=name)
 
 
+@profiling.traced()
 def create_drawable(
     drawable: AssetDrawable,
     hi_drawable: Optional[AssetDrawable] = None,
@@ -112,6 +114,7 @@ def create_drawable(
     return drawable_obj
 
 
+@profiling.traced()
 def create_drawable_models(
     drawable: AssetDrawable,
     hi_drawable: Optional[AssetDrawable],
@@ -258,6 +261,7 @@ def create_drawable_root_empty(drawable: AssetDrawable, name: str) -> Object:
     return drawable_obj
 
 
+@profiling.traced()
 def extract_embedded_textures(shader_group: ShaderGroup | None):
     import shutil
 
@@ -303,6 +307,7 @@ def shader_group_to_materials(shader_group: ShaderGroup) -> list[Material]:
     return shader_group_to_materials_with_hi(shader_group, None)[0]
 
 
+@profiling.traced()
 def shader_group_to_materials_with_hi(
     shader_group: ShaderGroup,
     hi_shader_group: Optional[ShaderGroup],
@@ -488,6 +493,7 @@ def is_non_color_texture(shader_filename: str, param_name: str) -> bool:
     )
 
 
+@profiling.traced()
 def create_drawable_skel(armature_obj: Object, skeleton: Skeleton):
     bpy.context.view_layer.objects.active = armature_obj
     bones = skeleton.bones
@@ -583,6 +589,7 @@ def add_bone_constraint_translation_limit(pose_bone: PoseBone, limit: SkelBoneTr
     return constraint
 
 
+@profiling.traced()
 def create_embedded_collisions(bounds: AssetBound, drawable_obj: bpy.types.Object):
     if bounds.bound_type == BoundType.COMPOSITE:
         bound_obj = create_bound_composite(bounds, name=f"{drawable_obj.name}.col")
@@ -59,6 +59,7 @@ from ..ydr.cloth_env_io import cloth_env_export, cloth_env_find_mesh_objects
 
 from ..iecontext import export_context, ExportBundle
 from .. import logger
+from .. import profiling
 
 from .properties import (
     LODProperties,
@@ -92,6 +93,7 @@ def create_fragment_asset(
     )
 
 
+@profiling.traced()
 def create_fragment_asset_core(
     frag_objs: FragmentObjects,
     apply_transforms: bool = False,
@@ -234,6 +236,7 @@ def has_hi_lods(frag_obj: Object) -> bool:
     return False
 
 
+@profiling.traced()
 def create_frag_drawable(
     frag_objs: FragmentObjects,
     materials: list[Material],
@@ -290,6 +293,7 @@ def create_bone_transforms_set(drawable: AssetDrawable) -> MatrixSet:
     return MatrixSet(is_skinned, bones_transforms)
 
 
+@profiling.traced()
 def create_frag_physics(
     frag_objs: FragmentObjects,
     main_drawable: AssetDrawable,
@@ -1068,6 +1072,7 @@ def generate_frag_vehicle_windows(frag: AssetFragment) -> list[FragVehicleWindow
     return native_frag.generate_vehicle_windows()
 
 
+@profiling.traced()
 def create_frag_vehicle_windows(frag_obj: Object, main_drawable: AssetDrawable, phys_children: list[PhysChild], materials: list[Material]) -> list[FragVehicleWindow]:
     """Exports all the manually defined vehicle windows found in ``frag_obj`` hierarchy."""
     child_id_by_bone_tag: dict[str, int] = {c.bone_tag: i for i, c in enumerate(phys_children)}
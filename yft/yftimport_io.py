@@ -32,6 +32,7 @@ from .properties import LODProperties, GroupFlagBit, GlassTypes
 from ..tools.blenderhelper import get_child_of_bone
 from ..iecontext import import_context
 from .. import logger
+from .. import profiling
 
 
 def find_yft_external_dependencies(asset: AssetFragment, name: str) -> AssetWithDependencies | None:
@@ -113,6 +114,7 @@ def try_load_hi_frag(name: str, prefers_xml: bool) -> AssetFragment | None:
     return hi_frag
 
 
+@profiling.traced()
 def create_fragment(frag: AssetFragment, hi_frag: Optional[AssetFragment], name: Optional[str]) -> Object:
     shader_group = frag.base_drawable.shader_group
     hi_shader_group = hi_frag.base_drawable.shader_group if hi_frag else None
@@ -158,6 +160,7 @@ def create_frag_armature(frag: AssetFragment, name: Optional[str] = None) -> Obj
     return frag_obj
 
 
+@profiling.traced()
 def create_frag_drawable(
     frag: AssetFragment,
     hi_frag: Optional[AssetFragment],
@@ -202,6 +205,7 @@ def create_frag_drawable(
     return drawable_obj
 
 
+@profiling.traced()
 def create_frag_collisions(frag: AssetFragment, frag_obj: Object, damaged: bool = False) -> Optional[Object]:
     lod1 = frag.physics.lod1
     bounds = None
@@ -265,6 +269,7 @@ def find_bound_bone(bound_index: int, frag: AssetFragment) -> SkelBone | None:
     return None
 
 
+@profiling.traced()
 def create_phys_lod(frag: AssetFragment, frag_obj: Object):
     """Create the Fragment.Physics.LOD1 data-block. (Currently LOD1 is only supported)"""
     lod = frag.physics.lod1
@@ -422,6 +427,7 @@ def create_phys_child_models(
     return child_objs
 
 
+@profiling.traced()
 def create_frag_env_cloth(frag: AssetFragment, frag_obj: Object, drawable_obj: Object, materials: list[Material]) -> Object | None:
     cloths = frag.cloths
     if not cloths:
@@ -558,6 +564,7 @@ def create_frag_env_cloth(frag: AssetFragment, frag_obj: Object, drawable_obj: O
     return model_obj
 
 
+@profiling.traced()
 def create_frag_vehicle_windows(frag: AssetFragment, frag_obj: Object, materials: list[Material]):
     vehicle_windows = frag.vehicle_windows
     if not vehicle_windows:
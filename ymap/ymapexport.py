@@ -11,6 +11,7 @@ from ..tools.meshhelper import get_bound_center_from_bounds, get_extents
 from ..sollumz_properties import SOLLUMZ_UI_NAMES, SollumType
 from ..sollumz_preferences import get_export_settings
 from .. import logger
+from .. import profiling
 from ..tools.ymaphelper import generate_ymap_extents
 
 
@@ -133,6 +134,7 @@ def calculate_cargen_orient(obj):
     return 5 * math.sin(angle), 5 * math.cos(angle)
 
 
+@profiling.traced()
 def ymap_from_object(obj):
     ymap = CMapData()
 
@@ -221,6 +223,7 @@ def ymap_from_object(obj):
     return ymap
 
 
+@profiling.traced()
 def export_ymap(obj: bpy.types.Object, filepath: str) -> bool:
     ymap = ymap_from_object(obj)
     ymap.write_xml(filepath)
@@ -15,6 +15,7 @@ from szio.gta5.cwxml import (
 from ..tools.blenderhelper import create_blender_object, create_empty_object
 from ..tools.meshhelper import create_box
 from .. import logger
+from .. import profiling
 
 # TODO: Make better?
 
@@ -220,6 +221,7 @@ def cargen_to_obj(obj: bpy.types.Object, ymap: CMapData):
         cargen_obj.parent = group_obj
 
 
+@profiling.traced()
 def ymap_to_obj(ymap: CMapData):
     ymap_obj = bpy.data.objects.new(ymap.name, None)
     ymap_obj.sollum_type = SollumType.YMAP
@@ -281,6 +283,7 @@ def ymap_to_obj(ymap: CMapData):
     return ymap_obj
 
 
+@profiling.traced()
 def import_ymap(filepath):
     ymap_xml: CMapData = YMAP.from_xml_file(filepath)
     found = False
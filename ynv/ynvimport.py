@@ -1,12 +1,25 @@
-from ..tools.meshhelper import create_box
+from ..tools.meshhelper import create_box, create_mesh_from_arrays
 from szio.gta5.cwxml import (
     YNV,
 )
 from ..sollumz_properties import SOLLUMZ_UI_NAMES, SollumType
+from ..sollumz_preferences import get_import_settings
 import os
 import bpy
+import numpy as np
+from numpy.typing import NDArray
 from ..tools.blenderhelper import find_bsdf_and_material_output
 
+NAVMESH_BOX_SIZE = 0.5
+
+# Corners and faces of the boxes used to display points and portals in bulk imported navmeshes
+_BOX_CORNERS = np.array(
+    [[x, y, z] for x in (-1.0, 1.0) for y in (-1.0, 1.0) for z in (-1.0, 1.0)], dtype=np.float32
+) * (NAVMESH_BOX_SIZE * 0.5)
+_BOX_FACES = np.array(
+    [[0, 1, 3, 2], [4, 6, 7, 5], [0, 4, 5, 1], [2, 3, 7, 6], [0, 2, 6, 4], [1, 5, 7, 3]], dtype=np.int32
+)
+
 
 def points_to_obj(points):
     pobj = bpy.data.objects.new("Points", None)
@@ -20,7 +33,7 @@ def points_to_obj(points):
         obj.parent = pobj
 
         # properties
-        create_box(mesh, 0.5)
+        create_box(mesh, NAVMESH_BOX_SIZE)
         obj.location = point.position
         obj.rotation_euler = (0, 0, point.angle)
         bpy.context.collection.objects.link(obj)
@@ -34,11 +47,11 @@ def portals_to_obj(portals):
 
     for idx, portal in enumerate(portals):
         frommesh = bpy.data.meshes.new("from")
-        create_box(frommesh, 0.5)
+        create_box(frommesh, NAVMESH_BOX_SIZE)
         fromobj = bpy.data.objects.new("from", frommesh)
         fromobj.location = portal.position_from
         tomesh = bpy.data.meshes.new("to")
-        create_box(tomesh, 0.5)
+        create_box(tomesh, NAVMESH_BOX_SIZE)
         toobj = bpy.data.objects.new("to", tomesh)
         toobj.location = portal.position_to
         obj = bpy.data.objects.new(
@@ -111,42 +124,115 @@ def get_material(flags, material_cache):
 def polygons_to_obj(polygons):
     material_cache = {}
     mats = []
+    mat_index_by_flags = {}
+    face_mat_inds = np.empty(len(polygons), dtype=np.int32)
+    face_loop_starts = np.empty(len(polygons), dtype=np.int32)
     vertices = {}
     verts = []
-    indices = []
-    face = []
-    for poly in polygons:
-        mats.append(get_material(poly.flags, material_cache))
-        maxtcount = len(poly.vertices)
+    loop_vert_inds = []
+    for poly_idx, poly in enumerate(polygons):
+        mat_index = mat_index_by_flags.get(poly.flags, None)
+        if mat_index is None:
+            # Ensure materials are unique in the mesh
+            mat_index = len(mats)
+            mat_index_by_flags[poly.flags] = mat_index
+            mats.append(get_material(poly.flags, material_cache))
+        face_mat_inds[poly_idx] = mat_index
+
+        face_loop_starts[poly_idx] = len(loop_vert_inds)
         for vert in poly.vertices:
             vertex = id(vert)
-            if vertex in vertices:
-                idx = vertices[vertex]
-            else:
-                idx = len(vertices)
+            idx = vertices.get(vertex, None)
+            if idx is None:
+                idx = len(verts)
                 vertices[vertex] = idx
                 verts.append(vert)
-            face.append(idx)
-            if len(face) == maxtcount:
-                indices.append(face)
-                face = []
+            loop_vert_inds.append(idx)
 
     mesh = bpy.data.meshes.new(SOLLUMZ_UI_NAMES[SollumType.NAVMESH_POLY_MESH])
-    mesh.from_pydata(verts, [], indices)
+    for mat in mats:
+        mesh.materials.append(mat)
+
+    create_mesh_from_arrays(
+        mesh,
+        np.array(verts, dtype=np.float32).reshape((-1, 3)),
+        np.array(loop_vert_inds, dtype=np.int32),
+        face_loop_starts,
+        face_mat_inds,
+    )
+
     obj = bpy.data.objects.new(
         SOLLUMZ_UI_NAMES[SollumType.NAVMESH_POLY_MESH], mesh)
     obj.sollum_type = SollumType.NAVMESH_POLY_MESH
 
-    # Ensure materials are unique in the mesh
-    used_materials = []
-    for mat in mats:
-        if mat not in used_materials:
-            mesh.materials.append(mat)
-            used_materials.append(mat)
+    return obj
+
+
+def boxes_to_mesh(mesh: bpy.types.Mesh, centers: NDArray[np.float32], angles: NDArray[np.float32]) -> bpy.types.Mesh:
+    """Fill the mesh with a box for each center, rotated around the Z axis by the corresponding angle."""
+    num_boxes = len(centers)
+
+    cos, sin = np.cos(angles)[:, np.newaxis], np.sin(angles)[:, np.newaxis]
+    corners_x, corners_y, corners_z = _BOX_CORNERS[:, 0], _BOX_CORNERS[:, 1], _BOX_CORNERS[:, 2]
+    verts = np.empty((num_boxes, len(_BOX_CORNERS), 3), dtype=np.float32)
+    verts[:, :, 0] = corners_x * cos - corners_y * sin
+    verts[:, :, 1] = corners_x * sin + corners_y * cos
+    verts[:, :, 2] = corners_z
+    verts += centers[:, np.newaxis, :]
+
+    box_vert_offsets = np.arange(num_boxes, dtype=np.int32) * len(_BOX_CORNERS)
+    loop_vert_inds = _BOX_FACES[np.newaxis, :, :] + box_vert_offsets[:, np.newaxis, np.newaxis]
+    face_loop_starts = np.arange(num_boxes * len(_BOX_FACES), dtype=np.int32) * _BOX_FACES.shape[1]
 
-    for idx, poly in enumerate(mesh.polygons):
-        poly.material_index = used_materials.index(mats[idx])
+    return create_mesh_from_arrays(mesh, verts.reshape((-1, 3)), loop_vert_inds.ravel(), face_loop_starts)
 
+
+def add_box_face_attr(mesh: bpy.types.Mesh, name: str, attr_type: str, values: NDArray):
+    """Add a face attribute with one value per box, repeated on all faces of the box."""
+    attr = mesh.attributes.new(name, attr_type, "FACE")
+    attr.data.foreach_set("value", np.repeat(values, len(_BOX_FACES)))
+
+
+def points_to_mesh_obj(points):
+    """Create a single mesh object with a box for each navmesh point. The point type and angle are stored as face
+    attributes."""
+    positions = np.array([point.position for point in points], dtype=np.float32).reshape((-1, 3))
+    angles = np.array([point.angle for point in points], dtype=np.float32)
+    types = np.array([point.type for point in points], dtype=np.int32)
+
+    mesh = bpy.data.meshes.new(SOLLUMZ_UI_NAMES[SollumType.NAVMESH_POINT])
+    boxes_to_mesh(mesh, positions, angles)
+    add_box_face_attr(mesh, "navmesh_type", "INT", types)
+    add_box_face_attr(mesh, "navmesh_angle", "FLOAT", angles)
+
+    obj = bpy.data.objects.new("Points", mesh)
+    obj.sollum_type = SollumType.NAVMESH_POINT
+    bpy.context.collection.objects.link(obj)
+    return obj
+
+
+def portals_to_mesh_obj(portals):
+    """Create a single mesh object with a pair of boxes, 'from' and 'to', for each navmesh portal. The portal type,
+    angle and polygon of each end are stored as face attributes, along with whether the box is the 'to' end of the
+    portal."""
+    num_portals = len(portals)
+    positions_from = np.array([portal.position_from for portal in portals], dtype=np.float32).reshape((-1, 3))
+    positions_to = np.array([portal.position_to for portal in portals], dtype=np.float32).reshape((-1, 3))
+    positions = np.stack((positions_from, positions_to), axis=1)
+    angles = np.array([portal.angle for portal in portals], dtype=np.float32)
+    types = np.array([portal.type for portal in portals], dtype=np.int32)
+    polys = np.array([(portal.poly_from, portal.poly_to) for portal in portals], dtype=np.int32).reshape((-1, 2))
+
+    mesh = bpy.data.meshes.new(SOLLUMZ_UI_NAMES[SollumType.NAVMESH_PORTAL])
+    boxes_to_mesh(mesh, positions.reshape((-1, 3)), np.repeat(angles, 2))
+    add_box_face_attr(mesh, "navmesh_type", "INT", np.repeat(types, 2))
+    add_box_face_attr(mesh, "navmesh_angle", "FLOAT", np.repeat(angles, 2))
+    add_box_face_attr(mesh, "navmesh_poly", "INT", polys.ravel())
+    add_box_face_attr(mesh, "navmesh_portal_to", "BOOLEAN", np.tile([False, True], num_portals))
+
+    obj = bpy.data.objects.new("Portals", mesh)
+    obj.sollum_type = SollumType.NAVMESH_PORTAL
+    bpy.context.collection.objects.link(obj)
     return obj
 
 
@@ -161,6 +247,15 @@ def navmesh_to_obj(navmesh, filepath):
     nmobj.parent = nobj
     bpy.context.collection.objects.link(nmobj)
 
+    if get_import_settings().ynv_bulk_import:
+        # Single mesh object for all points and another for all portals, instead of an object per point/portal
+        npobj = portals_to_mesh_obj(navmesh.portals)
+        npobj.parent = nobj
+
+        npobj = points_to_mesh_obj(navmesh.points)
+        npobj.parent = nobj
+        return
+
     npobj = portals_to_obj(navmesh.portals)
     npobj.parent = nobj
     bpy.context.collection.objects.link(npobj)
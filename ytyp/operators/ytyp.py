@@ -12,9 +12,7 @@ from ...sollumz_helper import SOLLUMZ_OT_base, has_embedded_textures, has_collis
 from ...sollumz_properties import SOLLUMZ_UI_NAMES, ArchetypeType, AssetType, SollumType
 from ...sollumz_operators import SelectTimeFlagsRangeMultiSelect, ClearTimeFlagsMultiSelect, ImportAssetsOperatorImpl
 from ...sollumz_preferences import get_export_settings, get_addon_preferences, ExportSettingsBase
-from ...ydr.cloth_env import cloth_env_find_mesh_objects
 from ..utils import get_selected_ytyp, get_selected_archetype
-from ..ytypimport import import_ytyp
 from ..ytypexport import selected_ytyp_to_xml
 from ...shared.multiselection import (
     MultiSelectOneOperator,
@@ -274,6 +272,8 @@ class SOLLUMZ_OT_create_archetype_from_selected(SOLLUMZ_OT_base, bpy.types.Opera
         return get_selected_ytyp(context) is not None
 
     def run(self, context):
+        from ...ydr.cloth_env import cloth_env_find_mesh_objects
+
         selected_ytyp = get_selected_ytyp(context)
         selected_objs = {root for o in context.selected_objects if (root := self._find_root(o))}
         found = False
@@ -443,6 +443,8 @@ class SOLLUMZ_OT_import_ytyp(SOLLUMZ_OT_base, bpy.types.Operator, ImportHelper):
         pass
 
     def run(self, context):
+        from ..ytypimport import import_ytyp
+
         try:
             import_ytyp(self.filepath)
             self.message(f"Successfully imported: {self.filepath}")
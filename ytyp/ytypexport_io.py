@@ -37,6 +37,7 @@ from .properties.ytyp import (
     TimecycleModifierProperties,
 )
 from .properties.extensions import ExtensionType, ExtensionProperties, EXTENSION_TYPE_TO_DEF_CLASS
+from .. import profiling
 
 
 def export_ytyp(scene: Scene, ytyp_index: int) -> ExportBundle:
@@ -48,6 +49,7 @@ def export_ytyp(scene: Scene, ytyp_index: int) -> ExportBundle:
     return export_context().make_bundle(map_types)
 
 
+@profiling.traced()
 def create_map_types_asset(
     map_types: CMapTypesProperties,
 ) -> Optional[AssetMapTypes]:
@@ -57,6 +59,7 @@ def create_map_types_asset(
     return t
 
 
+@profiling.traced()
 def create_archetype(archetype: ArchetypeProperties) -> Archetype:
     """Create archetype asset from an archetype data block"""
     match archetype.type:
@@ -17,8 +17,10 @@ from ..sollumz_helper import duplicate_object_with_children
 from .properties.ytyp import CMapTypesProperties, ArchetypeProperties, SpecialAttribute, TimecycleModifierProperties, RoomProperties, PortalProperties, MloEntityProperties, EntitySetProperties
 from .properties.extensions import ExtensionProperties, ExtensionType, ExtensionsContainer, EXTENSION_DEF_CLASS_TO_TYPE
 from szio.gta5 import LightFlashiness
+from .. import profiling
 
 
+@profiling.traced()
 def import_ytyp(asset: AssetMapTypes, name: str):
     """Create a ytyp data-block in the Blender scene given a ytyp asset."""
     ytyp: CMapTypesProperties = bpy.context.scene.ytyps.add()
@@ -29,6 +31,7 @@ def import_ytyp(asset: AssetMapTypes, name: str):
         create_archetype(arch, ytyp)
 
 
+@profiling.traced()
 def create_archetype(archetype: Archetype, ytyp: CMapTypesProperties) -> ArchetypeProperties:
     """Create a ytyp archetype given an archetype definition and a Blender ytyp data-block."""
     a = ytyp.new_archetype()